@@ -8,16 +8,11 @@ A comprehensive financial modeling tool for pottery studio owners.
 
 import streamlit as st
 
-# Page configuration
-st.set_page_config(
-    page_title="Pottery Studio Simulator",
-    page_icon="🏺",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+from ui.components import configure_page
 
 def main():
     """Main application entry point"""
+    configure_page("Pottery Studio Simulator", "🏺", initial_sidebar_state="expanded")
 
     st.title("🏺 Pottery Studio Financial Simulator")
 
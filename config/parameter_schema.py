@@ -6,34 +6,115 @@ Parameter Schema Foundation - Use this as the template for parameter_schema.py
 This is the architectural blueprint. ChatGPT will use this to convert all 150 parameters.
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Optional, List, Dict, Union, Callable
-from enum import Enum
-
-
-class ParameterTier(Enum):
+import functools
+import hashlib
+import json
+import math
+import sys
+import types
+from collections import deque
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Optional, List, Dict, Union, Callable, Mapping
+from enum import IntEnum
+from pathlib import Path
+from types import MappingProxyType
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # same results from the stdlib parser, just slower
+    _json_loads = json.loads
+
+
+# Bump whenever parameters are added, removed, renamed or change meaning, so
+# caches and saved scenarios keyed on the old schema are invalidated.
+SCHEMA_VERSION = "1"
+
+# Parameter.validate() result codes
+VALID = 0
+ERR_TYPE = 1
+ERR_MIN = 2
+ERR_MAX = 3
+ERR_OPT = 4
+ERR_BOOL = 5
+ERR_JSON = 6
+ERR_SHAPE = 7
+
+
+class ParameterTier(IntEnum):
     """
     Parameter importance tiers for progressive disclosure UI.
     
     ESSENTIAL: 8-12 params always visible (rent, price, capacity, loan terms)
     IMPORTANT: 15-20 params in collapsed sections (revenue toggles, member mix)
     ADVANCED: 120+ params hidden by default (fine-tuning, elasticity, etc.)
+    
+    Ordered by importance, so "tier <= ParameterTier.IMPORTANT" selects the
+    first two tiers.
     """
-    ESSENTIAL = "essential"
-    IMPORTANT = "important"
-    ADVANCED = "advanced"
+    ESSENTIAL = 0
+    IMPORTANT = 1
+    ADVANCED = 2
 
 
-class ParameterType(Enum):
+class ParameterType(IntEnum):
     """Parameter data types for widget rendering and validation"""
-    FLOAT = "float"
-    INT = "int"
-    BOOL = "bool"
-    SELECT = "select"
-    TEXT = "text"
+    FLOAT = 0
+    INT = 1
+    BOOL = 2
+    SELECT = 3
+    TEXT = 4
+    JSON = 5  # text holding a JSON value, e.g. a range "[8, 10, 12]"
+
+
+@dataclass(slots=True, frozen=True)
+class ParameterDocs:
+    """
+    Explanatory text for a parameter.
+    
+    Kept apart from Parameter so the validation and widget paths don't carry
+    several hundred bytes of prose per parameter. Loaded lazily from
+    parameter_docs.json (keyed by parameter name) on first access.
+    
+    Attributes:
+        help: Tooltip/help text explaining the parameter
+        why_it_matters: Extended educational content for "expert explains" mode
+        typical_range: Guidance on typical values
+        example: Concrete example to illustrate usage
+    """
+    help: str = ""
+    why_it_matters: str = ""
+    typical_range: str = ""
+    example: str = ""
+
+
+_DOCS_PATH = Path(__file__).with_name("parameter_docs.json")
+_NO_DOCS = ParameterDocs()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_docs() -> Dict[str, ParameterDocs]:
+    raw = _json_loads(_DOCS_PATH.read_bytes())
+    return {name: ParameterDocs(**row) for name, row in raw.items()}
+
+
+def get_docs(name: str) -> ParameterDocs:
+    """
+    Get the explanatory text for a parameter.
+    
+    Args:
+        name: Parameter name (e.g., "RENT")
+        
+    Returns:
+        ParameterDocs (empty if the parameter has no docs entry)
+        
+    Example:
+        >>> print(get_docs("RENT").typical_range)
+        Urban: $4000-8000/mo, Suburban: $2500-4500/mo, Rural: $1500-3000/mo
+    """
+    return _load_docs().get(name, _NO_DOCS)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Parameter:
     """
     Complete parameter specification - single source of truth.
@@ -46,16 +127,15 @@ class Parameter:
         type: Data type for validation and widget selection
         default: Default value (must match type)
         
-        # UI Display
-        label: Human-readable label for UI
-        help: Tooltip/help text explaining the parameter
-        tier: UI visibility tier (essential/important/advanced)
-        group: Logical grouping (e.g., "business_fundamentals", "pricing")
-        
         # Validation
         min: Minimum allowed value (for numeric types)
         max: Maximum allowed value (for numeric types)
         step: Step size for sliders
+        
+        # UI Display
+        tier: UI visibility tier (essential/important/advanced)
+        group: Logical grouping (e.g., "business_fundamentals", "pricing")
+        label: Human-readable label for UI
         options: Valid choices (for SELECT type)
         
         # Relationships
@@ -63,11 +143,13 @@ class Parameter:
         affects: What this parameter influences (for impact indicators)
         
         # Advanced
+        visible_when_spec: Declarative visibility rule, {config_key: required_value};
+            preferred over visible_when because the keys it reads are known
         visible_when: Function to determine if param should show (context-aware hiding)
         presets: Named preset values (e.g., "conservative": 0.03, "aggressive": 0.08)
-        why_it_matters: Extended educational content for "expert explains" mode
-        typical_range: Guidance on typical values
-        example: Concrete example to illustrate usage
+    
+    Help text and the other explanatory prose live in ParameterDocs, reached
+    through the docs property (help is kept as a shortcut).
     """
     
     # Core attributes (REQUIRED)
@@ -75,245 +157,650 @@ class Parameter:
     type: ParameterType
     default: Any
     
-    # UI attributes
-    label: str = ""
-    help: str = ""
-    tier: ParameterTier = ParameterTier.ADVANCED
-    group: str = ""
-    
     # Validation attributes
     min: Optional[float] = None
     max: Optional[float] = None
     step: Optional[float] = None
-    options: Optional[List[str]] = None
     
-    # Relationship tracking
-    depends_on: List[str] = field(default_factory=list)
-    affects: List[str] = field(default_factory=list)
+    # UI attributes
+    tier: ParameterTier = ParameterTier.ADVANCED
+    group: str = ""
+    label: str = ""
+    
+    # SELECT choices (kept after label so catalog rows stay positional)
+    options: tuple[str, ...] = ()
+    
+    # Relationship tracking. Immutable: the empty tuple default is shared by
+    # every row, so extend with p._replace(affects=(*p.affects, x))
+    depends_on: tuple[str, ...] = ()
+    affects: tuple[str, ...] = ()
     
     # Advanced features
     visible_when: Optional[Callable[[Dict[str, Any]], bool]] = None
-    presets: Optional[Dict[str, Any]] = None
-    why_it_matters: str = ""
-    typical_range: str = ""
-    example: str = ""
+    visible_when_spec: Optional[Dict[str, Any]] = field(default=None, hash=False)
+    presets: Optional[Dict[str, Any]] = field(default=None, hash=False)
+    
+    # Derived in __post_init__ (not part of the constructor, repr or equality)
+    _type_tag: int = field(init=False, repr=False, compare=False)
+    _validator: Callable[[Any], int] = field(init=False, repr=False, compare=False)
+    _option_index: Dict[Any, int] = field(init=False, repr=False, compare=False)
+    parsed_default: Any = field(init=False, repr=False, compare=False)  # JSON type only
+    
+    # Derived on first use; None until then
+    _err_msgs: Optional[Dict[int, str]] = field(init=False, repr=False, compare=False)
+    _help_text: Optional[str] = field(init=False, repr=False, compare=False)
+    _widget_key_default: Optional[str] = field(init=False, repr=False, compare=False)
+    _slider_kwargs: Optional[Dict[str, Any]] = field(init=False, repr=False, compare=False)
     
-    def validate(self, value: Any) -> tuple[bool, Optional[str]]:
+    def __post_init__(self):
+        # type/min/max/options/label never change after construction, so
+        # everything the validate path needs is derived once here. State only
+        # a widget needs is built on first render, so parameters that are
+        # only ever validated or simulated never pay for it.
+        
+        # Both are IntEnums, so a tier passed as type (or vice versa) would
+        # otherwise be accepted silently as the wrong kind of parameter
+        if type(self.type) is not ParameterType:
+            raise TypeError(f"{self.name}: type must be a ParameterType, got {self.type!r}")
+        if type(self.tier) is not ParameterTier:
+            raise TypeError(f"{self.name}: tier must be a ParameterTier, got {self.tier!r}")
+        
+        # Accept lists from callers but store tuples
+        for name in ("options", "depends_on", "affects"):
+            value = getattr(self, name)
+            if value is None:
+                object.__setattr__(self, name, ())
+            elif type(value) is not tuple:
+                object.__setattr__(self, name, tuple(value))
+        
+        # Groups are compared and used as index keys; interning makes every
+        # parameter in a group share one string even when built at runtime.
+        # Names are interned too, so config lookups with a string literal
+        # (which Python interns) match the catalog key by identity
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "group", sys.intern(self.group))
+        
+        type_tag = int(self.type)
+        object.__setattr__(self, "_type_tag", type_tag)
+        
+        # Option -> position, for O(1) membership checks and selectbox index
+        if type_tag == _SELECT:
+            object.__setattr__(self, "_option_index", {opt: i for i, opt in enumerate(self.options)})
+        
+        # Validator returning an int code
+        object.__setattr__(self, "_validator", _VALIDATOR_BUILDERS[type_tag](self))
+        
+        # JSON defaults are parsed here once; the text stays in default for
+        # the UI round trip
+        object.__setattr__(
+            self, "parsed_default", parse_json_value(self.default) if type_tag == _JSON else None
+        )
+        
+        for name in ("_err_msgs", "_help_text", "_widget_key_default", "_slider_kwargs"):
+            object.__setattr__(self, name, None)
+
+    def __reduce__(self):
+        # The derived validator is a generated function and can't be pickled,
+        # so pickle the constructor arguments and re-derive on load
+        return (type(self), tuple(getattr(self, f.name) for f in fields(self) if f.init))
+    
+    def _replace(self, **changes) -> "Parameter":
         """
-        Validate a value against this parameter's constraints.
+        Copy with some fields changed (NamedTuple-style API).
         
-        Returns:
-            (is_valid, error_message)
-            - (True, None) if valid
-            - (False, "error description") if invalid
+        Goes through the constructor, so derived state such as the validator
+        is rebuilt for the new values. Parameters are immutable, so a call
+        that changes nothing returns this same instance instead of a copy.
+        
+        Example:
+            >>> get_parameter("RENT")._replace(max=20000).validate(18000)
+            0
         """
-        # Type checking and range validation
-        if self.type == ParameterType.FLOAT:
-            try:
-                value = float(value)
-            except (ValueError, TypeError):
-                return False, f"{self.label} must be a number"
-            
-            if self.min is not None and value < self.min:
-                return False, f"{self.label} must be >= {self.min}"
-            if self.max is not None and value > self.max:
-                return False, f"{self.label} must be <= {self.max}"
+        init_fields = self.__dataclass_fields__
+        # Same type as well as equal: a tier is == the type with the same number
+        if all(
+            name in init_fields and init_fields[name].init
+            and type(getattr(self, name)) is type(value) and getattr(self, name) == value
+            for name, value in changes.items()
+        ):
+            return self
+        return replace(self, **changes)
+    
+    def _asdict(self) -> Dict[str, Any]:
+        """Constructor fields as a dict, in field order (NamedTuple-style API)."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
+    @property
+    def docs(self) -> ParameterDocs:
+        """Explanatory text for this parameter (loaded on first access)."""
+        return get_docs(self.name)
+    
+    @property
+    def help(self) -> str:
+        """Tooltip/help text explaining the parameter."""
+        return get_docs(self.name).help
+    
+    @property
+    def help_text(self) -> str:
+        """Widget tooltip: help text plus the valid range, built on first use."""
+        text = self._help_text
+        if text is None:
+            text = self.help
+            if self.min is not None and self.max is not None:
+                text += f" (Range: {self.min}-{self.max})"
+            object.__setattr__(self, "_help_text", text)
+        return text
+    
+    @property
+    def widget_key(self) -> str:
+        """Default st.session_state key of this parameter's widget, built on first use."""
+        key = self._widget_key_default
+        if key is None:
+            key = f"param_{self.name}"
+            object.__setattr__(self, "_widget_key_default", key)
+        return key
+    
+    def _get_slider_kwargs(self) -> Dict[str, Any]:
+        # Slider bounds, cast once on first render; only the current value
+        # varies per rerun
+        kwargs = self._slider_kwargs
+        if kwargs is None:
+            if self._type_tag == _INT:
+                kwargs = {
+                    "min_value": int(self.min) if self.min is not None else 0,
+                    "max_value": int(self.max) if self.max is not None else 1000,
+                    "step": int(self.step) if self.step is not None else 1,
+                }
+            else:
+                kwargs = {
+                    "min_value": float(self.min) if self.min is not None else 0.0,
+                    "max_value": float(self.max) if self.max is not None else 1.0,
+                    "step": float(self.step) if self.step is not None else 0.01,
+                }
+            object.__setattr__(self, "_slider_kwargs", kwargs)
+        return kwargs
+    
+    def error_message(self, code: int) -> str:
+        """
+        Human-readable message for a non-zero code returned by validate().
         
-        elif self.type == ParameterType.INT:
-            try:
-                value = int(value)
-            except (ValueError, TypeError):
-                return False, f"{self.label} must be an integer"
+        Args:
+            code: One of the ERR_* result codes
             
-            if self.min is not None and value < self.min:
-                return False, f"{self.label} must be >= {self.min}"
-            if self.max is not None and value > self.max:
-                return False, f"{self.label} must be <= {self.max}"
-        
-        elif self.type == ParameterType.SELECT:
-            if self.options and value not in self.options:
-                return False, f"{self.label} must be one of: {', '.join(self.options)}"
+        Returns:
+            Error message naming this parameter
+        """
+        messages = self._err_msgs
+        if messages is None:
+            messages = _MESSAGE_BUILDERS[self._type_tag](self)
+            object.__setattr__(self, "_err_msgs", messages)
+        return messages[code]
+    
+    def validate(self, value: Any) -> int:
+        """
+        Validate a value against this parameter's constraints.
         
-        elif self.type == ParameterType.BOOL:
-            if not isinstance(value, bool):
-                return False, f"{self.label} must be True or False"
+        Returns:
+            VALID (0) if valid, otherwise one of ERR_TYPE, ERR_MIN, ERR_MAX,
+            ERR_OPT, ERR_BOOL, ERR_JSON, ERR_SHAPE. Use validate_with_message() for the
+            (is_valid, error_message) form.
+        """
+        return self._validator(value)
+    
+    def is_visible(self, config: Dict[str, Any]) -> bool:
+        """
+        Whether this parameter should be shown for the given config.
         
-        return True, None
+        visible_when_spec is checked first (keys missing from config use
+        their default); the visible_when callable is the fallback for rules
+        that can't be expressed declaratively.
+        """
+        if self.visible_when_spec is not None:
+            for key, required in self.visible_when_spec.items():
+                if config.get(key, _DEFAULTS.get(key)) != required:
+                    return False
+            return True
+        if self.visible_when is not None:
+            return bool(self.visible_when(config))
+        return True
     
-    def to_streamlit_widget(self, current_value: Any = None, key: str = None):
+    def to_streamlit_widget(
+        self,
+        current_value: Any = None,
+        key: str = None,
+        on_change: Optional[Callable] = None,
+        args: Optional[tuple] = None,
+    ):
         """
         Generate appropriate Streamlit widget for this parameter.
         
         Args:
             current_value: Current parameter value (uses default if None)
             key: Unique widget key for Streamlit
+            on_change: Optional Streamlit on_change callback
+            args: Positional args passed to on_change
             
         Returns:
             New value from widget
         """
-        import streamlit as st
-        
         if current_value is None:
             current_value = self.default
         
         if key is None:
-            key = f"param_{self.name}"
-        
-        # Build help text
-        help_text = self.help
-        if self.min is not None and self.max is not None:
-            help_text += f" (Range: {self.min}-{self.max})"
-        
-        # Render appropriate widget
-        if self.type == ParameterType.BOOL:
-            return st.checkbox(
-                self.label,
-                value=bool(current_value),
-                help=help_text,
-                key=key
-            )
-        
-        elif self.type == ParameterType.INT:
-            return st.slider(
-                self.label,
-                min_value=int(self.min) if self.min is not None else 0,
-                max_value=int(self.max) if self.max is not None else 1000,
-                value=int(current_value),
-                step=int(self.step) if self.step is not None else 1,
-                help=help_text,
-                key=key
-            )
+            key = self.widget_key
         
-        elif self.type == ParameterType.FLOAT:
-            return st.slider(
-                self.label,
-                min_value=float(self.min) if self.min is not None else 0.0,
-                max_value=float(self.max) if self.max is not None else 1.0,
-                value=float(current_value),
-                step=float(self.step) if self.step is not None else 0.01,
-                help=help_text,
-                key=key
-            )
+        return _WIDGETS[self._type_tag](self, current_value, key, on_change, args)
+
+
+# =============================================================================
+# TYPE DISPATCH
+# =============================================================================
+# Each ParameterType's int value is stored as a plain int tag at construction;
+# validator building and widget rendering index tables by that tag instead of
+# walking an if/elif chain of type comparisons.
+
+_FLOAT, _INT, _BOOL, _SELECT, _TEXT, _JSON = map(int, ParameterType)
+
+
+# =============================================================================
+# PRECOMPILED VALIDATORS
+# =============================================================================
+# Parameter.__post_init__ binds one of these to each parameter's constraints;
+# numeric validators are generated code with the bounds bound as defaults.
+# Validators return an int code; the matching error messages are formatted
+# once at bind time and only looked up when a value is invalid.
+
+@functools.lru_cache(maxsize=None)
+def _number_validator_template(has_min: bool, has_max: bool):
+    """
+    Generate the straight-line source for a numeric validator shape.
+    
+    Checks for an absent min/max are left out of the generated code entirely
+    rather than tested at call time. Only four shapes exist, so each is
+    compiled once and shared.
+    """
+    lines = [
+        "def _v(value, _convert=None, _min=None, _max=None):",
+        "    try:",
+        "        value = _convert(value)",
+        "    except (ValueError, TypeError):",
+        f"        return {ERR_TYPE}",
+    ]
+    if has_min:
+        lines += ["    if value < _min:", f"        return {ERR_MIN}"]
+    if has_max:
+        lines += ["    if value > _max:", f"        return {ERR_MAX}"]
+    lines.append(f"    return {VALID}")
+    
+    namespace = {}
+    exec(compile("\n".join(lines), "<number validator>", "exec"), namespace)
+    return namespace["_v"]
+
+
+def _compile_number_validator(name: str, convert, min_value, max_value):
+    """Bind a numeric validator template to one parameter's converter and bounds."""
+    template = _number_validator_template(min_value is not None, max_value is not None)
+    return types.FunctionType(
+        template.__code__,
+        template.__globals__,
+        f"validate_{name}",
+        (convert, min_value, max_value),
+    )
+
+
+def _validate_select(value, option_index):
+    try:
+        valid = value in option_index
+    except TypeError:  # unhashable value can't be an option
+        valid = False
+    return VALID if valid else ERR_OPT
+
+
+def _validate_bool(value):
+    return VALID if isinstance(value, bool) else ERR_BOOL
+
+
+@functools.lru_cache(maxsize=64)
+def parse_json_value(text: str) -> Any:
+    """
+    Parse the text of a JSON-typed parameter, with JSON arrays as tuples.
+    
+    Cached, so a config value that is reused across runs is parsed once.
+    Tuples keep the shared cached result immutable.
+    
+    Args:
+        text: JSON text, e.g. "[4.5, 7.5]"
         
-        elif self.type == ParameterType.SELECT:
-            options = self.options or []
-            try:
-                index = options.index(current_value) if current_value in options else 0
-            except (ValueError, TypeError):
-                index = 0
-            
-            return st.selectbox(
-                self.label,
-                options=options,
-                index=index,
-                help=help_text,
-                key=key
-            )
+    Returns:
+        Parsed value
         
-        elif self.type == ParameterType.TEXT:
-            return st.text_input(
-                self.label,
-                value=str(current_value),
-                help=help_text,
-                key=key
-            )
+    Raises:
+        ValueError: If text isn't valid JSON
         
-        return current_value
+    Example:
+        >>> parse_json_value("[8, 10, 12]")
+        (8, 10, 12)
+    """
+    value = _json_loads(text)
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _validate_json(value):
+    try:
+        parse_json_value(value)
+    except (ValueError, TypeError):
+        return ERR_JSON
+    return VALID
+
+
+# Shape of the JSON parameters the simulation unpacks: name -> (min length,
+# max length or None, description for the error message). Each must be a
+# list of finite numbers.
+_JSON_NUMBER_LISTS = {
+    "EVENT_MUG_COST_RANGE": (2, 2, "a [low, high] pair of numbers"),
+    "ATTENDEES_PER_EVENT_RANGE": (1, None, "a non-empty list of numbers"),
+}
+
+
+def _validate_number_list(value, min_len, max_len):
+    try:
+        parsed = parse_json_value(value)
+    except (ValueError, TypeError):
+        return ERR_JSON
+    if not isinstance(parsed, tuple) or len(parsed) < min_len:
+        return ERR_SHAPE
+    if max_len is not None and len(parsed) > max_len:
+        return ERR_SHAPE
+    for item in parsed:
+        # bool is an int subclass, but true/false isn't a count or a price
+        if type(item) not in (int, float) or not math.isfinite(item):
+            return ERR_SHAPE
+    return VALID
+
+
+def _always_valid(value):
+    return VALID
+
+
+def _float_validator(param: Parameter):
+    return _compile_number_validator(param.name, float, param.min, param.max)
+
+
+def _int_validator(param: Parameter):
+    return _compile_number_validator(param.name, int, param.min, param.max)
+
+
+def _select_validator(param: Parameter):
+    if not param.options:
+        return _always_valid
+    option_index = param._option_index
+    return lambda value: _validate_select(value, option_index)
+
+
+def _bool_validator(param: Parameter):
+    return _validate_bool
+
+
+def _text_validator(param: Parameter):
+    return _always_valid
+
+
+def _json_validator(param: Parameter):
+    shape = _JSON_NUMBER_LISTS.get(param.name)
+    if shape is None:
+        return _validate_json
+    min_len, max_len, _ = shape
+    return lambda value: _validate_number_list(value, min_len, max_len)
+
+
+_VALIDATOR_BUILDERS = {
+    _FLOAT: _float_validator,
+    _INT: _int_validator,
+    _BOOL: _bool_validator,
+    _SELECT: _select_validator,
+    _TEXT: _text_validator,
+    _JSON: _json_validator,
+}
+
+
+# Error messages per type, built on a parameter's first failed validation
+
+def _number_messages(param: Parameter, type_msg: str) -> Dict[int, str]:
+    return {
+        ERR_TYPE: type_msg,
+        ERR_MIN: f"{param.label} must be >= {param.min}",
+        ERR_MAX: f"{param.label} must be <= {param.max}",
+    }
+
+
+def _float_messages(param: Parameter) -> Dict[int, str]:
+    return _number_messages(param, f"{param.label} must be a number")
+
+
+def _int_messages(param: Parameter) -> Dict[int, str]:
+    return _number_messages(param, f"{param.label} must be an integer")
+
+
+def _select_messages(param: Parameter) -> Dict[int, str]:
+    return {ERR_OPT: f"{param.label} must be one of: {', '.join(param.options)}"}
+
+
+def _bool_messages(param: Parameter) -> Dict[int, str]:
+    return {ERR_BOOL: f"{param.label} must be True or False"}
+
+
+def _text_messages(param: Parameter) -> Dict[int, str]:
+    return {}
+
+
+def _json_messages(param: Parameter) -> Dict[int, str]:
+    messages = {ERR_JSON: f"{param.label} must be valid JSON"}
+    shape = _JSON_NUMBER_LISTS.get(param.name)
+    if shape is not None:
+        messages[ERR_SHAPE] = f"{param.label} must be {shape[2]}"
+    return messages
+
+
+_MESSAGE_BUILDERS = {
+    _FLOAT: _float_messages,
+    _INT: _int_messages,
+    _BOOL: _bool_messages,
+    _SELECT: _select_messages,
+    _TEXT: _text_messages,
+    _JSON: _json_messages,
+}
 
 
 # =============================================================================
-# USAGE EXAMPLES (for ChatGPT to follow)
+# STREAMLIT WIDGETS
 # =============================================================================
+# Streamlit is imported on first render rather than with this module: it takes
+# far longer to import than the whole catalog, and tests, batch runs and the
+# simulation only need the schema.
+
+_st = None
+
+
+def _streamlit():
+    # Imported once, then served from the module global on every render
+    global _st
+    if _st is None:
+        import streamlit
+        _st = streamlit
+    return _st
+
+
+def _checkbox_widget(param: Parameter, current_value, key, on_change, args):
+    return _streamlit().checkbox(
+        param.label,
+        value=bool(current_value),
+        help=param.help_text,
+        key=key,
+        on_change=on_change,
+        args=args
+    )
+
+
+def _int_slider_widget(param: Parameter, current_value, key, on_change, args):
+    return _streamlit().slider(
+        param.label,
+        value=int(current_value),
+        help=param.help_text,
+        key=key,
+        on_change=on_change,
+        args=args,
+        **param._get_slider_kwargs()
+    )
+
+
+def _float_slider_widget(param: Parameter, current_value, key, on_change, args):
+    return _streamlit().slider(
+        param.label,
+        value=float(current_value),
+        help=param.help_text,
+        key=key,
+        on_change=on_change,
+        args=args,
+        **param._get_slider_kwargs()
+    )
+
+
+def _selectbox_widget(param: Parameter, current_value, key, on_change, args):
+    try:
+        index = param._option_index.get(current_value, 0)
+    except TypeError:
+        index = 0
+    
+    return _streamlit().selectbox(
+        param.label,
+        options=param.options,
+        index=index,
+        help=param.help_text,
+        key=key,
+        on_change=on_change,
+        args=args
+    )
+
+
+def _text_input_widget(param: Parameter, current_value, key, on_change, args):
+    return _streamlit().text_input(
+        param.label,
+        value=str(current_value),
+        help=param.help_text,
+        key=key,
+        on_change=on_change,
+        args=args
+    )
+
+
+_WIDGETS = {
+    _FLOAT: _float_slider_widget,
+    _INT: _int_slider_widget,
+    _BOOL: _checkbox_widget,
+    _SELECT: _selectbox_widget,
+    _TEXT: _text_input_widget,
+    _JSON: _text_input_widget,
+}
 
-# Example 1: Essential parameter (always visible)
-EXAMPLE_ESSENTIAL = Parameter(
-    name="RENT",
-    type=ParameterType.FLOAT,
-    default=3500,
-    min=1000,
-    max=15000,
-    step=100,
-    tier=ParameterTier.ESSENTIAL,
-    group="business_fundamentals",
-    label="Monthly Base Rent ($)",
-    help="Fixed monthly rent payment for studio space. Directly impacts fixed costs and loan sizing.",
-    affects=["loan_7a_size", "cash_flow", "breakeven"],
-    why_it_matters="Rent is typically your largest fixed cost. It affects your breakeven point, loan sizing (7a loan needs to cover several months of rent), and overall profitability. Most studios spend 20-30% of revenue on rent.",
-    typical_range="Urban: $4000-8000/mo, Suburban: $2500-4500/mo, Rural: $1500-3000/mo",
-    example="A 2000 sqft studio in suburban area might pay $3500/month ($1.75/sqft)"
-)
 
-# Example 2: Important parameter with presets
-EXAMPLE_IMPORTANT = Parameter(
-    name="HOBBYIST_PROB",
-    type=ParameterType.FLOAT,
-    default=0.35,
-    min=0.0,
-    max=1.0,
-    step=0.05,
-    tier=ParameterTier.IMPORTANT,
-    group="member_behavior",
-    label="Hobbyist Mix (%)",
-    help="Fraction of members who are casual hobbyists. Must sum to 1.0 with other archetypes.",
-    depends_on=["COMMITTED_ARTIST_PROB", "PRODUCTION_POTTER_PROB", "SEASONAL_USER_PROB"],
-    affects=["revenue_per_member", "churn_rate", "capacity_utilization"],
-    presets={
-        "community_studio": 0.35,
-        "beginner_friendly": 0.50,
-        "professional": 0.15
-    },
-    why_it_matters="Hobbyists are casual users who visit 1x/week, use moderate clay, and have higher churn (4-5%/month). They're important for filling capacity but generate less revenue per member than committed artists.",
-    typical_range="Community studios: 30-40%, Beginner-focused: 40-60%, Professional: 10-20%"
-)
+# =============================================================================
+# USAGE EXAMPLES (for ChatGPT to follow)
+# =============================================================================
 
-# Example 3: Advanced parameter with conditional visibility
-EXAMPLE_ADVANCED = Parameter(
-    name="NO_ACCESS_POOL",
-    type=ParameterType.INT,
-    default=20,
-    min=0,
-    max=1000,
-    step=10,
-    tier=ParameterTier.ADVANCED,
-    group="market_dynamics",
-    label="No-Access Market Pool Size",
-    help="People in your market with no current pottery access. Most motivated to join.",
-    visible_when=lambda config: config.get("MEMBERSHIP_MODE") == "calculated",
-    why_it_matters="This pool represents your highest-intent prospects - people who want to do pottery but have no access. They convert at the highest rate but are also the smallest pool. Size depends on local population and existing studio density.",
-    typical_range="Urban with no other studios: 50-100, Suburban: 20-50, Saturated market: 5-20"
-)
+@functools.lru_cache(maxsize=1)
+def get_examples() -> Dict[str, Parameter]:
+    """
+    Build the reference example parameters (built on first call, then cached).
+    
+    These are templates for authoring new parameters, not part of PARAMETERS,
+    so they aren't constructed at import.
+    
+    Returns:
+        Dictionary with keys "essential", "important", "advanced", "bool", "select"
+    """
+    # Example 1: Essential parameter (always visible)
+    essential = Parameter(
+        name="RENT",
+        type=ParameterType.FLOAT,
+        default=3500,
+        min=1000,
+        max=15000,
+        step=100,
+        tier=ParameterTier.ESSENTIAL,
+        group="business_fundamentals",
+        label="Monthly Base Rent ($)",
+        affects=("loan_7a_size", "cash_flow", "breakeven"),
+    )
 
-# Example 4: Boolean toggle
-EXAMPLE_BOOL = Parameter(
-    name="WORKSHOPS_ENABLED",
-    type=ParameterType.BOOL,
-    default=True,
-    tier=ParameterTier.IMPORTANT,
-    group="workshops",
-    label="Enable Workshop Revenue Stream",
-    help="Whether studio offers short pottery workshops for beginners.",
-    affects=["revenue", "member_acquisition"],
-    why_it_matters="Workshops are a key revenue stream and member acquisition funnel. They typically have 40-60% margins and 10-15% of participants convert to members.",
-    example="A 2-hour workshop for 10 people at $75/person = $750 revenue, ~$250 costs = $500 profit"
-)
+    # Example 2: Important parameter with presets
+    important = Parameter(
+        name="HOBBYIST_PROB",
+        type=ParameterType.FLOAT,
+        default=0.35,
+        min=0.0,
+        max=1.0,
+        step=0.05,
+        tier=ParameterTier.IMPORTANT,
+        group="member_behavior",
+        label="Hobbyist Mix (%)",
+        depends_on=("COMMITTED_ARTIST_PROB", "PRODUCTION_POTTER_PROB", "SEASONAL_USER_PROB"),
+        affects=("revenue_per_member", "churn_rate", "capacity_utilization"),
+        presets={
+            "community_studio": 0.35,
+            "beginner_friendly": 0.50,
+            "professional": 0.15
+        },
+    )
+
+    # Example 3: Advanced parameter with conditional visibility
+    advanced = Parameter(
+        name="NO_ACCESS_POOL",
+        type=ParameterType.INT,
+        default=20,
+        min=0,
+        max=1000,
+        step=10,
+        tier=ParameterTier.ADVANCED,
+        group="market_dynamics",
+        label="No-Access Market Pool Size",
+        visible_when_spec={"MEMBERSHIP_MODE": "calculated"},
+    )
+
+    # Example 4: Boolean toggle
+    bool_ = Parameter(
+        name="WORKSHOPS_ENABLED",
+        type=ParameterType.BOOL,
+        default=True,
+        tier=ParameterTier.IMPORTANT,
+        group="workshops",
+        label="Enable Workshop Revenue Stream",
+        affects=("revenue", "member_acquisition"),
+    )
 
-# Example 5: Select dropdown
-EXAMPLE_SELECT = Parameter(
-    name="LOAN_504_TERM_YEARS",
-    type=ParameterType.SELECT,
-    default="20",
-    options=["5", "7", "10", "15", "20", "25"],
-    tier=ParameterTier.ESSENTIAL,
-    group="financing",
-    label="SBA 504 Loan Term (years)",
-    help="Loan term for equipment/build-out financing. Longer terms = lower monthly payment.",
-    affects=["monthly_debt_service", "total_interest"],
-    presets={
-        "aggressive": "10",
-        "standard": "20",
-        "conservative": "25"
+    # Example 5: Select dropdown
+    select = Parameter(
+        name="LOAN_504_TERM_YEARS",
+        type=ParameterType.SELECT,
+        default="20",
+        options=("5", "7", "10", "15", "20", "25"),
+        tier=ParameterTier.ESSENTIAL,
+        group="financing",
+        label="SBA 504 Loan Term (years)",
+        affects=("monthly_debt_service", "total_interest"),
+        presets={
+            "aggressive": "10",
+            "standard": "20",
+            "conservative": "25"
+        }
+    )
+    
+    return {
+        "essential": essential,
+        "important": important,
+        "advanced": advanced,
+        "bool": bool_,
+        "select": select,
     }
-)
 
 
 # =============================================================================
@@ -334,34 +821,37 @@ OLD FORMAT:
     "group": "business_fundamentals"
 }
 
-NEW FORMAT:
-"RENT": Parameter(
-    name="RENT",
-    type=ParameterType.FLOAT,
-    default=3500,
-    min=1000,
-    max=15000,
-    step=100,
-    tier=ParameterTier.ESSENTIAL,  # <-- ASSIGN BASED ON IMPORTANCE
-    group="business_fundamentals",
-    label="Monthly Base Rent ($)",
-    help="Fixed monthly rent payment...",  # <-- "desc" becomes "help"
-    affects=["loan_7a_size", "cash_flow"],  # <-- ADD RELATIONSHIPS
-    why_it_matters="...",  # <-- ADD EDUCATIONAL CONTENT
-    typical_range="..."    # <-- ADD GUIDANCE
-)
+NEW FORMAT (one row in parameters.json, in Parameter field order):
+["RENT", "float", 3500, 1000, 15000, 100,
+ "essential",  # <-- ASSIGN TIER BASED ON IMPORTANCE
+ "business_fundamentals", "Monthly Base Rent ($)"]
+
+SELECT rows append the options list; non-numeric rows use null for
+min/max/step. Anything beyond options (depends_on, affects, presets,
+visible_when_spec) goes in an optional trailing object, passed to
+Parameter(...) by keyword:
+["WORKSHOP_FEE", "float", 75.0, 20.0, 150.0, 5.0, "advanced", "workshops",
+ "Workshop Fee per Person ($)", {"visible_when_spec": {"WORKSHOPS_ENABLED": true}}]
+
+parameter_docs.json:
+"RENT": {
+    "help": "Fixed monthly rent payment...",  # <-- "desc" becomes "help"
+    "why_it_matters": "...",  # <-- ADD EDUCATIONAL CONTENT
+    "typical_range": "..."    # <-- ADD GUIDANCE
+}
 
 MAPPING RULES:
-1. "type": "float" â†’ type=ParameterType.FLOAT
-2. "type": "int" â†’ type=ParameterType.INT
-3. "type": "bool" â†’ type=ParameterType.BOOL
-4. "type": "select" â†’ type=ParameterType.SELECT
-5. "type": "text" â†’ type=ParameterType.TEXT
-6. "desc" â†’ help
-7. Add name= explicitly
-8. Assign tier= based on this guide (below)
-9. Add affects=[] (can be empty for now)
-10. Add why_it_matters="" (can be empty for now)
+1. "type": "float" â†’ "float" (ParameterType.FLOAT)
+2. "type": "int" â†’ "int" (ParameterType.INT)
+3. "type": "bool" â†’ "bool" (ParameterType.BOOL)
+4. "type": "select" â†’ "select" (ParameterType.SELECT)
+5. "type": "text" â†’ "text" (ParameterType.TEXT), or "json" (ParameterType.JSON)
+   when the text is a JSON value such as a range list
+6. "desc" â†’ "help" in parameter_docs.json
+7. Name comes first in the row (it is also the PARAMETERS key)
+8. Assign tier ("essential"/"important"/"advanced") using this guide (below)
+9. affects defaults to () - leave it out unless there are relationships
+10. Add "why_it_matters" to parameter_docs.json (can be omitted for now)
 
 TIER ASSIGNMENT GUIDE:
 
@@ -372,2464 +862,181 @@ ESSENTIAL (tier=ParameterTier.ESSENTIAL) - Only these 8-12:
 - OWNER_DRAW
 - LOAN_504_TERM_YEARS
 - LOAN_7A_TERM_YEARS
-- RUNWAY_MONTHS
-- MONTHS (simulation horizon)
-- N_SIMULATIONS
-
-IMPORTANT (tier=ParameterTier.IMPORTANT) - These ~20:
-- WORKSHOPS_ENABLED
-- CLASSES_ENABLED
-- EVENTS_ENABLED
-- DESIGNATED_STUDIOS_ENABLED
-- WHEELS_CAPACITY
-- HANDBUILDING_CAPACITY
-- GLAZE_CAPACITY
-- OPEN_HOURS_PER_WEEK
-- HOBBYIST_PROB
-- COMMITTED_ARTIST_PROB
-- PRODUCTION_POTTER_PROB
-- SEASONAL_USER_PROB
-- INSURANCE_COST
-- UTILITIES_BASE_COST
-- CLAY_PRICE_PER_BAG
-- FIRING_BASE_RATE
-- REFERENCE_PRICE
-- LOAN_504_ANNUAL_RATE
-- LOAN_7A_ANNUAL_RATE
-- IO_MONTHS_504
-- IO_MONTHS_7A
-
-ADVANCED (tier=ParameterTier.ADVANCED) - Everything else (~120+ parameters)
-- All churn rates by archetype
-- All session hours/frequencies
-- All clay usage ranges
-- All workshop details
-- All class details
-- All event details
-- All market dynamics
-- All seasonality
-- All economic factors
-- All elasticity
-- etc.
-"""
-
-PARAMETERS: Dict[str, Parameter] = {
-    "RENT": Parameter(
-        name="RENT",
-        type=ParameterType.FLOAT,
-        default=3500,
-        min=1000,
-        max=15000,
-        step=100,
-        tier=ParameterTier.ESSENTIAL,
-        group="business_fundamentals",
-        label="Monthly Base Rent ($)",
-        help="Fixed monthly rent payment for studio space. Directly impacts fixed costs and loan sizing calculations. Higher rent increases breakeven time and cash requirements.",
-        affects=[]
-    ),
-
-    "RENT_GROWTH_PCT": Parameter(
-        name="RENT_GROWTH_PCT",
-        type=ParameterType.FLOAT,
-        default=0.03,
-        min=0.0,
-        max=0.15,
-        step=0.005,
-        tier=ParameterTier.ADVANCED,
-        group="business_fundamentals",
-        label="Annual Rent Growth Rate",
-        help="Yearly rent escalation as a decimal (0.03 = 3%). Compounds annually and affects long-term cash flow projections. Many leases include 2-4% annual increases.",
-        affects=[]
-    ),
-
-    "OWNER_DRAW": Parameter(
-        name="OWNER_DRAW",
-        type=ParameterType.FLOAT,
-        default=2000,
-        min=0,
-        max=8000,
-        step=100,
-        tier=ParameterTier.ESSENTIAL,
-        group="business_fundamentals",
-        label="Owner Monthly Draw ($)",
-        help="Monthly cash withdrawal for owner living expenses. Reduces business cash flow and affects loan sizing. Set to 0 if owner takes no regular draw.",
-        affects=[]
-    ),
-
-    "OWNER_DRAW_START_MONTH": Parameter(
-        name="OWNER_DRAW_START_MONTH",
-        type=ParameterType.INT,
-        default=1,
-        min=1,
-        max=24,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="business_fundamentals",
-        label="Owner Draw Start Month",
-        help="Month when owner draw payments begin (1-based). Allows deferring owner compensation during startup phase to preserve cash.",
-        affects=[]
-    ),
-
-    "PRODUCTION_POTTER_SESSIONS_PER_WEEK": Parameter(
-        name="PRODUCTION_POTTER_SESSIONS_PER_WEEK",
-        type=ParameterType.FLOAT,
-        default=3.5,
-        min=0.1,
-        max=10.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="member_behavior",
-        label="Production Potter Sessions/Week",
-        help="Average studio sessions per week for production potter members. Highest usage, may constrain capacity for other members.",
-        affects=[]
-    ),
-
-    "SEASONAL_USER_SESSIONS_PER_WEEK": Parameter(
-        name="SEASONAL_USER_SESSIONS_PER_WEEK",
-        type=ParameterType.FLOAT,
-        default=0.75,
-        min=0.1,
-        max=5.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="member_behavior",
-        label="Seasonal User Sessions/Week",
-        help="Average studio sessions per week for seasonal user members. Lower usage reflects casual engagement level.",
-        affects=[]
-    ),
-
-    "HOBBYIST_SESSION_HOURS": Parameter(
-        name="HOBBYIST_SESSION_HOURS",
-        type=ParameterType.FLOAT,
-        default=1.7,
-        min=0.5,
-        max=8.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="member_behavior",
-        label="Hobbyist Hours/Session",
-        help="Average hours per studio session for hobbyist members. Shorter sessions allow more members to use equipment during peak times.",
-        affects=[]
-    ),
-
-    "COMMITTED_ARTIST_SESSION_HOURS": Parameter(
-        name="COMMITTED_ARTIST_SESSION_HOURS",
-        type=ParameterType.FLOAT,
-        default=2.75,
-        min=0.5,
-        max=8.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="member_behavior",
-        label="Committed Artist Hours/Session",
-        help="Average hours per studio session for committed artist members. Longer sessions reflect deeper engagement with projects.",
-        affects=[]
-    ),
-
-    "PRODUCTION_POTTER_SESSION_HOURS": Parameter(
-        name="PRODUCTION_POTTER_SESSION_HOURS",
-        type=ParameterType.FLOAT,
-        default=3.8,
-        min=0.5,
-        max=12.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="member_behavior",
-        label="Production Potter Hours/Session",
-        help="Average hours per studio session for production potter members. Longest sessions due to commercial production needs.",
-        affects=[]
-    ),
-
-    "SEASONAL_USER_SESSION_HOURS": Parameter(
-        name="SEASONAL_USER_SESSION_HOURS",
-        type=ParameterType.FLOAT,
-        default=2.0,
-        min=0.5,
-        max=8.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="member_behavior",
-        label="Seasonal User Hours/Session",
-        help="Average hours per studio session for seasonal user members. Moderate duration typical of casual engagement.",
-        affects=[]
-    ),
-
-    "MAX_MEMBERS": Parameter(
-        name="MAX_MEMBERS",
-        type=ParameterType.INT,
-        default=77,
-        min=20,
-        max=500,
-        step=5,
-        tier=ParameterTier.ESSENTIAL,
-        group="capacity",
-        label="Maximum Members (Hard Cap)",
-        help="Absolute maximum members the studio can accommodate. Based on physical space, storage, and operational constraints. Acts as hard limit on growth.",
-        affects=[]
-    ),
-
-    "OPEN_HOURS_PER_WEEK": Parameter(
-        name="OPEN_HOURS_PER_WEEK",
-        type=ParameterType.INT,
-        default=112,
-        min=20,
-        max=168,
-        step=4,
-        tier=ParameterTier.IMPORTANT,
-        group="capacity",
-        label="Studio Open Hours/Week",
-        help="Total weekly hours studio is accessible to members. Affects capacity calculations - more hours = more member capacity for same equipment.",
-        affects=[]
-    ),
-
-    "CAPACITY_DAMPING_BETA": Parameter(
-        name="CAPACITY_DAMPING_BETA",
-        type=ParameterType.FLOAT,
-        default=4.0,
-        min=1.0,
-        max=10.0,
-        step=0.5,
-        tier=ParameterTier.ADVANCED,
-        group="capacity",
-        label="Capacity Damping Factor",
-        help="Controls how crowding reduces new member joins. Higher values = sharper drop in joins as studio gets crowded. 4.0 means severe impact near capacity.",
-        affects=[]
-    ),
-
-    "UTILIZATION_CHURN_UPLIFT": Parameter(
-        name="UTILIZATION_CHURN_UPLIFT",
-        type=ParameterType.FLOAT,
-        default=0.25,
-        min=0.0,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="capacity",
-        label="Overcrowding Churn Multiplier",
-        help="Additional churn when studio is over capacity. 0.25 means 25% higher churn when 100% utilized. Models member frustration with crowding.",
-        affects=[]
-    ),
-
-    "WHEELS_CAPACITY": Parameter(
-        name="WHEELS_CAPACITY",
-        type=ParameterType.INT,
-        default=8,
-        min=2,
-        max=30,
-        step=1,
-        tier=ParameterTier.IMPORTANT,
-        group="capacity",
-        label="Pottery Wheels Count",
-        help="Number of pottery wheels available. Often the limiting factor for member capacity since wheels are used by all archetypes.",
-        affects=[]
-    ),
-
-    "HANDBUILDING_CAPACITY": Parameter(
-        name="HANDBUILDING_CAPACITY",
-        type=ParameterType.INT,
-        default=6,
-        min=2,
-        max=50,
-        step=1,
-        tier=ParameterTier.IMPORTANT,
-        group="capacity",
-        label="Handbuilding Stations Count",
-        help="Number of handbuilding workstations. Used for sculpture, handbuilding, and surface decoration work.",
-        affects=[]
-    ),
-
-    "GLAZE_CAPACITY": Parameter(
-        name="GLAZE_CAPACITY",
-        type=ParameterType.INT,
-        default=6,
-        min=2,
-        max=20,
-        step=1,
-        tier=ParameterTier.IMPORTANT,
-        group="capacity",
-        label="Glazing Workstations Count",
-        help="Number of glazing workstations. Bottleneck station in many studios since all fired work needs glazing.",
-        affects=[]
-    ),
-
-    "WHEELS_ALPHA": Parameter(
-        name="WHEELS_ALPHA",
-        type=ParameterType.FLOAT,
-        default=0.80,
-        min=0.1,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="capacity",
-        label="Wheels Utilization Efficiency",
-        help="Fraction of wheel capacity actually usable (accounting for maintenance, setup time, etc.). 0.80 = 80% effective utilization.",
-        affects=[]
-    ),
-
-    "HANDBUILDING_ALPHA": Parameter(
-        name="HANDBUILDING_ALPHA",
-        type=ParameterType.FLOAT,
-        default=0.50,
-        min=0.1,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="capacity",
-        label="Handbuilding Utilization Efficiency",
-        help="Fraction of handbuilding capacity actually usable. Lower than wheels due to variable project sizes and cleanup time.",
-        affects=[]
-    ),
-
-    "GLAZE_ALPHA": Parameter(
-        name="GLAZE_ALPHA",
-        type=ParameterType.FLOAT,
-        default=0.55,
-        min=0.1,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="capacity",
-        label="Glazing Utilization Efficiency",
-        help="Fraction of glazing capacity actually usable. Accounts for drying time, glaze prep, and safety procedures.",
-        affects=[]
-    ),
-    "OWNER_DRAW_END_MONTH": Parameter(
-        name="OWNER_DRAW_END_MONTH",
-        type=ParameterType.INT,
-        default=12,
-        min=1,
-        max=60,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="business_fundamentals",
-        label="Owner Draw End Month (None=60)",
-        help="Last month of owner draw payments. Enter 60 for unlimited. Useful for modeling temporary owner sacrifice during startup.",
-        affects=[]
-    ),
-
-    "OWNER_STIPEND_MONTHS": Parameter(
-        name="OWNER_STIPEND_MONTHS",
-        type=ParameterType.INT,
-        default=12,
-        min=0,
-        max=60,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="business_fundamentals",
-        label="Owner Stipend Duration (months)",
-        help="Total months of owner draw to reserve in cash planning. Even if draw window is longer, only this many months are included in loan sizing.",
-        affects=[]
-    ),
-
-    "PRICE": Parameter(
-        name="PRICE",
-        type=ParameterType.FLOAT,
-        default=175,
-        min=80,
-        max=400,
-        step=5,
-        tier=ParameterTier.ESSENTIAL,
-        group="pricing",
-        label="Monthly Membership Price ($)",
-        help="Base monthly membership fee charged to all new members. Affects both revenue and member acquisition/retention through price elasticity effects.",
-        affects=[]
-    ),
-
-    "REFERENCE_PRICE": Parameter(
-        name="REFERENCE_PRICE",
-        type=ParameterType.FLOAT,
-        default=165,
-        min=80,
-        max=400,
-        step=5,
-        tier=ParameterTier.IMPORTANT,
-        group="pricing",
-        label="Market Reference Price ($)",
-        help="Competitive baseline price for elasticity calculations. If your price is above this, expect lower join rates and higher churn. Use local market research to set this.",
-        affects=[]
-    ),
-
-    "JOIN_PRICE_ELASTICITY": Parameter(
-        name="JOIN_PRICE_ELASTICITY",
-        type=ParameterType.FLOAT,
-        default=-0.6,
-        min=-3.0,
-        max=0.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="pricing",
-        label="Join Price Elasticity",
-        help="How sensitive potential members are to pricing. -0.6 means 10% price increase reduces joins by 6%. More negative = more price sensitive market.",
-        affects=[]
-    ),
-
-    "CHURN_PRICE_ELASTICITY": Parameter(
-        name="CHURN_PRICE_ELASTICITY",
-        type=ParameterType.FLOAT,
-        default=0.3,
-        min=0.0,
-        max=2.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="pricing",
-        label="Churn Price Elasticity",
-        help="How pricing affects member retention. 0.3 means 10% price increase increases churn by 3%. Higher values = more price-sensitive retention.",
-        affects=[]
-    ),
-
-    "HOBBYIST_PROB": Parameter(
-        name="HOBBYIST_PROB",
-        type=ParameterType.FLOAT,
-        default=0.35,
-        min=0.0,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.IMPORTANT,
-        group="member_behavior",
-        label="Hobbyist Mix %",
-        help="Fraction of new members who are hobbyists. Casual users with lower usage and higher churn. Affects revenue per member and capacity utilization.",
-        affects=[]
-    ),
-
-    "COMMITTED_ARTIST_PROB": Parameter(
-        name="COMMITTED_ARTIST_PROB",
-        type=ParameterType.FLOAT,
-        default=0.40,
-        min=0.0,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.IMPORTANT,
-        group="member_behavior",
-        label="Committed Artist Mix %",
-        help="Fraction of new members who are committed artists. Regular users with moderate usage and churn. Core revenue base for most studios.",
-        affects=[]
-    ),
-
-    "PRODUCTION_POTTER_PROB": Parameter(
-        name="PRODUCTION_POTTER_PROB",
-        type=ParameterType.FLOAT,
-        default=0.10,
-        min=0.0,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.IMPORTANT,
-        group="member_behavior",
-        label="Production Potter Mix %",
-        help="Fraction of new members who are production potters. Heavy users with low churn but high capacity consumption. Valuable but space-intensive.",
-        affects=[]
-    ),
-
-    "SEASONAL_USER_PROB": Parameter(
-        name="SEASONAL_USER_PROB",
-        type=ParameterType.FLOAT,
-        default=0.15,
-        min=0.0,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.IMPORTANT,
-        group="member_behavior",
-        label="Seasonal User Mix %",
-        help="Fraction of new members who are seasonal users. Irregular usage with very high churn. Often driven by gift memberships or temporary interest.",
-        affects=[]
-    ),
-
-    "ARCHETYPE_CHURN_HOBBYIST": Parameter(
-        name="ARCHETYPE_CHURN_HOBBYIST",
-        type=ParameterType.FLOAT,
-        default=0.049 * 0.95,
-        min=0.01,
-        max=0.30,
-        step=0.005,
-        tier=ParameterTier.ADVANCED,
-        group="member_behavior",
-        label="Hobbyist Monthly Churn Rate",
-        help="Base monthly churn probability for hobbyist members. Modified by tenure, pricing, and economic conditions. Typical range 3-8% monthly.",
-        affects=[]
-    ),
-
-    "ARCHETYPE_CHURN_COMMITTED_ARTIST": Parameter(
-        name="ARCHETYPE_CHURN_COMMITTED_ARTIST",
-        type=ParameterType.FLOAT,
-        default=0.049 * 0.80,
-        min=0.01,
-        max=0.30,
-        step=0.005,
-        tier=ParameterTier.ADVANCED,
-        group="member_behavior",
-        label="Committed Artist Monthly Churn Rate",
-        help="Base monthly churn probability for committed artist members. Generally lower than hobbyists due to higher engagement.",
-        affects=[]
-    ),
-
-    "ARCHETYPE_CHURN_PRODUCTION_POTTER": Parameter(
-        name="ARCHETYPE_CHURN_PRODUCTION_POTTER",
-        type=ParameterType.FLOAT,
-        default=0.049 * 0.65,
-        min=0.01,
-        max=0.30,
-        step=0.005,
-        tier=ParameterTier.ADVANCED,
-        group="member_behavior",
-        label="Production Potter Monthly Churn Rate",
-        help="Base monthly churn probability for production potter members. Lowest churn due to business dependency on studio access.",
-        affects=[]
-    ),
-
-    "ARCHETYPE_CHURN_SEASONAL_USER": Parameter(
-        name="ARCHETYPE_CHURN_SEASONAL_USER",
-        type=ParameterType.FLOAT,
-        default=0.049 * 1.90,
-        min=0.01,
-        max=0.50,
-        step=0.005,
-        tier=ParameterTier.ADVANCED,
-        group="member_behavior",
-        label="Seasonal User Monthly Churn Rate",
-        help="Base monthly churn probability for seasonal user members. Highest churn due to temporary or gift-based engagement.",
-        affects=[]
-    ),
-
-    "HOBBYIST_SESSIONS_PER_WEEK": Parameter(
-        name="HOBBYIST_SESSIONS_PER_WEEK",
-        type=ParameterType.FLOAT,
-        default=1.0,
-        min=0.1,
-        max=5.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="member_behavior",
-        label="Hobbyist Sessions/Week",
-        help="Average studio sessions per week for hobbyist members. Affects capacity utilization calculations and revenue from add-on services.",
-        affects=[]
-    ),
-
-    "COMMITTED_ARTIST_SESSIONS_PER_WEEK": Parameter(
-        name="COMMITTED_ARTIST_SESSIONS_PER_WEEK",
-        type=ParameterType.FLOAT,
-        default=1.5,
-        min=0.1,
-        max=5.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="member_behavior",
-        label="Committed Artist Sessions/Week",
-        help="Average studio sessions per week for committed artist members. Higher usage drives more clay sales and firing fees.",
-        affects=[]
-    ),
-
-    "NO_ACCESS_POOL": Parameter(
-        name="NO_ACCESS_POOL",
-        type=ParameterType.INT,
-        default=20,
-        min=0,
-        max=1000,
-        step=10,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="No-Access Market Pool Size",
-        help="People in your market who have no current pottery access. Most motivated to join but need discovery. Size depends on local population.",
-        affects=[]
-    ),
-
-    "HOME_POOL": Parameter(
-        name="HOME_POOL",
-        type=ParameterType.INT,
-        default=50,
-        min=0,
-        max=1000,
-        step=10,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Home Studio Market Pool Size",
-        help="People with home pottery setups. Less motivated to join due to existing access. May join for community, equipment, or firing access.",
-        affects=[]
-    ),
-
-    "COMMUNITY_POOL": Parameter(
-        name="COMMUNITY_POOL",
-        type=ParameterType.INT,
-        default=70,
-        min=0,
-        max=1000,
-        step=10,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Community Studio Market Pool Size",
-        help="People currently using other community studios. May switch if you offer better value/location/community. Existing pottery experience.",
-        affects=[]
-    ),
-
-    "NO_ACCESS_INFLOW": Parameter(
-        name="NO_ACCESS_INFLOW",
-        type=ParameterType.INT,
-        default=3,
-        min=0,
-        max=50,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="No-Access Monthly Inflow",
-        help="New people entering the no-access pool each month (moved to area, developed interest, etc.). Sustains long-term member acquisition.",
-        affects=[]
-    ),
-
-    "HOME_INFLOW": Parameter(
-        name="HOME_INFLOW",
-        type=ParameterType.INT,
-        default=2,
-        min=0,
-        max=50,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Home Studio Monthly Inflow",
-        help="People setting up home studios monthly. May eventually seek community/professional equipment. Usually pottery enthusiasts.",
-        affects=[]
-    ),
-
-    "COMMUNITY_INFLOW": Parameter(
-        name="COMMUNITY_INFLOW",
-        type=ParameterType.INT,
-        default=4,
-        min=0,
-        max=50,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Community Studio Monthly Inflow",
-        help="People joining other studios monthly. Potential switchers if dissatisfied with current studio. Higher intent but harder to reach.",
-        affects=[]
-    ),
-
-    "BASELINE_RATE_NO_ACCESS": Parameter(
-        name="BASELINE_RATE_NO_ACCESS",
-        type=ParameterType.FLOAT,
-        default=0.040,
-        min=0.0,
-        max=0.2,
-        step=0.005,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="No-Access Monthly Join Rate",
-        help="Base probability that a no-access person joins per month. Modified by marketing, pricing, capacity, and economic factors.",
-        affects=[]
-    ),
-
-    "BASELINE_RATE_HOME": Parameter(
-        name="BASELINE_RATE_HOME",
-        type=ParameterType.FLOAT,
-        default=0.010,
-        min=0.0,
-        max=0.1,
-        step=0.005,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Home Studio Monthly Join Rate",
-        help="Base probability that a home studio person joins per month. Lower due to existing access, but may join for community/equipment.",
-        affects=[]
-    ),
-
-    "BASELINE_RATE_COMMUNITY": Parameter(
-        name="BASELINE_RATE_COMMUNITY",
-        type=ParameterType.FLOAT,
-        default=0.100,
-        min=0.0,
-        max=0.3,
-        step=0.005,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Community Studio Monthly Join Rate",
-        help="Base probability that a person at another studio switches per month. Higher due to existing pottery commitment and switching motivations.",
-        affects=[]
-    ),
-
-    "WOM_Q": Parameter(
-        name="WOM_Q",
-        type=ParameterType.FLOAT,
-        default=0.60,
-        min=0.0,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Word-of-Mouth Amplification Factor",
-        help="How much word-of-mouth boosts join rates. 0.6 with 60 members near saturation doubles join rates. Higher = stronger community effect.",
-        affects=[]
-    ),
-
-    "WOM_SATURATION": Parameter(
-        name="WOM_SATURATION",
-        type=ParameterType.INT,
-        default=60,
-        min=20,
-        max=200,
-        step=5,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Word-of-Mouth Saturation Point",
-        help="Member count where WOM effect peaks. Beyond this, additional members provide diminishing word-of-mouth returns. Market size dependent.",
-        affects=[]
-    ),
-
-    "REFERRAL_RATE_PER_MEMBER": Parameter(
-        name="REFERRAL_RATE_PER_MEMBER",
-        type=ParameterType.FLOAT,
-        default=0.06,
-        min=0.0,
-        max=0.3,
-        step=0.01,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Monthly Referral Rate per Member",
-        help="Probability each member generates a referral per month. 0.06 = 6% chance per member monthly. Drives organic growth through direct recommendations.",
-        affects=[]
-    ),
-
-    "REFERRAL_CONV": Parameter(
-        name="REFERRAL_CONV",
-        type=ParameterType.FLOAT,
-        default=0.22,
-        min=0.0,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Referral Conversion Rate",
-        help="Probability that a referral becomes a member. Higher than cold prospects due to friend recommendation and fit pre-screening.",
-        affects=[]
-    ),
-
-    "AWARENESS_RAMP_MONTHS": Parameter(
-        name="AWARENESS_RAMP_MONTHS",
-        type=ParameterType.INT,
-        default=4,
-        min=1,
-        max=24,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Awareness Ramp Duration (months)",
-        help="Months to reach full market awareness. Longer ramp = slower initial growth but models realistic awareness building in new markets.",
-        affects=[]
-    ),
-
-    "AWARENESS_RAMP_START_MULT": Parameter(
-        name="AWARENESS_RAMP_START_MULT",
-        type=ParameterType.FLOAT,
-        default=0.5,
-        min=0.1,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Starting Awareness Level",
-        help="Market awareness at launch as fraction of eventual level. 0.5 = 50% awareness at start, ramping to 100% over ramp period.",
-        affects=[]
-    ),
-
-    "AWARENESS_RAMP_END_MULT": Parameter(
-        name="AWARENESS_RAMP_END_MULT",
-        type=ParameterType.FLOAT,
-        default=1.0,
-        min=0.5,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Peak Awareness Level",
-        help="Maximum market awareness as multiplier. 1.0 = normal market penetration, >1.0 = exceptional awareness (strong marketing/PR).",
-        affects=[]
-    ),
-
-    "ADOPTION_SIGMA": Parameter(
-        name="ADOPTION_SIGMA",
-        type=ParameterType.FLOAT,
-        default=0.20,
-        min=0.0,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Adoption Noise Factor",
-        help="Random variation in monthly adoption (lognormal sigma). 0.20 adds realistic month-to-month variation. Higher = more volatile growth.",
-        affects=[]
-    ),
-
-    "CLASS_TERM_MONTHS": Parameter(
-        name="CLASS_TERM_MONTHS",
-        type=ParameterType.INT,
-        default=3,
-        min=1,
-        max=12,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Class Term Length (months)",
-        help="How often community studio members can switch (class graduation cycles). 3 months = quarterly switching opportunities.",
-        affects=[]
-    ),
-
-    "CS_UNLOCK_FRACTION_PER_TERM": Parameter(
-        name="CS_UNLOCK_FRACTION_PER_TERM",
-        type=ParameterType.FLOAT,
-        default=0.25,
-        min=0.0,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="market_dynamics",
-        label="Community Studio Unlock Rate",
-        help="Fraction of remaining CS pool eligible to switch each term. 0.25 = 25% of remaining pool becomes available every term cycle.",
-        affects=[]
-    ),
-
-    "MAX_ONBOARDINGS_PER_MONTH": Parameter(
-        name="MAX_ONBOARDINGS_PER_MONTH",
-        type=ParameterType.INT,
-        default=10,
-        min=1,
-        max=100,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="operations",
-        label="Max New Members/Month",
-        help="Operational limit on monthly new member onboarding. Accounts for orientation capacity, key cutting, etc. None = unlimited.",
-        affects=[]
-    ),
-
-    "DOWNTURN_PROB_PER_MONTH": Parameter(
-        name="DOWNTURN_PROB_PER_MONTH",
-        type=ParameterType.FLOAT,
-        default=0.01,
-        min=0.0,
-        max=0.2,
-        step=0.005,
-        tier=ParameterTier.ADVANCED,
-        group="economy",
-        label="Monthly Downturn Probability",
-        help="Probability of an economic downturn event each month. Downturns temporarily reduce joins and may increase churn.",
-        affects=[]
-    ),
-
-    "DOWNTURN_JOIN_MULT": Parameter(
-        name="DOWNTURN_JOIN_MULT",
-        type=ParameterType.FLOAT,
-        default=0.65,
-        min=0.1,
-        max=1.5,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="economy",
-        label="Economic Stress Join Multiplier",
-        help="Join rate multiplier during economic stress months. 0.65 = 35% reduction in joins during downturns. <1.0 = people delay discretionary spending.",
-        affects=[]
-    ),
-
-    "DOWNTURN_CHURN_MULT": Parameter(
-        name="DOWNTURN_CHURN_MULT",
-        type=ParameterType.FLOAT,
-        default=1.0,
-        min=0.1,
-        max=3.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="economy",
-        label="Economic Stress Churn Multiplier",
-        help="Churn rate multiplier during economic stress months. 1.50 = 50% increase in churn during downturns. >1.0 = people cut discretionary spending.",
-        affects=[]
-    ),
-
-    "SEASONALITY_JAN": Parameter(
-        name="SEASONALITY_JAN",
-        type=ParameterType.FLOAT,
-        default=1.15,
-        min=0.2,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="seasonality",
-        label="January Seasonality Factor",
-        help="Join rate multiplier for January. Typically high due to 'new year' energy and hobby interest.",
-        affects=[]
-    ),
-
-    "SEASONALITY_FEB": Parameter(
-        name="SEASONALITY_FEB",
-        type=ParameterType.FLOAT,
-        default=1.05,
-        min=0.2,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="seasonality",
-        label="February Seasonality Factor",
-        help="Join rate multiplier for February. Usually steady, with some post-new-year energy remaining.",
-        affects=[]
-    ),
-
-    "SEASONALITY_MAR": Parameter(
-        name="SEASONALITY_MAR",
-        type=ParameterType.FLOAT,
-        default=1.10,
-        min=0.2,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="seasonality",
-        label="March Seasonality Factor",
-        help="Join rate multiplier for March. Often stronger due to improving weather and spring activity planning.",
-        affects=[]
-    ),
-
-    "SEASONALITY_APR": Parameter(
-        name="SEASONALITY_APR",
-        type=ParameterType.FLOAT,
-        default=1.08,
-        min=0.2,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="seasonality",
-        label="April Seasonality Factor",
-        help="Join rate multiplier for April. Spring increases hobby interest and recreational enrollment.",
-        affects=[]
-    ),
-
-    "SEASONALITY_MAY": Parameter(
-        name="SEASONALITY_MAY",
-        type=ParameterType.FLOAT,
-        default=0.95,
-        min=0.2,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="seasonality",
-        label="May Seasonality Factor",
-        help="Join rate multiplier for May. Often dips slightly as people shift to outdoor activities.",
-        affects=[]
-    ),
-
-    "SEASONALITY_JUN": Parameter(
-        name="SEASONALITY_JUN",
-        type=ParameterType.FLOAT,
-        default=0.85,
-        min=0.2,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="seasonality",
-        label="June Seasonality Factor",
-        help="Join rate multiplier for June. Summer drop-off begins as members travel or engage in outdoor hobbies.",
-        affects=[]
-    ),
-
-    "SEASONALITY_JUL": Parameter(
-        name="SEASONALITY_JUL",
-        type=ParameterType.FLOAT,
-        default=0.80,
-        min=0.2,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="seasonality",
-        label="July Seasonality Factor",
-        help="Join rate multiplier for July. Typically lowest joining month due to travel and outdoor activity preferences.",
-        affects=[]
-    ),
-
-    "SEASONALITY_AUG": Parameter(
-        name="SEASONALITY_AUG",
-        type=ParameterType.FLOAT,
-        default=0.90,
-        min=0.2,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="seasonality",
-        label="August Seasonality Factor",
-        help="Join rate multiplier for August. Slight rebound as people return from summer trips.",
-        affects=[]
-    ),
-
-    "SEASONALITY_SEP": Parameter(
-        name="SEASONALITY_SEP",
-        type=ParameterType.FLOAT,
-        default=1.20,
-        min=0.2,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="seasonality",
-        label="September Seasonality Factor",
-        help="Join rate multiplier for September. Strong back-to-routine effect and fall class enrollment.",
-        affects=[]
-    ),
-
-    "SEASONALITY_OCT": Parameter(
-        name="SEASONALITY_OCT",
-        type=ParameterType.FLOAT,
-        default=1.10,
-        min=0.2,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="seasonality",
-        label="October Seasonality Factor",
-        help="Join rate multiplier for October. Generally strong month for creative and indoor activities.",
-        affects=[]
-    ),
-
-    "SEASONALITY_NOV": Parameter(
-        name="SEASONALITY_NOV",
-        type=ParameterType.FLOAT,
-        default=0.98,
-        min=0.2,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="seasonality",
-        label="November Seasonality Factor",
-        help="Join rate multiplier for November. Slight slowing as holidays approach.",
-        affects=[]
-    ),
-
-    "SEASONALITY_DEC": Parameter(
-        name="SEASONALITY_DEC",
-        type=ParameterType.FLOAT,
-        default=0.75,
-        min=0.2,
-        max=2.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="seasonality",
-        label="December Seasonality Factor",
-        help="Join rate multiplier for December. Significant slowdown due to holidays and reduced discretionary time.",
-        affects=[]
-    ),
-
-    "RETAIL_CLAY_PRICE_PER_BAG": Parameter(
-        name="RETAIL_CLAY_PRICE_PER_BAG",
-        type=ParameterType.FLOAT,
-        default=25.0,
-        min=15.0,
-        max=50.0,
-        step=1.0,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Retail Clay Price ($/bag)",
-        help="Price charged to members per 25lb clay bag. Key add-on revenue stream. Typically marked up 40-60% over wholesale cost.",
-        affects=[]
-    ),
-
-    "WHOLESALE_CLAY_COST_PER_BAG": Parameter(
-        name="WHOLESALE_CLAY_COST_PER_BAG",
-        type=ParameterType.FLOAT,
-        default=16.75,
-        min=8.0,
-        max=30.0,
-        step=0.25,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Wholesale Clay Cost ($/bag)",
-        help="Cost of clay per 25lb bag from supplier. Direct cost of goods sold. Affects profit margin on clay sales to members.",
-        affects=[]
-    ),
-
-    "HOBBYIST_CLAY_LOW": Parameter(
-        name="HOBBYIST_CLAY_LOW",
-        type=ParameterType.FLOAT,
-        default=0.25,
-        min=0.1,
-        max=2.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Hobbyist Clay Usage - Low (bags/month)",
-        help="Minimum monthly clay consumption for hobbyist members. Part of triangular distribution modeling usage variation.",
-        affects=[]
-    ),
-
-    "HOBBYIST_CLAY_TYPICAL": Parameter(
-        name="HOBBYIST_CLAY_TYPICAL",
-        type=ParameterType.FLOAT,
-        default=0.5,
-        min=0.1,
-        max=3.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Hobbyist Clay Usage - Typical (bags/month)",
-        help="Most common monthly clay consumption for hobbyist members. Peak of triangular distribution.",
-        affects=[]
-    ),
-
-    "HOBBYIST_CLAY_HIGH": Parameter(
-        name="HOBBYIST_CLAY_HIGH",
-        type=ParameterType.FLOAT,
-        default=1.0,
-        min=0.5,
-        max=5.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Hobbyist Clay Usage - High (bags/month)",
-        help="Maximum monthly clay consumption for hobbyist members. Upper bound of triangular distribution.",
-        affects=[]
-    ),
-
-    "COMMITTED_ARTIST_CLAY_LOW": Parameter(
-        name="COMMITTED_ARTIST_CLAY_LOW",
-        type=ParameterType.FLOAT,
-        default=1.0,
-        min=0.5,
-        max=3.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Committed Artist Clay Usage - Low (bags/month)",
-        help="Minimum monthly clay consumption for committed artist members.",
-        affects=[]
-    ),
-
-    "COMMITTED_ARTIST_CLAY_TYPICAL": Parameter(
-        name="COMMITTED_ARTIST_CLAY_TYPICAL",
-        type=ParameterType.FLOAT,
-        default=1.5,
-        min=0.5,
-        max=4.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Committed Artist Clay Usage - Typical (bags/month)",
-        help="Most common monthly clay consumption for committed artist members.",
-        affects=[]
-    ),
-
-    "COMMITTED_ARTIST_CLAY_HIGH": Parameter(
-        name="COMMITTED_ARTIST_CLAY_HIGH",
-        type=ParameterType.FLOAT,
-        default=2.0,
-        min=1.0,
-        max=6.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Committed Artist Clay Usage - High (bags/month)",
-        help="Maximum monthly clay consumption for committed artist members.",
-        affects=[]
-    ),
-
-    "PRODUCTION_POTTER_CLAY_LOW": Parameter(
-        name="PRODUCTION_POTTER_CLAY_LOW",
-        type=ParameterType.FLOAT,
-        default=2.0,
-        min=1.0,
-        max=5.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Production Potter Clay Usage - Low (bags/month)",
-        help="Minimum monthly clay consumption for production potter members.",
-        affects=[]
-    ),
-
-    "PRODUCTION_POTTER_CLAY_TYPICAL": Parameter(
-        name="PRODUCTION_POTTER_CLAY_TYPICAL",
-        type=ParameterType.FLOAT,
-        default=2.5,
-        min=1.5,
-        max=6.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Production Potter Clay Usage - Typical (bags/month)",
-        help="Most common monthly clay consumption for production potter members.",
-        affects=[]
-    ),
-
-    "PRODUCTION_POTTER_CLAY_HIGH": Parameter(
-        name="PRODUCTION_POTTER_CLAY_HIGH",
-        type=ParameterType.FLOAT,
-        default=3.0,
-        min=2.0,
-        max=10.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Production Potter Clay Usage - High (bags/month)",
-        help="Maximum monthly clay consumption for production potter members.",
-        affects=[]
-    ),
-
-    "SEASONAL_USER_CLAY_LOW": Parameter(
-        name="SEASONAL_USER_CLAY_LOW",
-        type=ParameterType.FLOAT,
-        default=0.25,
-        min=0.1,
-        max=2.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Seasonal User Clay Usage - Low (bags/month)",
-        help="Minimum monthly clay consumption for seasonal user members.",
-        affects=[]
-    ),
-
-    "SEASONAL_USER_CLAY_TYPICAL": Parameter(
-        name="SEASONAL_USER_CLAY_TYPICAL",
-        type=ParameterType.FLOAT,
-        default=0.5,
-        min=0.1,
-        max=3.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Seasonal User Clay Usage - Typical (bags/month)",
-        help="Most common monthly clay consumption for seasonal user members.",
-        affects=[]
-    ),
-
-    "SEASONAL_USER_CLAY_HIGH": Parameter(
-        name="SEASONAL_USER_CLAY_HIGH",
-        type=ParameterType.FLOAT,
-        default=1.0,
-        min=0.5,
-        max=5.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="clay_firing_revenue",
-        label="Seasonal User Clay Usage - High (bags/month)",
-        help="Maximum monthly clay consumption for seasonal user members.",
-        affects=[]
-    ),
-
-    # =============================================================================
-    # REVENUE: WORKSHOPS
-    # =============================================================================
-    "WORKSHOPS_ENABLED": Parameter(
-        name="WORKSHOPS_ENABLED",
-        type=ParameterType.BOOL,
-        default=True,
-        tier=ParameterTier.IMPORTANT,
-        group="workshops",
-        label="Enable Workshop Revenue Stream",
-        help="Whether studio offers short pottery workshops for beginners. Key revenue and member acquisition channel for many studios.",
-        affects=[]
-    ),
-
-    "WORKSHOPS_PER_MONTH": Parameter(
-        name="WORKSHOPS_PER_MONTH",
-        type=ParameterType.FLOAT,
-        default=2.0,
-        min=0.0,
-        max=20.0,
-        step=0.5,
-        tier=ParameterTier.ADVANCED,
-        group="workshops",
-        label="Workshops per Month",
-        help="Average number of workshops offered monthly. More workshops = more revenue but requires instructor time and capacity.",
-        affects=[]
-    ),
-
-    "WORKSHOP_AVG_ATTENDANCE": Parameter(
-        name="WORKSHOP_AVG_ATTENDANCE",
-        type=ParameterType.INT,
-        default=10,
-        min=1,
-        max=30,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="workshops",
-        label="Average Workshop Attendance",
-        help="Typical number of participants per workshop. Limited by space and instructor capacity.",
-        affects=[]
-    ),
-
-    "WORKSHOP_FEE": Parameter(
-        name="WORKSHOP_FEE",
-        type=ParameterType.FLOAT,
-        default=75.0,
-        min=20.0,
-        max=150.0,
-        step=5.0,
-        tier=ParameterTier.ADVANCED,
-        group="workshops",
-        label="Workshop Fee per Person ($)",
-        help="Price charged per workshop participant. Key revenue driver - should cover materials, instructor time, and profit margin.",
-        affects=[]
-    ),
-
-    "WORKSHOP_COST_PER_EVENT": Parameter(
-        name="WORKSHOP_COST_PER_EVENT",
-        type=ParameterType.FLOAT,
-        default=50.0,
-        min=0.0,
-        max=500.0,
-        step=10.0,
-        tier=ParameterTier.ADVANCED,
-        group="workshops",
-        label="Workshop Variable Cost per Event ($)",
-        help="Direct costs per workshop: instructor pay, materials, cleanup. Subtracted from gross revenue to get net contribution.",
-        affects=[]
-    ),
-
-    "WORKSHOP_CONV_RATE": Parameter(
-        name="WORKSHOP_CONV_RATE",
-        type=ParameterType.FLOAT,
-        default=0.12,
-        min=0.0,
-        max=0.5,
-        step=0.01,
-        tier=ParameterTier.ADVANCED,
-        group="workshops",
-        label="Workshop to Member Conversion Rate",
-        help="Fraction of workshop participants who become members. Key metric - workshops as member acquisition funnel.",
-        affects=[]
-    ),
-
-    "WORKSHOP_CONV_LAG_MO": Parameter(
-        name="WORKSHOP_CONV_LAG_MO",
-        type=ParameterType.INT,
-        default=1,
-        min=0,
-        max=6,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="workshops",
-        label="Workshop Conversion Lag (months)",
-        help="Months between workshop participation and membership signup. Accounts for decision time and class schedules.",
-        affects=[]
-    ),
-
-    # =============================================================================
-    # REVENUE: CLASSES
-    # =============================================================================
-    "CLASSES_ENABLED": Parameter(
-        name="CLASSES_ENABLED",
-        type=ParameterType.BOOL,
-        default=True,
-        tier=ParameterTier.IMPORTANT,
-        group="classes",
-        label="Enable Class Revenue Stream",
-        help="Whether studio offers multi-week pottery courses. Higher revenue per participant but requires structured curriculum.",
-        affects=[]
-    ),
-
-    "CLASSES_CALENDAR_MODE": Parameter(
-        name="CLASSES_CALENDAR_MODE",
-        type=ParameterType.SELECT,
-        default="semester",
-        options=["monthly", "semester"],
-        tier=ParameterTier.ADVANCED,
-        group="classes",
-        label="Class Schedule Type",
-        help="Monthly = continuous rolling classes. Semester = structured terms with breaks. Affects cash flow timing and member acquisition patterns.",
-        affects=[]
-    ),
-
-    "CLASS_COHORTS_PER_MONTH": Parameter(
-        name="CLASS_COHORTS_PER_MONTH",
-        type=ParameterType.INT,
-        default=2,
-        min=0,
-        max=10,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="classes",
-        label="Class Cohorts per Month/Term",
-        help="Number of class groups starting per period. More cohorts = more revenue but requires instructor capacity.",
-        affects=[]
-    ),
-
-    "CLASS_CAP_PER_COHORT": Parameter(
-        name="CLASS_CAP_PER_COHORT",
-        type=ParameterType.INT,
-        default=10,
-        min=3,
-        max=20,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="classes",
-        label="Students per Class",
-        help="Maximum students per class cohort. Limited by instruction quality and workspace capacity.",
-        affects=[]
-    ),
-
-    "CLASS_PRICE": Parameter(
-        name="CLASS_PRICE",
-        type=ParameterType.FLOAT,
-        default=600.0,
-        min=100.0,
-        max=1000.0,
-        step=25.0,
-        tier=ParameterTier.ADVANCED,
-        group="classes",
-        label="Class Series Price ($)",
-        help="Tuition for complete multi-week course. Major revenue stream - should cover instructor costs, materials, and profit.",
-        affects=[]
-    ),
-
-    "CLASS_FILL_MEAN": Parameter(
-        name="CLASS_FILL_MEAN",
-        type=ParameterType.FLOAT,
-        default=0.85,
-        min=0.3,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="classes",
-        label="Average Class Fill Rate",
-        help="Typical fraction of class capacity that actually enrolls. 0.85 = 85% average enrollment. Accounts for no-shows and cancellations.",
-        affects=[]
-    ),
-
-    "CLASS_COST_PER_STUDENT": Parameter(
-        name="CLASS_COST_PER_STUDENT",
-        type=ParameterType.FLOAT,
-        default=40.0,
-        min=10.0,
-        max=100.0,
-        step=5.0,
-        tier=ParameterTier.ADVANCED,
-        group="classes",
-        label="Variable Cost per Student ($)",
-        help="Materials and supplies cost per class student over full course. Clay, glazes, firing costs, handouts, etc.",
-        affects=[]
-    ),
-
-    "CLASS_INSTR_RATE_PER_HR": Parameter(
-        name="CLASS_INSTR_RATE_PER_HR",
-        type=ParameterType.FLOAT,
-        default=30.0,
-        min=15.0,
-        max=100.0,
-        step=2.5,
-        tier=ParameterTier.ADVANCED,
-        group="classes",
-        label="Instructor Hourly Rate ($)",
-        help="Compensation for class instructor per hour. Major cost component for class programs.",
-        affects=[]
-    ),
-
-    "CLASS_HOURS_PER_COHORT": Parameter(
-        name="CLASS_HOURS_PER_COHORT",
-        type=ParameterType.FLOAT,
-        default=18.0,
-        min=6.0,
-        max=40.0,
-        step=1.0,
-        tier=ParameterTier.ADVANCED,
-        group="classes",
-        label="Total Hours per Class Series",
-        help="Total instructor hours per complete class (e.g., 6 weeks Ãƒâ€” 3 hours = 18). Affects instructor costs.",
-        affects=[]
-    ),
-
-    "CLASS_CONV_RATE": Parameter(
-        name="CLASS_CONV_RATE",
-        type=ParameterType.FLOAT,
-        default=0.12,
-        min=0.0,
-        max=0.5,
-        step=0.01,
-        tier=ParameterTier.ADVANCED,
-        group="classes",
-        label="Class to Member Conversion Rate",
-        help="Fraction of class students who become members. Higher than workshop conversion due to deeper engagement.",
-        affects=[]
-    ),
-
-    "CLASS_CONV_LAG_MO": Parameter(
-        name="CLASS_CONV_LAG_MO",
-        type=ParameterType.INT,
-        default=1,
-        min=0,
-        max=6,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="classes",
-        label="Class Conversion Lag (months)",
-        help="Months between class completion and membership signup. Often immediate as students are already engaged.",
-        affects=[]
-    ),
-
-    "CLASS_EARLY_CHURN_MULT": Parameter(
-        name="CLASS_EARLY_CHURN_MULT",
-        type=ParameterType.FLOAT,
-        default=0.8,
-        min=0.1,
-        max=1.5,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="classes",
-        label="Class Convert Early Churn Multiplier",
-        help="Churn rate modifier for class converts in first 3-6 months. <1.0 = lower churn due to formal introduction to pottery.",
-        affects=[]
-    ),
-
-    "CLASS_SEMESTER_LENGTH_MONTHS": Parameter(
-        name="CLASS_SEMESTER_LENGTH_MONTHS",
-        type=ParameterType.INT,
-        default=3,
-        min=1,
-        max=6,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="classes",
-        label="Semester Length (months)",
-        help="Duration of each semester in months. Only relevant if using semester scheduling mode.",
-        affects=[]
-    ),
-
-    # =============================================================================
-    # REVENUE: EVENTS
-    # =============================================================================
-    "EVENTS_ENABLED": Parameter(
-        name="EVENTS_ENABLED",
-        type=ParameterType.BOOL,
-        default=True,
-        tier=ParameterTier.IMPORTANT,
-        group="events",
-        label="Enable Event Revenue Stream",
-        help="Whether the studio hosts public events such as paint-a-pot, parties, and group activities. High-margin revenue stream.",
-        affects=[]
-    ),
-
-    "BASE_EVENTS_PER_MONTH_LAMBDA": Parameter(
-        name="BASE_EVENTS_PER_MONTH_LAMBDA",
-        type=ParameterType.FLOAT,
-        default=3.0,
-        min=0.0,
-        max=20.0,
-        step=0.5,
-        tier=ParameterTier.ADVANCED,
-        group="events",
-        label="Base Events per Month (Î»)",
-        help="Average number of monthly events before applying seasonality and random variation. Modeled using a Poisson draw.",
-        affects=[]
-    ),
-
-    "EVENTS_MAX_PER_MONTH": Parameter(
-        name="EVENTS_MAX_PER_MONTH",
-        type=ParameterType.INT,
-        default=4,
-        min=1,
-        max=30,
-        step=1,
-        tier=ParameterTier.IMPORTANT,
-        group="events",
-        label="Maximum Events per Month",
-        help="Hard limit on monthly events due to staffing and space constraints. Prevents unrealistic spikes.",
-        affects=[]
-    ),
-
-    "TICKET_PRICE": Parameter(
-        name="TICKET_PRICE",
-        type=ParameterType.FLOAT,
-        default=75.0,
-        min=30.0,
-        max=200.0,
-        step=5.0,
-        tier=ParameterTier.IMPORTANT,
-        group="events",
-        label="Event Ticket Price ($)",
-        help="Price per event participant. Should cover bisque ware, glazes, staff time, and profitability.",
-        affects=[]
-    ),
-
-    "ATTENDEES_PER_EVENT_RANGE": Parameter(
-        name="ATTENDEES_PER_EVENT_RANGE",
-        type=ParameterType.TEXT,
-        default="[8, 10, 12]",
-        tier=ParameterTier.ADVANCED,
-        group="events",
-        label="Event Attendance Range",
-        help="JSON list of possible attendance values. Each event randomly selects one. Format: [min, mid, max].",
-        affects=[]
-    ),
-
-    "EVENT_MUG_COST_RANGE": Parameter(
-        name="EVENT_MUG_COST_RANGE",
-        type=ParameterType.TEXT,
-        default="[4.5, 7.5]",
-        tier=ParameterTier.ADVANCED,
-        group="events",
-        label="Bisque Mug Cost Range",
-        help="JSON list [min, max] cost of bisque mugs for events. Random draw per participant.",
-        affects=[]
-    ),
-
-    "EVENT_CONSUMABLES_PER_PERSON": Parameter(
-        name="EVENT_CONSUMABLES_PER_PERSON",
-        type=ParameterType.FLOAT,
-        default=2.5,
-        min=1.0,
-        max=20.0,
-        step=0.5,
-        tier=ParameterTier.ADVANCED,
-        group="events",
-        label="Consumables Cost per Person ($)",
-        help="Glazes, brushes, cleanup materials, and packaging per event participant.",
-        affects=[]
-    ),
-
-    "EVENT_STAFF_RATE_PER_HOUR": Parameter(
-        name="EVENT_STAFF_RATE_PER_HOUR",
-        type=ParameterType.FLOAT,
-        default=22.0,
-        min=0.0,
-        max=50.0,
-        step=1.0,
-        tier=ParameterTier.ADVANCED,
-        group="events",
-        label="Event Staff Hourly Rate ($)",
-        help="Hourly wage paid to staff for running events including setup and cleanup. Set to 0 if owner-operated.",
-        affects=[]
-    ),
-
-    "EVENT_HOURS_PER_EVENT": Parameter(
-        name="EVENT_HOURS_PER_EVENT",
-        type=ParameterType.FLOAT,
-        default=2.0,
-        min=1.0,
-        max=8.0,
-        step=0.5,
-        tier=ParameterTier.ADVANCED,
-        group="events",
-        label="Staff Hours per Event",
-        help="Total staff time per event including setup, instruction, and cleaning.",
-        affects=[]
-    ),
-
-    # =============================================================================
-    # REVENUE: DESIGNATED STUDIOS
-    # =============================================================================
-    "DESIGNATED_STUDIO_COUNT": Parameter(
-        name="DESIGNATED_STUDIO_COUNT",
-        type=ParameterType.INT,
-        default=2,
-        min=0,
-        max=10,
-        step=1,
-        tier=ParameterTier.IMPORTANT,
-        group="designated_studios",
-        label="Number of Designated Studios",
-        help="Private workspaces for advanced ceramicists. Rentable monthly. Limited by physical space.",
-        affects=[]
-    ),
-
-    "DESIGNATED_STUDIO_PRICE": Parameter(
-        name="DESIGNATED_STUDIO_PRICE",
-        type=ParameterType.FLOAT,
-        default=300.0,
-        min=100.0,
-        max=1000.0,
-        step=25.0,
-        tier=ParameterTier.IMPORTANT,
-        group="designated_studios",
-        label="Designated Studio Monthly Price ($)",
-        help="Monthly rent per designated studio. Key premium revenue stream.",
-        affects=[]
-    ),
-
-    "DESIGNATED_STUDIO_BASE_OCCUPANCY": Parameter(
-        name="DESIGNATED_STUDIO_BASE_OCCUPANCY",
-        type=ParameterType.FLOAT,
-        default=0.3,
-        min=0.0,
-        max=1.0,
-        step=0.05,
-        tier=ParameterTier.ADVANCED,
-        group="designated_studios",
-        label="Designated Studio Occupancy Rate",
-        help="Expected fraction of designated studios rented on average. Affects revenue and cash flow volatility.",
-        affects=[]
-    ),
-    # =============================================================================
-    # OPERATING COSTS: FIXED
-    # =============================================================================
-    "INSURANCE_COST": Parameter(
-        name="INSURANCE_COST",
-        type=ParameterType.FLOAT,
-        default=75.0,
-        min=50.0,
-        max=500.0,
-        step=10.0,
-        tier=ParameterTier.IMPORTANT,
-        group="fixed_costs",
-        label="Monthly Insurance Cost ($)",
-        help="General liability and property insurance. Required for most leases and essential for pottery studio operations.",
-        affects=[]
-    ),
-
-    "GLAZE_COST_PER_MONTH": Parameter(
-        name="GLAZE_COST_PER_MONTH",
-        type=ParameterType.FLOAT,
-        default=833.33,
-        min=200.0,
-        max=2000.0,
-        step=50.0,
-        tier=ParameterTier.ADVANCED,
-        group="fixed_costs",
-        label="Monthly Glaze Cost ($)",
-        help="Glazes, underglazes, and finishing materials. Fixed cost since members use unlimited glazes. Major expense item.",
-        affects=[]
-    ),
-
-    "HEATING_COST_WINTER": Parameter(
-        name="HEATING_COST_WINTER",
-        type=ParameterType.FLOAT,
-        default=450.0,
-        min=100.0,
-        max=1500.0,
-        step=25.0,
-        tier=ParameterTier.ADVANCED,
-        group="fixed_costs",
-        label="Winter Monthly Heating ($)",
-        help="Heating costs during cold months (Octâ€“Mar). Higher for pottery studios due to large spaces and kiln heat loss.",
-        affects=[]
-    ),
-
-    "HEATING_COST_SUMMER": Parameter(
-        name="HEATING_COST_SUMMER",
-        type=ParameterType.FLOAT,
-        default=30.0,
-        min=0.0,
-        max=500.0,
-        step=10.0,
-        tier=ParameterTier.ADVANCED,
-        group="fixed_costs",
-        label="Summer Monthly Heating ($)",
-        help="Minimal heating costs during warm months (Aprâ€“Sep). May be just hot water heater and minimal space heating.",
-        affects=[]
-    ),
-
-    # =============================================================================
-    # OPERATING COSTS: VARIABLE
-    # =============================================================================
-    "COST_PER_KWH": Parameter(
-        name="COST_PER_KWH",
-        type=ParameterType.FLOAT,
-        default=0.2182,
-        min=0.08,
-        max=0.50,
-        step=0.01,
-        tier=ParameterTier.ADVANCED,
-        group="variable_costs",
-        label="Electricity Rate ($/kWh)",
-        help="Local electricity rate including all fees and taxes. Kilns are major electricity consumers.",
-        affects=[]
-    ),
-
-    "WATER_COST_PER_GALLON": Parameter(
-        name="WATER_COST_PER_GALLON",
-        type=ParameterType.FLOAT,
-        default=0.02,
-        min=0.005,
-        max=0.05,
-        step=0.002,
-        tier=ParameterTier.ADVANCED,
-        group="variable_costs",
-        label="Water Cost ($/gallon)",
-        help="Water and sewer costs per gallon. Pottery uses significant water for clay prep and cleanup.",
-        affects=[]
-    ),
-
-    "GALLONS_PER_BAG_CLAY": Parameter(
-        name="GALLONS_PER_BAG_CLAY",
-        type=ParameterType.FLOAT,
-        default=1.0,
-        min=0.5,
-        max=3.0,
-        step=0.1,
-        tier=ParameterTier.ADVANCED,
-        group="variable_costs",
-        label="Water per Clay Bag (gallons)",
-        help="Water consumption per 25lb clay bag for mixing and cleanup. Varies by clay type and studio practices.",
-        affects=[]
-    ),
-
-    "KWH_PER_FIRING_KMT1027": Parameter(
-        name="KWH_PER_FIRING_KMT1027",
-        type=ParameterType.FLOAT,
-        default=75.0,
-        min=40.0,
-        max=120.0,
-        step=5.0,
-        tier=ParameterTier.ADVANCED,
-        group="variable_costs",
-        label="kWh per Firing - Kiln 1 (KMT1027)",
-        help="Electricity consumption per firing cycle for smaller kiln. Varies by firing temperature and duration.",
-        affects=[]
-    ),
-
-    "KWH_PER_FIRING_KMT1427": Parameter(
-        name="KWH_PER_FIRING_KMT1427",
-        type=ParameterType.FLOAT,
-        default=110.0,
-        min=60.0,
-        max=180.0,
-        step=5.0,
-        tier=ParameterTier.ADVANCED,
-        group="variable_costs",
-        label="kWh per Firing - Kiln 2 (KMT1427)",
-        help="Electricity consumption per firing cycle for larger kiln. Higher capacity but more energy per firing.",
-        affects=[]
-    ),
-
-    "DYNAMIC_FIRINGS": Parameter(
-        name="DYNAMIC_FIRINGS",
-        type=ParameterType.BOOL,
-        default=True,
-        tier=ParameterTier.ADVANCED,
-        group="variable_costs",
-        label="Dynamic Firing Schedule",
-        help="Whether firing frequency adjusts based on member count. True = more members trigger more firings. False = fixed schedule.",
-        affects=[]
-    ),
-
-    "BASE_FIRINGS_PER_MONTH": Parameter(
-        name="BASE_FIRINGS_PER_MONTH",
-        type=ParameterType.INT,
-        default=10,
-        min=2,
-        max=30,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="variable_costs",
-        label="Base Firings per Month",
-        help="Firing frequency at reference member count. Used for scaling if dynamic firings enabled, or as fixed rate if disabled.",
-        affects=[]
-    ),
-
-    "REFERENCE_MEMBERS_FOR_BASE_FIRINGS": Parameter(
-        name="REFERENCE_MEMBERS_FOR_BASE_FIRINGS",
-        type=ParameterType.INT,
-        default=12,
-        min=5,
-        max=50,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="variable_costs",
-        label="Reference Member Count for Firing Scale",
-        help="Member count that triggers base firing frequency. More members = proportionally more firings if dynamic enabled.",
-        affects=[]
-    ),
-
-    "MIN_FIRINGS_PER_MONTH": Parameter(
-        name="MIN_FIRINGS_PER_MONTH",
-        type=ParameterType.INT,
-        default=4,
-        min=1,
-        max=15,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="variable_costs",
-        label="Minimum Firings per Month",
-        help="Floor on monthly firings even with very few members. Ensures kiln maintenance and minimum service level.",
-        affects=[]
-    ),
-
-    "MAX_FIRINGS_PER_MONTH": Parameter(
-        name="MAX_FIRINGS_PER_MONTH",
-        type=ParameterType.INT,
-        default=12,
-        min=8,
-        max=50,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="variable_costs",
-        label="Maximum Firings per Month",
-        help="Ceiling on monthly firings due to kiln capacity and staff time constraints. Prevents unrealistic firing schedules.",
-        affects=[]
-    ),
-    # =============================================================================
-    # OPERATIONAL COSTS: MAINTENANCE & MARKETING
-    # =============================================================================
-    "MAINTENANCE_BASE_COST": Parameter(
-        name="MAINTENANCE_BASE_COST",
-        type=ParameterType.FLOAT,
-        default=200.0,
-        min=50.0,
-        max=1000.0,
-        step=25.0,
-        tier=ParameterTier.ADVANCED,
-        group="operational_costs",
-        label="Base Monthly Maintenance ($)",
-        help="Predictable maintenance costs: kiln elements, wheel repairs, tool replacement. Core facility upkeep.",
-        affects=[]
-    ),
-
-    "MAINTENANCE_RANDOM_STD": Parameter(
-        name="MAINTENANCE_RANDOM_STD",
-        type=ParameterType.FLOAT,
-        default=150.0,
-        min=0.0,
-        max=500.0,
-        step=25.0,
-        tier=ParameterTier.ADVANCED,
-        group="operational_costs",
-        label="Random Maintenance Variation ($)",
-        help="Standard deviation of unpredictable maintenance costs. Models equipment failures and emergency repairs.",
-        affects=[]
-    ),
-
-    "MARKETING_COST_BASE": Parameter(
-        name="MARKETING_COST_BASE",
-        type=ParameterType.FLOAT,
-        default=300.0,
-        min=0.0,
-        max=2000.0,
-        step=50.0,
-        tier=ParameterTier.ADVANCED,
-        group="operational_costs",
-        label="Base Monthly Marketing ($)",
-        help="Ongoing marketing spend: social media ads, printed materials, website. Essential for member acquisition.",
-        affects=[]
-    ),
-
-    "MARKETING_RAMP_MONTHS": Parameter(
-        name="MARKETING_RAMP_MONTHS",
-        type=ParameterType.INT,
-        default=12,
-        min=1,
-        max=24,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="operational_costs",
-        label="Marketing Ramp Duration (months)",
-        help="Months of elevated marketing spend during startup. Higher early spend builds initial awareness.",
-        affects=[]
-    ),
-
-    "MARKETING_RAMP_MULTIPLIER": Parameter(
-        name="MARKETING_RAMP_MULTIPLIER",
-        type=ParameterType.FLOAT,
-        default=2.0,
-        min=1.0,
-        max=5.0,
-        step=0.25,
-        tier=ParameterTier.ADVANCED,
-        group="operational_costs",
-        label="Marketing Ramp Multiplier",
-        help="Multiplier on base marketing spend during ramp period. 2.0 = double spend for the first N months.",
-        affects=[]
-    ),
-
-    # =============================================================================
-    # STAFF COSTS
-    # =============================================================================
-    "STAFF_EXPANSION_THRESHOLD": Parameter(
-        name="STAFF_EXPANSION_THRESHOLD",
-        type=ParameterType.INT,
-        default=50,
-        min=20,
-        max=200,
-        step=5,
-        tier=ParameterTier.ADVANCED,
-        group="staff_costs",
-        label="Staff Hiring Threshold (members)",
-        help="Member count that triggers hiring the first employee. Represents owner capacity limit and service quality needs.",
-        affects=[]
-    ),
-
-    "STAFF_COST_PER_MONTH": Parameter(
-        name="STAFF_COST_PER_MONTH",
-        type=ParameterType.FLOAT,
-        default=2500.0,
-        min=1500.0,
-        max=8000.0,
-        step=100.0,
-        tier=ParameterTier.ADVANCED,
-        group="staff_costs",
-        label="Monthly Staff Cost ($)",
-        help="Total monthly cost for the first employee including wages, payroll taxes, and benefits.",
-        affects=[]
-    ),
-
-    # =============================================================================
-    # ENTITY TYPE & TAXATION
-    # =============================================================================
-    "ENTITY_TYPE": Parameter(
-        name="ENTITY_TYPE",
-        type=ParameterType.SELECT,
-        default="sole_prop",
-        options=["sole_prop", "partnership", "s_corp", "c_corp"],
-        tier=ParameterTier.ADVANCED,
-        group="taxation",
-        label="Business Entity Type",
-        help="Legal structure affecting taxation and owner compensation. Sole prop = simplest, S-corp = payroll taxes, C-corp = double taxation.",
-        affects=[]
-    ),
-
-    "MA_PERSONAL_INCOME_TAX_RATE": Parameter(
-        name="MA_PERSONAL_INCOME_TAX_RATE",
-        type=ParameterType.FLOAT,
-        default=0.05,
-        min=0.0,
-        max=0.15,
-        step=0.005,
-        tier=ParameterTier.ADVANCED,
-        group="taxation",
-        label="MA Personal Income Tax Rate",
-        help="Massachusetts personal income tax rate. Applies to pass-through income for sole proprietorships, partnerships, and S-corps.",
-        affects=[]
-    ),
-
-    "SE_SOC_SEC_RATE": Parameter(
-        name="SE_SOC_SEC_RATE",
-        type=ParameterType.FLOAT,
-        default=0.124,
-        min=0.08,
-        max=0.15,
-        step=0.001,
-        tier=ParameterTier.ADVANCED,
-        group="taxation",
-        label="Self-Employment Social Security Rate",
-        help="Combined employer+employee Social Security rate for self-employed individuals. Applies up to wage base.",
-        affects=[]
-    ),
-
-    "SE_MEDICARE_RATE": Parameter(
-        name="SE_MEDICARE_RATE",
-        type=ParameterType.FLOAT,
-        default=0.029,
-        min=0.02,
-        max=0.05,
-        step=0.001,
-        tier=ParameterTier.ADVANCED,
-        group="taxation",
-        label="Self-Employment Medicare Rate",
-        help="Combined employer+employee Medicare rate for self-employed income. Applies to all income with no wage cap.",
-        affects=[]
-    ),
-
-    "SE_SOC_SEC_WAGE_BASE": Parameter(
-        name="SE_SOC_SEC_WAGE_BASE",
-        type=ParameterType.INT,
-        default=168600,
-        min=100000,
-        max=200000,
-        step=1000,
-        tier=ParameterTier.ADVANCED,
-        group="taxation",
-        label="SE Social Security Wage Base ($)",
-        help="Annual wage base limit for Social Security tax. SE income above this amount is exempt from SS tax.",
-        affects=[]
-    ),
-
-    "SCORP_OWNER_SALARY_PER_MONTH": Parameter(
-        name="SCORP_OWNER_SALARY_PER_MONTH",
-        type=ParameterType.FLOAT,
-        default=4000.0,
-        min=0.0,
-        max=10000.0,
-        step=100.0,
-        tier=ParameterTier.ADVANCED,
-        group="taxation",
-        label="S-Corp Owner Monthly Salary ($)",
-        help="Reasonable salary requirement for S-Corp owners. Salary is subject to payroll taxes; profits above salary avoid SE tax.",
-        affects=[]
-    ),
-
-    "FED_CORP_TAX_RATE": Parameter(
-        name="FED_CORP_TAX_RATE",
-        type=ParameterType.FLOAT,
-        default=0.21,
-        min=0.15,
-        max=0.35,
-        step=0.01,
-        tier=ParameterTier.ADVANCED,
-        group="taxation",
-        label="Federal Corporate Tax Rate",
-        help="Federal income tax rate applied to C-Corporation profits before dividends.",
-        affects=[]
-    ),
-
-    "MA_CORP_TAX_RATE": Parameter(
-        name="MA_CORP_TAX_RATE",
-        type=ParameterType.FLOAT,
-        default=0.08,
-        min=0.05,
-        max=0.12,
-        step=0.005,
-        tier=ParameterTier.ADVANCED,
-        group="taxation",
-        label="MA Corporate Tax Rate",
-        help="Massachusetts corporate income tax rate for C-Corporations. Combined with federal rate for total tax burden.",
-        affects=[]
-    ),
-
-    "MA_SALES_TAX_RATE": Parameter(
-        name="MA_SALES_TAX_RATE",
-        type=ParameterType.FLOAT,
-        default=0.0625,
-        min=0.0,
-        max=0.15,
-        step=0.005,
-        tier=ParameterTier.ADVANCED,
-        group="taxation",
-        label="MA Sales Tax Rate",
-        help="Massachusetts sales tax rate applied to clay and retail sales. Must be collected and remitted quarterly.",
-        affects=[]
-    ),
-
-    # =============================================================================
-    # FINANCING: SBA LOANS
-    # =============================================================================
-    "LOAN_504_AMOUNT_OVERRIDE": Parameter(
-        name="LOAN_504_AMOUNT_OVERRIDE",
-        type=ParameterType.FLOAT,
-        default=0.0,
-        min=0.0,
-        max=500000.0,
-        step=1000.0,
-        tier=ParameterTier.ADVANCED,
-        group="financing",
-        label="SBA 504 Loan Amount Override ($, 0=Auto-calculate)",
-        help="Manual override for SBA 504 loan amount. Leave at 0 to auto-calculate from CapEx equipment costs plus contingency.",
-        affects=[]
-    ),
+- RUNWAY_MONTHS
+- MONTHS (simulation horizon)
+- N_SIMULATIONS
 
-    "LOAN_7A_AMOUNT_OVERRIDE": Parameter(
-        name="LOAN_7A_AMOUNT_OVERRIDE",
-        type=ParameterType.FLOAT,
-        default=0.0,
-        min=0.0,
-        max=500000.0,
-        step=1000.0,
-        tier=ParameterTier.ADVANCED,
-        group="financing",
-        label="SBA 7(a) Loan Amount Override ($, 0=Auto-calculate)",
-        help="Manual override for SBA 7(a) loan amount. Leave at 0 to auto-calculate from 8 months of OpEx (rent + owner draw + insurance).",
-        affects=[]
-    ),
+IMPORTANT (tier=ParameterTier.IMPORTANT) - These ~20:
+- WORKSHOPS_ENABLED
+- CLASSES_ENABLED
+- EVENTS_ENABLED
+- DESIGNATED_STUDIOS_ENABLED
+- WHEELS_CAPACITY
+- HANDBUILDING_CAPACITY
+- GLAZE_CAPACITY
+- OPEN_HOURS_PER_WEEK
+- HOBBYIST_PROB
+- COMMITTED_ARTIST_PROB
+- PRODUCTION_POTTER_PROB
+- SEASONAL_USER_PROB
+- INSURANCE_COST
+- UTILITIES_BASE_COST
+- CLAY_PRICE_PER_BAG
+- FIRING_BASE_RATE
+- REFERENCE_PRICE
+- LOAN_504_ANNUAL_RATE
+- LOAN_7A_ANNUAL_RATE
+- IO_MONTHS_504
+- IO_MONTHS_7A
 
-    "LOAN_504_ANNUAL_RATE": Parameter(
-        name="LOAN_504_ANNUAL_RATE",
-        type=ParameterType.FLOAT,
-        default=0.070,
-        min=0.03,
-        max=0.15,
-        step=0.001,
-        tier=ParameterTier.IMPORTANT,
-        group="financing",
-        label="SBA 504 Annual Rate",
-        help="Blended interest rate for SBA 504 loan (equipment/real estate). Typically lower than conventional financing.",
-        affects=[]
-    ),
+ADVANCED (tier=ParameterTier.ADVANCED) - Everything else (~120+ parameters)
+- All churn rates by archetype
+- All session hours/frequencies
+- All clay usage ranges
+- All workshop details
+- All class details
+- All event details
+- All market dynamics
+- All seasonality
+- All economic factors
+- All elasticity
+- etc.
+"""
 
-    "LOAN_504_TERM_YEARS": Parameter(
-        name="LOAN_504_TERM_YEARS",
-        type=ParameterType.INT,
-        default=20,
-        min=5,
-        max=25,
-        step=1,
-        tier=ParameterTier.ESSENTIAL,
-        group="financing",
-        label="SBA 504 Term (years)",
-        help="Repayment period for 504 loan. Longer terms available for real estate (20 years) vs equipment (10â€“15 years).",
-        affects=[]
-    ),
+# The catalog lives in parameters.json as one row per parameter, in Parameter
+# field order: [name, type, default, min, max, step, tier, group, label(, options)]
+# with type and tier given by their lowercase enum names, optionally followed
+# by an object of further Parameter keyword arguments (e.g. visible_when_spec).
+_CATALOG_PATH = Path(__file__).with_name("parameters.json")
 
-    "IO_MONTHS_504": Parameter(
-        name="IO_MONTHS_504",
-        type=ParameterType.INT,
-        default=6,
-        min=0,
-        max=18,
-        step=1,
-        tier=ParameterTier.IMPORTANT,
-        group="financing",
-        label="504 Interest-Only Months",
-        help="Initial months with interest-only payments on 504 loan. Helps cash flow during the build-out and startup phase.",
-        affects=[]
-    ),
 
-    "LOAN_7A_ANNUAL_RATE": Parameter(
-        name="LOAN_7A_ANNUAL_RATE",
-        type=ParameterType.FLOAT,
-        default=0.115,
-        min=0.05,
-        max=0.20,
-        step=0.001,
-        tier=ParameterTier.IMPORTANT,
-        group="financing",
-        label="SBA 7(a) Annual Rate",
-        help="Interest rate for SBA 7(a) loan (working capital/general business). Typically higher than 504 but more flexible.",
-        affects=[]
-    ),
+def _load_catalog() -> Dict[str, Parameter]:
+    types_by_name = {member.name.lower(): member for member in ParameterType}
+    tiers_by_name = {member.name.lower(): member for member in ParameterTier}
+    rows = _json_loads(_CATALOG_PATH.read_bytes())
+    
+    # Rows already match the constructor's positional order, so swap the two
+    # enum columns in place and hand each row straight to Parameter; a
+    # trailing object holds the keyword-only extras
+    params = {}
+    for row in rows:
+        extras = row.pop() if isinstance(row[-1], dict) else {}
+        row[1] = types_by_name[row[1]]
+        row[6] = tiers_by_name[row[6]]
+        param = Parameter(*row, **extras)
+        params[param.name] = param
+    return params
 
-    "LOAN_7A_TERM_YEARS": Parameter(
-        name="LOAN_7A_TERM_YEARS",
-        type=ParameterType.INT,
-        default=7,
-        min=5,
-        max=10,
-        step=1,
-        tier=ParameterTier.ESSENTIAL,
-        group="financing",
-        label="SBA 7(a) Term (years)",
-        help="Repayment period for 7(a) loan. Generally shorter than 504, reflecting working capital vs fixed asset financing.",
-        affects=[]
-    ),
 
-    "IO_MONTHS_7A": Parameter(
-        name="IO_MONTHS_7A",
-        type=ParameterType.INT,
-        default=6,
-        min=0,
-        max=18,
-        step=1,
-        tier=ParameterTier.IMPORTANT,
-        group="financing",
-        label="7(a) Interest-Only Months",
-        help="Initial months with interest-only payments on 7(a) loan. Preserves working capital during startup.",
-        affects=[]
-    ),
+# Read-only view: the catalog is shared by every session (and by forked
+# workers), so nothing may edit it in place. Build a new dict to customise.
+_PARAMETERS = _load_catalog()
+PARAMETERS: Mapping[str, Parameter] = MappingProxyType(_PARAMETERS)
 
-    "LOAN_CONTINGENCY_PCT": Parameter(
-        name="LOAN_CONTINGENCY_PCT",
-        type=ParameterType.FLOAT,
-        default=0.08,
-        min=0.0,
-        max=0.30,
-        step=0.01,
-        tier=ParameterTier.ADVANCED,
-        group="financing",
-        label="CapEx Contingency %",
-        help="Percentage buffer added to equipment and buildout costs when sizing the loan. Accounts for overruns and surprise expenses.",
-        affects=[]
-    ),
 
-    "RUNWAY_MONTHS": Parameter(
-        name="RUNWAY_MONTHS",
-        type=ParameterType.INT,
-        default=12,
-        min=6,
-        max=24,
-        step=1,
-        tier=ParameterTier.ESSENTIAL,
-        group="financing",
-        label="Operating Runway (months)",
-        help="Months of operating expenses to include when sizing the 7(a) working-capital loan. Higher runway = more cushion but more debt service.",
-        affects=[]
-    ),
+# =============================================================================
+# PARAMETER INDEXES
+# =============================================================================
+# Tier and group views are built in one pass at import so the UI can fetch the
+# parameters for a panel without re-filtering the whole schema every rerun.
 
-    "EXTRA_BUFFER": Parameter(
-        name="EXTRA_BUFFER",
-        type=ParameterType.FLOAT,
-        default=10000.0,
-        min=0.0,
-        max=50000.0,
-        step=1000.0,
-        tier=ParameterTier.ADVANCED,
-        group="financing",
-        label="Extra Working Capital Buffer ($)",
-        help="Additional cash buffer beyond calculated runway. Useful for uncertain markets, longer build-outs, or conservative planning.",
-        affects=[]
-    ),
+def _build_indexes(params: Mapping[str, Parameter]):
+    by_tier: Dict[ParameterTier, List[Parameter]] = {tier: [] for tier in ParameterTier}
+    by_group: Dict[str, List[Parameter]] = {}
+    by_tier_group: Dict[tuple, List[Parameter]] = {}
+    
+    for param in params.values():
+        by_tier[param.tier].append(param)
+        by_group.setdefault(param.group, []).append(param)
+        by_tier_group.setdefault((param.tier, param.group), []).append(param)
+    
+    # Read-only like PARAMETERS: the buckets are shared by every caller
+    return (
+        MappingProxyType({tier: tuple(items) for tier, items in by_tier.items()}),
+        MappingProxyType({group: tuple(items) for group, items in by_group.items()}),
+        MappingProxyType({key: tuple(items) for key, items in by_tier_group.items()}),
+    )
 
-    "RESERVE_FLOOR": Parameter(
-        name="RESERVE_FLOOR",
-        type=ParameterType.FLOAT,
-        default=5000.0,
-        min=0.0,
-        max=50000.0,
-        step=1000.0,
-        tier=ParameterTier.ADVANCED,
-        group="financing",
-        label="Minimum Cash Reserve ($)",
-        help="Minimum cash balance to maintain. Used for line-of-credit sizing and survival analysis.",
-        affects=[]
-    ),
 
-    "FEES_UPFRONT_PCT_7A": Parameter(
-        name="FEES_UPFRONT_PCT_7A",
-        type=ParameterType.FLOAT,
-        default=0.03,
-        min=0.0,
-        max=0.05,
-        step=0.0025,
-        tier=ParameterTier.ADVANCED,
-        group="financing",
-        label="7(a) Upfront Fee %",
-        help="SBA guarantee fee as a percentage of 7(a) loan amount. Typically 2â€“3.5% depending on loan size.",
-        affects=[]
-    ),
+PARAMS_BY_TIER, PARAMS_BY_GROUP, _PARAMS_BY_TIER_GROUP = _build_indexes(PARAMETERS)
+_ALL_PARAMS = tuple(PARAMETERS.values())
+_DEFAULTS: Dict[str, Any] = {name: param.default for name, param in PARAMETERS.items()}
 
-    "FEES_UPFRONT_PCT_504": Parameter(
-        name="FEES_UPFRONT_PCT_504",
-        type=ParameterType.FLOAT,
-        default=0.02,
-        min=0.0,
-        max=0.05,
-        step=0.0025,
-        tier=ParameterTier.ADVANCED,
-        group="financing",
-        label="504 Upfront Fee %",
-        help="SBA guarantee fee as a percentage of 504 loan amount. Generally lower than 7(a) fees.",
-        affects=[]
-    ),
 
-    "FEES_PACKAGING": Parameter(
-        name="FEES_PACKAGING",
-        type=ParameterType.FLOAT,
-        default=2500.0,
-        min=0.0,
-        max=10000.0,
-        step=250.0,
-        tier=ParameterTier.ADVANCED,
-        group="financing",
-        label="Loan Packaging Fee ($)",
-        help="Professional fee for loan-application preparation and SBA packaging. Common when using consultants or packagers.",
-        affects=[]
-    ),
+# Defaults of JSON-typed parameters, parsed at construction so the simulation
+# never re-parses them
+PARSED_DEFAULTS: Mapping[str, Any] = MappingProxyType({
+    name: param.parsed_default
+    for name, param in PARAMETERS.items()
+    if param.type == ParameterType.JSON
+})
 
-    "FEES_CLOSING": Parameter(
-        name="FEES_CLOSING",
-        type=ParameterType.FLOAT,
-        default=1500.0,
-        min=0.0,
-        max=5000.0,
-        step=100.0,
-        tier=ParameterTier.ADVANCED,
-        group="financing",
-        label="Loan Closing Costs ($)",
-        help="Legal, title, and closing costs incurred at loan funding. One-time expense.",
-        affects=[]
-    ),
 
-    "FINANCE_FEES_7A": Parameter(
-        name="FINANCE_FEES_7A",
-        type=ParameterType.BOOL,
-        default=True,
-        tier=ParameterTier.ADVANCED,
-        group="financing",
-        label="Finance 7(a) Fees into Loan",
-        help="Whether 7(a) fees are rolled into the loan principal (vs paid in cash). Financing fees preserves cash but raises total debt.",
-        affects=[]
-    ),
+def _build_visibility_deps(params: Mapping[str, Parameter]):
+    deps: Dict[str, List[str]] = {}
+    dynamic: List[str] = []
+    
+    for name, param in params.items():
+        if param.visible_when_spec is not None:
+            for key in param.visible_when_spec:
+                deps.setdefault(key, []).append(name)
+        elif param.visible_when is not None:
+            dynamic.append(name)
+    
+    return {key: tuple(names) for key, names in deps.items()}, tuple(dynamic)
 
-    "FINANCE_FEES_504": Parameter(
-        name="FINANCE_FEES_504",
-        type=ParameterType.BOOL,
-        default=True,
-        tier=ParameterTier.ADVANCED,
-        group="financing",
-        label="Finance 504 Fees into Loan",
-        help="Whether 504 fees are rolled into the loan principal (vs paid in cash). Financing fees preserves cash but raises total debt.",
-        affects=[]
-    ),
 
-    "EXTRA_504_BUFFER": Parameter(
-        name="EXTRA_504_BUFFER",
-        type=ParameterType.FLOAT,
-        default=0.0,
-        min=0.0,
-        max=200000.0,
-        step=500.0,
-        tier=ParameterTier.ADVANCED,
-        group="financing",
-        label="SBA 504 Misc Buffer ($)",
-        help="Extra amount added on top of 504-eligible equipment total plus contingency. Use for buildout odds-and-ends not fully itemized.",
-        affects=[]
-    ),
-        # =============================================================================
-    # GRANTS
-    # =============================================================================
-    "grant_amount": Parameter(
-        name="grant_amount",
-        type=ParameterType.FLOAT,
-        default=0.0,
-        min=0.0,
-        max=100000.0,
-        step=100.0,
-        tier=ParameterTier.ADVANCED,
-        group="grants",
-        label="Grant Amount ($)",
-        help="Non-dilutive grant funding received by the studio. Applied in the month specified by 'grant_month'.",
-        affects=[]
-    ),
-
-    "grant_month": Parameter(
-        name="grant_month",
-        type=ParameterType.INT,
-        default=-1,
-        min=-1,
-        max=60,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="grants",
-        label="Month Grant Arrives",
-        help="Month in which grant funds are added to the cash balance. 0 means received at start.",
-        affects=[]
-    ),
-
-    # =============================================================================
-    # MEMBERSHIP TRAJECTORY MODE
-    # =============================================================================
-    "MEMBERSHIP_MODE": Parameter(
-        name="MEMBERSHIP_MODE",
-        type=ParameterType.SELECT,
-        default="calculated",
-        options=["calculated", "manual_table", "piecewise_trends"],
-        tier=ParameterTier.ADVANCED,
-        group="membership_trajectory",
-        label="Membership Projection Method",
-        help=(
-            "How to determine membership over time: calculated from market dynamics, "
-            "manual month-by-month input, or piecewise trend specification."
-        ),
-        affects=[]
-    ),
-
-    # =============================================================================
-    # SIMULATION CONTROLS
-    # =============================================================================
-    "MONTHS": Parameter(
-        name="MONTHS",
-        type=ParameterType.INT,
-        default=60,
-        min=12,
-        max=120,
-        step=6,
-        tier=ParameterTier.ESSENTIAL,
-        group="simulation",
-        label="Simulation Horizon (months)",
-        help="Total months to simulate. Longer horizons show mature operations but increase runtime. 60 months (5 years) is typical.",
-        affects=[]
-    ),
-
-    "N_SIMULATIONS": Parameter(
-        name="N_SIMULATIONS",
-        type=ParameterType.INT,
-        default=100,
-        min=10,
-        max=300,
-        step=10,
-        tier=ParameterTier.ESSENTIAL,
-        group="simulation",
-        label="Number of Simulations",
-        help="Monte Carlo simulations to run. More runs give better percentile estimates but take longer. 100+ recommended.",
-        affects=[]
-    ),
-
-    "RANDOM_SEED": Parameter(
-        name="RANDOM_SEED",
-        type=ParameterType.INT,
-        default=42,
-        min=1,
-        max=999999,
-        step=1,
-        tier=ParameterTier.ADVANCED,
-        group="simulation",
-        label="Random Seed",
-        help="Random number generator seed for reproducible results. Change to explore different random worlds with same parameters.",
-        affects=[]
-    ),
-}
+# config key -> names of parameters whose visible_when_spec reads it. Parameters
+# that only have a visible_when callable can't be indexed and are listed in
+# DYNAMIC_VISIBILITY instead (re-evaluated on every change).
+VISIBILITY_DEPS, DYNAMIC_VISIBILITY = _build_visibility_deps(PARAMETERS)
+
+
+def build_param_order(params: Mapping[str, Parameter]) -> List[str]:
+    """
+    Order parameters so each one comes after everything in its depends_on.
+    
+    Kahn's algorithm, O(V + E). Parameters with no dependency relationship
+    keep their schema order. Names in depends_on that aren't in params are
+    ignored.
+    
+    Args:
+        params: Parameter dictionary to order
+        
+    Returns:
+        List of parameter names in dependency order
+        
+    Raises:
+        ValueError: If depends_on contains a cycle
+    """
+    in_degree = {name: 0 for name in params}
+    dependents: Dict[str, List[str]] = {name: [] for name in params}
+    
+    for name, param in params.items():
+        for dependency in param.depends_on:
+            if dependency in params:
+                dependents[dependency].append(name)
+                in_degree[name] += 1
+    
+    ready = deque(name for name, degree in in_degree.items() if degree == 0)
+    order = []
+    while ready:
+        name = ready.popleft()
+        order.append(name)
+        for dependent in dependents[name]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                ready.append(dependent)
+    
+    if len(order) != len(params):
+        remaining = [name for name, degree in in_degree.items() if degree > 0]
+        raise ValueError(f"cycle detected in depends_on: {', '.join(remaining)}")
+    
+    return order
+
+
+# Dependency order of all parameters; computing it also rejects cycles at import
+PARAM_ORDER = build_param_order(PARAMETERS)
 
 
 # =============================================================================
@@ -2863,6 +1070,9 @@ def get_defaults() -> Dict[str, Any]:
     """
     Get all parameter default values as a dictionary.
     
+    The defaults are collected once at import; each call returns a fresh
+    copy the caller is free to modify.
+    
     Returns:
         Dictionary mapping parameter names to their default values
         
@@ -2871,7 +1081,7 @@ def get_defaults() -> Dict[str, Any]:
         >>> print(defaults["RENT"])
         3500
     """
-    return {name: param.default for name, param in PARAMETERS.items()}
+    return _DEFAULTS.copy()
 
 
 def get_by_tier(tier: ParameterTier) -> Dict[str, Parameter]:
@@ -2889,7 +1099,7 @@ def get_by_tier(tier: ParameterTier) -> Dict[str, Parameter]:
         >>> print(len(essential))  # Should be 9
         9
     """
-    return {name: param for name, param in PARAMETERS.items() if param.tier == tier}
+    return {param.name: param for param in PARAMS_BY_TIER.get(tier, ())}
 
 
 def get_essential_params() -> Dict[str, Parameter]:
@@ -2924,7 +1134,196 @@ def get_by_group(group: str) -> Dict[str, Parameter]:
         >>> print(len(financing_params))
         25
     """
-    return {name: param for name, param in PARAMETERS.items() if param.group == group}
+    return {param.name: param for param in PARAMS_BY_GROUP.get(group, ())}
+
+
+def get_params(tier: Optional[ParameterTier] = None, group: Optional[str] = None) -> tuple[Parameter, ...]:
+    """
+    Get the precomputed parameter view for a tier and/or group.
+    
+    Unlike get_by_tier()/get_by_group() this does no copying; the returned
+    tuple is shared, in schema order.
+    
+    Args:
+        tier: Restrict to this tier (None = any tier)
+        group: Restrict to this group (None = any group)
+        
+    Returns:
+        Tuple of matching Parameter objects
+        
+    Example:
+        >>> [p.name for p in get_params(ParameterTier.ESSENTIAL, "pricing")]
+        ['PRICE']
+    """
+    if tier is None and group is None:
+        return _ALL_PARAMS
+    if group is None:
+        return PARAMS_BY_TIER.get(tier, ())
+    if tier is None:
+        return PARAMS_BY_GROUP.get(group, ())
+    return _PARAMS_BY_TIER_GROUP.get((tier, group), ())
+
+
+@functools.lru_cache(maxsize=64)
+def get_param_names(tier: Optional[ParameterTier] = None, group: Optional[str] = None) -> tuple[str, ...]:
+    """
+    Names of the parameters in get_params(tier, group), memoized.
+    
+    A tuple of names is cheap to hash, unlike a tuple of Parameter objects
+    (which hashes every field of every parameter), so use this to key
+    st.cache_data / session state on a panel's contents.
+    
+    Example:
+        >>> get_param_names(ParameterTier.ESSENTIAL, "pricing")
+        ('PRICE',)
+    """
+    return tuple(param.name for param in get_params(tier, group))
+
+
+# (name, converter) in PARAM_ORDER for freeze_config(); FLOAT/INT values are
+# normalized the way validation converts them, other types are kept as given
+_FREEZE_ORDER = tuple(
+    (name, {ParameterType.FLOAT: float, ParameterType.INT: int}.get(PARAMETERS[name].type))
+    for name in PARAM_ORDER
+)
+
+
+def _freeze_value(convert, value):
+    if convert is None:
+        return value
+    try:
+        return convert(value)
+    except (ValueError, TypeError):  # invalid values still get a (distinct) key
+        return value
+
+
+def freeze_config(config: Dict[str, Any]) -> tuple:
+    """
+    Canonical, hashable form of a config for use as a cache key.
+    
+    Values are emitted in PARAM_ORDER (missing names use their default), so
+    two configs with the same values produce the same key regardless of dict
+    insertion order or extra non-parameter keys. Numeric values are cast by
+    parameter type first, so 3500, 3500.0 and "3500" for a FLOAT parameter
+    give the same key. SCHEMA_VERSION is included so keys from an older
+    schema never match.
+    
+    Args:
+        config: Dictionary mapping parameter names to values
+        
+    Returns:
+        Tuple of (SCHEMA_VERSION, value, value, ...)
+        
+    Example:
+        >>> @st.cache_data(hash_funcs={dict: freeze_config})
+        ... def run_simulation(config: dict): ...
+    """
+    get = config.get
+    return (
+        SCHEMA_VERSION,
+        *[_freeze_value(convert, get(name, _DEFAULTS[name])) for name, convert in _FREEZE_ORDER],
+    )
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """
+    Stable hex digest of freeze_config(config).
+    
+    Unlike hash(), it's the same across processes and restarts, so it can key
+    st.cache_data entries or name saved results.
+    
+    Args:
+        config: Dictionary mapping parameter names to values
+    
+    Returns:
+        32-character hex string
+    
+    Example:
+        >>> config_hash({"PRICE": 185}) == config_hash({"PRICE": 185, "notes": "x"})
+        True
+    """
+    payload = json.dumps(freeze_config(config), separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def get_parameters_schema_bytes() -> bytes:
+    """
+    The whole schema serialized as UTF-8 JSON, built once and reused.
+    
+    One object per parameter with its constructor fields (type and tier by
+    name; visible_when callables are left out). Meant to be served or
+    downloaded verbatim; pair with get_parameters_schema_etag() for client
+    caching.
+    
+    Returns:
+        JSON bytes
+        
+    Example:
+        >>> st.download_button("Schema", get_parameters_schema_bytes(), "schema.json")
+    """
+    rows = []
+    for param in PARAMETERS.values():
+        row = param._asdict()
+        del row["visible_when"]
+        row["type"] = param.type.name.lower()
+        row["tier"] = param.tier.name.lower()
+        rows.append(row)
+    return json.dumps({"version": SCHEMA_VERSION, "parameters": rows}).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=1)
+def get_parameters_schema_etag() -> str:
+    """Content hash of get_parameters_schema_bytes(), for use as an HTTP ETag."""
+    return hashlib.sha256(get_parameters_schema_bytes()).hexdigest()
+
+
+@functools.lru_cache(maxsize=8)
+def resolve_preset(preset_name: str) -> Mapping[str, Any]:
+    """
+    Collect the values every parameter defines for a named preset.
+    
+    Resolved once per preset name and cached; the result is read-only and
+    meant to be merged into a config. If PARAMETERS is rebuilt, call
+    resolve_preset.cache_clear().
+    
+    Args:
+        preset_name: Preset key (e.g., "conservative", "professional")
+        
+    Returns:
+        Read-only mapping of parameter names to preset values
+        
+    Example:
+        >>> config.update(resolve_preset("conservative"))
+    """
+    return MappingProxyType({
+        name: param.presets[preset_name]
+        for name, param in PARAMETERS.items()
+        if param.presets and preset_name in param.presets
+    })
+
+
+def validate_with_message(param: Parameter, value: Any) -> tuple[bool, Optional[str]]:
+    """
+    Validate a value and return a human-readable result.
+    
+    Args:
+        param: Parameter to validate against
+        value: Value to check
+        
+    Returns:
+        (is_valid, error_message)
+        - (True, None) if valid
+        - (False, "error description") if invalid
+        
+    Example:
+        >>> validate_with_message(get_parameter("PRICE"), 50)
+        (False, 'Monthly Membership Price ($) must be >= 80')
+    """
+    code = param._validator(value)
+    if code:
+        return False, param.error_message(code)
+    return True, None
 
 
 def validate_params(param_dict: Dict[str, Any]) -> tuple[bool, Dict[str, str]]:
@@ -2955,13 +1354,88 @@ def validate_params(param_dict: Dict[str, Any]) -> tuple[bool, Dict[str, str]]:
             continue
             
         param = PARAMETERS[name]
-        is_valid, error_msg = param.validate(value)
-        if not is_valid:
-            errors[name] = error_msg
+        code = param.validate(value)
+        if code:
+            errors[name] = param.error_message(code)
     
     return len(errors) == 0, errors
 
 
+@functools.lru_cache(maxsize=1)
+def _config_adapter():
+    """
+    Compile the numeric, bool and select constraints into one pydantic validator.
+    
+    Built on first use (pydantic is slow to import) and validated in strict
+    mode, so it accepts a subset of what the per-parameter validators accept:
+    a pass is final, a failure just means the slow path produces the messages.
+    Text and JSON parameters aren't included.
+    
+    Returns:
+        (TypeAdapter, parameters left to their own validators), or
+        (None, all parameters) if pydantic isn't installed
+    """
+    try:
+        from typing import Annotated, Literal
+        from typing_extensions import TypedDict
+        from pydantic import Field, StrictBool, StrictFloat, StrictInt, TypeAdapter
+    except ImportError:
+        return None, _ALL_PARAMS
+    
+    fields_by_name = {}
+    rest = []
+    for param in _ALL_PARAMS:
+        tag = param._type_tag
+        if tag == _FLOAT or tag == _INT:
+            number = StrictFloat if tag == _FLOAT else StrictInt
+            fields_by_name[param.name] = Annotated[number, Field(ge=param.min, le=param.max)]
+        elif tag == _BOOL:
+            fields_by_name[param.name] = StrictBool
+        elif tag == _SELECT and param.options:
+            fields_by_name[param.name] = Literal[tuple(param.options)]
+        else:
+            rest.append(param)
+    
+    # total=False: missing names fall back to catalog defaults, which are valid
+    config_type = TypedDict("ConfigValues", fields_by_name, total=False)
+    return TypeAdapter(config_type), tuple(rest)
+
+
+def validate_config(config: Dict[str, Any]) -> List[str]:
+    """
+    Validate a complete config in one pass over the schema.
+    
+    Every parameter is checked (missing names use their default). The common
+    all-valid case is settled by a single compiled pydantic call; otherwise
+    each parameter's precompiled validator runs and messages are only looked
+    up for failures.
+    
+    Args:
+        config: Dictionary mapping parameter names to values
+        
+    Returns:
+        List of error messages (empty if the config is valid)
+        
+    Example:
+        >>> validate_config({"PRICE": -10})
+        ['Monthly Membership Price ($) must be >= 80']
+    """
+    adapter, params = _config_adapter()
+    if adapter is not None:
+        try:
+            adapter.validate_python(config, strict=True)
+        except ValueError:  # pydantic.ValidationError; report via the slow path
+            params = _ALL_PARAMS
+    
+    errors = []
+    get = config.get
+    for param in params:
+        code = param._validator(get(param.name, param.default))
+        if code:
+            errors.append(param.error_message(code))
+    return errors
+
+
 # =============================================================================
 # VERIFICATION TESTS
 # =============================================================================
@@ -2974,6 +1448,54 @@ if __name__ == "__main__":
     assert rent.default == 3500, "RENT default should be 3500"
     print("✓ Test 1: get_parameter()")
     
+    # Test 1b: Parameter instances are slotted and immutable
+    assert not hasattr(rent, "__dict__"), "Parameter should use __slots__"
+    assert not hasattr(rent.docs, "__dict__"), "ParameterDocs should use __slots__"
+    try:
+        rent.default = 0
+        raise AssertionError("Parameter should be frozen")
+    except AttributeError:  # dataclasses.FrozenInstanceError
+        pass
+    print("✓ Test 1b: Parameter and ParameterDocs are frozen and slotted")
+    
+    # Test 1c: relationship fields share the empty tuple and stay hashable
+    assert all(type(p.affects) is tuple for p in PARAMETERS.values())
+    assert rent.affects is Parameter.__dataclass_fields__["affects"].default, \
+        "empty affects should be the shared () default"
+    assert len({hash(p) for p in PARAMETERS.values()}) == len(PARAMETERS)
+    print("✓ Test 1c: affects is an immutable shared tuple")
+    
+    # Test 1c2: the catalog stays compact - one string object per group and
+    # name, and no widget-only state until something is rendered
+    shared_groups = {}
+    for p in PARAMETERS.values():
+        assert shared_groups.setdefault(p.group, p.group) is p.group, f"{p.name}: group not interned"
+        assert p.name is sys.intern(p.name), f"{p.name}: name not interned"
+        assert p._slider_kwargs is None and p._widget_key_default is None, f"{p.name}: widget state built early"
+    print("✓ Test 1c2: group and name strings shared, widget state deferred")
+    
+    # Test 1d: parameters survive a pickle round trip (e.g. to worker processes)
+    import pickle
+    restored = pickle.loads(pickle.dumps(dict(PARAMETERS)))
+    assert restored == PARAMETERS, "pickled catalog should compare equal"
+    assert restored["RENT"].validate(20000) == ERR_MAX, "validator should be rebuilt"
+    print("✓ Test 1d: Parameter pickles by constructor arguments")
+    
+    # Test 1e: NamedTuple-style copies rebuild derived state
+    wider = rent._replace(max=20000)
+    assert wider.validate(18000) == VALID and rent.validate(18000) == ERR_MAX
+    assert Parameter(**wider._asdict()) == wider
+    assert rent._replace(max=rent.max) is rent, "no-op _replace should reuse the instance"
+    print("✓ Test 1e: _replace()/_asdict()")
+    
+    # Test 1f: the catalog itself is read-only
+    try:
+        PARAMETERS["RENT"] = wider
+        raise AssertionError("PARAMETERS should be read-only")
+    except TypeError:
+        pass
+    print("✓ Test 1f: PARAMETERS is a read-only mapping")
+    
     # Test 2: get_defaults
     defaults = get_defaults()
     assert "RENT" in defaults, "RENT should be in defaults"
@@ -2993,6 +1515,8 @@ if __name__ == "__main__":
     # Test 5: get_by_group
     financing = get_by_group("financing")
     assert len(financing) > 0, "Should have financing parameters"
+    runtime_group = "".join(["finan", "cing"])
+    assert Parameter("X", ParameterType.BOOL, True, group=runtime_group).group is PARAMETERS["FINANCE_FEES_504"].group
     print(f"✓ Test 5: get_by_group() - found {len(financing)} financing params")
     
     # Test 6: validate_params
@@ -3007,6 +1531,89 @@ if __name__ == "__main__":
     assert "RENT" in errors, "RENT should have validation error"
     print("✓ Test 6b: validate_params() - invalid input")
     
+    # Test 6c: validate_config
+    assert validate_config(get_defaults()) == [], "Defaults should pass validate_config"
+    assert len(validate_config({"RENT": -1000})) == 1, "Bad RENT should give one error"
+    assert validate_config({"EVENT_MUG_COST_RANGE": "[4.5,"}) == ["Bisque Mug Cost Range must be valid JSON"]
+    for bad in ("5", "[5]", "[4.5, 7.5, 9]", '["4.5", 7.5]', "[true, 7.5]"):
+        assert validate_config({"EVENT_MUG_COST_RANGE": bad}) == \
+            ["Bisque Mug Cost Range must be a [low, high] pair of numbers"], bad
+    # Overflows to inf with the stdlib parser; orjson rejects it as invalid JSON
+    assert len(validate_config({"EVENT_MUG_COST_RANGE": "[4.5, 1e999]"})) == 1
+    for bad in ("10", "[]", '{"a": 1}'):
+        assert len(validate_config({"ATTENDEES_PER_EVENT_RANGE": bad})) == 1, bad
+    assert validate_config({"ATTENDEES_PER_EVENT_RANGE": "[6]"}) == []
+    assert PARSED_DEFAULTS["ATTENDEES_PER_EVENT_RANGE"] == (8, 10, 12)
+    assert all(p.validate(p.default) == VALID for p in PARAMETERS.values()), \
+        "catalog defaults must be valid; validate_config's fast path relies on it"
+    assert validate_config({"MAX_MEMBERS": "77"}) == [], "numeric strings still pass via the slow path"
+    print("✓ Test 6c: validate_config()")
+    
+    # Test 6d: catalog rows are internally consistent. Construction only
+    # checks the enum types, so the authored values are checked here
+    for p in PARAMETERS.values():
+        if p.min is not None and p.max is not None:
+            assert p.min <= p.max, f"{p.name}: min > max"
+        if p.step is not None:
+            assert p.step > 0, f"{p.name}: step must be positive"
+        assert Parameter(**p._asdict()) == p, f"{p.name}: keyword rebuild differs"
+    for bad in ({"type": ParameterTier.ADVANCED}, {"tier": ParameterType.FLOAT}):
+        try:
+            rent._replace(**bad)
+            raise AssertionError(f"{bad} should raise TypeError")
+        except TypeError:
+            pass
+    # Trailing row objects reach the constructor and feed the visibility index
+    fee = PARAMETERS["WORKSHOP_FEE"]
+    assert fee.visible_when_spec == {"WORKSHOPS_ENABLED": True}
+    assert "WORKSHOP_FEE" in VISIBILITY_DEPS["WORKSHOPS_ENABLED"]
+    assert fee.is_visible({}) and not fee.is_visible({"WORKSHOPS_ENABLED": False})
+    assert PARAMETERS["CLASSES_CALENDAR_MODE"].options == ("monthly", "semester"), "options and extras together"
+    print("✓ Test 6d: catalog rows are consistent")
+    
+    # Test 7: get_params views agree with the dict helpers
+    assert get_params(ParameterTier.ESSENTIAL) == tuple(essential.values()), "Tier view should match get_by_tier"
+    assert get_params(group="financing") == tuple(financing.values()), "Group view should match get_by_group"
+    assert [p.name for p in get_params(ParameterTier.ESSENTIAL, "pricing")] == ["PRICE"]
+    assert get_params(group="financing") is get_params(group="financing"), "views should be shared, not rebuilt"
+    assert get_param_names(group="financing") == tuple(financing), "names should follow get_params order"
+    assert get_param_names(group="financing") is get_param_names(group="financing"), "names should be memoized"
+    try:
+        PARAMS_BY_GROUP["financing"] = ()
+        raise AssertionError("PARAMS_BY_GROUP should be read-only")
+    except TypeError:
+        pass
+    print("✓ Test 7: get_params()")
+    
+    # Test 8: build_param_order
+    assert len(PARAM_ORDER) == len(PARAMETERS), "PARAM_ORDER should cover every parameter"
+    ordered = build_param_order({
+        "B": Parameter(name="B", type=ParameterType.FLOAT, default=0.5, depends_on=("A",)),
+        "A": Parameter(name="A", type=ParameterType.FLOAT, default=0.5),
+    })
+    assert ordered == ["A", "B"], f"A should come before B, got {ordered}"
+    try:
+        build_param_order({
+            "A": Parameter(name="A", type=ParameterType.FLOAT, default=0.5, depends_on=("B",)),
+            "B": Parameter(name="B", type=ParameterType.FLOAT, default=0.5, depends_on=("A",)),
+        })
+        raise AssertionError("Cycle should raise ValueError")
+    except ValueError:
+        pass
+    print("✓ Test 8: build_param_order()")
+    
+    # Test 9: config_hash()
+    key = config_hash({"PRICE": 185, "RENT": 4000})
+    assert key == config_hash({"RENT": 4000, "PRICE": 185, "notes": "x"}), "key should ignore order and extra keys"
+    assert key == config_hash({"PRICE": 185, "RENT": 4000, "N_SIMULATIONS": PARAMETERS["N_SIMULATIONS"].default})
+    assert key != config_hash({"PRICE": 190, "RENT": 4000}), "changed value should change key"
+    assert len(key) == 32
+    assert config_hash({}) == config_hash({"RENT": 3500.0}), "int default and slider float should share a key"
+    assert config_hash({"PRICE": 185}) == config_hash({"PRICE": "185"}) == config_hash({"PRICE": 185.0})
+    assert config_hash({"MAX_MEMBERS": 77}) == config_hash({"MAX_MEMBERS": "77"})
+    assert config_hash({"PRICE": "abc"}) != config_hash({}), "invalid values still get a key"
+    print("✓ Test 9: config_hash()")
+    
     print("\n" + "=" * 60)
     print("✅ ALL TESTS PASSED!")
     print("=" * 60)
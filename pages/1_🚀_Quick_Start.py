@@ -8,15 +8,11 @@ Get started in 8 simple questions. We'll set up your studio scenario and run you
 
 import streamlit as st
 
-# Page configuration
-st.set_page_config(
-    page_title="Quick Start",
-    page_icon="🚀",
-    layout="wide"
-)
+from ui.components import configure_page
 
 def main():
     """Main function for Quick Start page"""
+    configure_page("Quick Start", "🚀")
     st.title("🚀 Quick Start")
 
     st.markdown("""
@@ -8,15 +8,11 @@ Configure all revenue streams including memberships, classes, workshops, and eve
 
 import streamlit as st
 
-# Page configuration
-st.set_page_config(
-    page_title="Revenue Configuration",
-    page_icon="💰",
-    layout="wide"
-)
+from ui.components import configure_page
 
 def main():
     """Main function for Revenue Configuration page"""
+    configure_page("Revenue Configuration", "💰")
     st.title("💰 Revenue Configuration")
 
     st.markdown("""
@@ -8,15 +8,11 @@ Define operating expenses, utilities, staffing, and consumables for your pottery
 
 import streamlit as st
 
-# Page configuration
-st.set_page_config(
-    page_title="Costs & Operations",
-    page_icon="💸",
-    layout="wide"
-)
+from ui.components import configure_page
 
 def main():
     """Main function for Costs & Operations page"""
+    configure_page("Costs & Operations", "💸")
     st.title("💸 Costs & Operations")
 
     st.markdown("""
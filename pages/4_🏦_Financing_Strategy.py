@@ -8,15 +8,11 @@ Set up your financing mix including SBA loans, private loans, and owner equity,
 
 import streamlit as st
 
-# Page configuration
-st.set_page_config(
-    page_title="Financing Strategy",
-    page_icon="🏦",
-    layout="wide"
-)
+from ui.components import configure_page
 
 def main():
     """Main function for Financing Strategy page"""
+    configure_page("Financing Strategy", "🏦")
     st.title("🏦 Financing Strategy")
 
     st.markdown("""
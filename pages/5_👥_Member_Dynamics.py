@@ -8,15 +8,11 @@ Model member acquisition, retention, churn, and archetype behavior over time.
 
 import streamlit as st
 
-# Page configuration
-st.set_page_config(
-    page_title="Member Dynamics",
-    page_icon="👥",
-    layout="wide"
-)
+from ui.components import configure_page
 
 def main():
     """Main function for Member Dynamics page"""
+    configure_page("Member Dynamics", "👥")
     st.title("👥 Member Dynamics")
 
     st.markdown("""
@@ -8,15 +8,11 @@ Access expert-level controls to fine-tune simulation parameters and assumptions.
 
 import streamlit as st
 
-# Page configuration
-st.set_page_config(
-    page_title="Advanced Tuning",
-    page_icon="🔬",
-    layout="wide"
-)
+from ui.components import configure_page
 
 def main():
     """Main function for Advanced Tuning page"""
+    configure_page("Advanced Tuning", "🔬")
     st.title("🔬 Advanced Tuning")
 
     st.markdown("""
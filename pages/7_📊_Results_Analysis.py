@@ -8,21 +8,21 @@ Visualize simulation outputs, compare scenarios, and review risk metrics and per
 
 import streamlit as st
 
-# Page configuration
-st.set_page_config(
-    page_title="Results Analysis",
-    page_icon="📊",
-    layout="wide"
-)
+from ui.components import clear_simulation_cache, configure_page
 
 def main():
     """Main function for Results Analysis page"""
+    configure_page("Results Analysis", "📊")
     st.title("📊 Results Analysis")
 
     st.markdown("""
     Visualize simulation outputs, compare scenarios, and review risk metrics and percentiles.
     """)
 
+    with st.sidebar:
+        if st.button("🔄 Clear cached results", help="Re-run simulations instead of reusing earlier results"):
+            clear_simulation_cache()
+
     # TODO: Implement page content
     st.info("⚠️ Page under construction")
 
@@ -8,15 +8,11 @@ Save, load, clone, and compare studio scenarios across different configurations.
 
 import streamlit as st
 
-# Page configuration
-st.set_page_config(
-    page_title="Scenario Management",
-    page_icon="⚙️",
-    layout="wide"
-)
+from ui.components import configure_page
 
 def main():
     """Main function for Scenario Management page"""
+    configure_page("Scenario Management", "⚙️")
     st.title("⚙️ Scenario Management")
 
     st.markdown("""
@@ -3,5 +3,41 @@
 """
 costs.py - Fixed and variable cost calculations
 
-TODO: Implementation pending
+Month-of-year dependent costs are precomputed as 12-entry arrays (January
+first, like models.SEASONALITY_KEYS) and indexed with month_idx % 12, so the
+monthly loop has no calendar branches and whole runs can be summed in one
+NumPy call.
+
+TODO: Remaining cost calculations pending
 """
+
+from typing import Any, Dict
+
+import numpy as np
+
+from config.parameter_schema import PARAMETERS
+
+# Heating season, January first: October through March
+HEATING_SEASON = np.array(
+    [True, True, True, False, False, False, False, False, False, True, True, True]
+)
+HEATING_SEASON.flags.writeable = False
+
+
+def build_heating_cost_vector(config: Dict[str, Any]) -> np.ndarray:
+    """
+    Monthly heating cost for each month of the year.
+    
+    Args:
+        config: Parameter values; missing names fall back to defaults
+    
+    Returns:
+        float64 array of shape (12,), January first
+    
+    Example:
+        >>> heating = build_heating_cost_vector(config)
+        >>> total_heating = heating[np.arange(n_months) % 12].sum()
+    """
+    winter = config.get("HEATING_COST_WINTER", PARAMETERS["HEATING_COST_WINTER"].default)
+    summer = config.get("HEATING_COST_SUMMER", PARAMETERS["HEATING_COST_SUMMER"].default)
+    return np.where(HEATING_SEASON, float(winter), float(summer))
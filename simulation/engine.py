@@ -3,5 +3,518 @@
 """
 engine.py - Core Monte Carlo simulation engine
 
-TODO: Implementation pending
+The monthly cash-flow arithmetic runs in one kernel over (n_trials, n_months)
+arrays. Parameters come in as the flat float64 "values" array from
+models.build_param_arrays(), read by fixed index, and everything that doesn't
+vary by month is folded into a DerivedParams tuple once per scenario, so the
+kernel never touches a dict or repeats a scalar product. The smaller
+firing-schedule and self-employment tax kernels read the values array the
+same way. Kernels are compiled with Numba when it's installed; otherwise the
+same array expressions run in NumPy.
+
+simulate() runs a whole scenario: every trial advances together, so the only
+Python loop is over months (inside members.simulate_members), and all other
+random draws are made for the full (n_trials, n_months) grid up front.
+simulate_parallel() splits the trials into fixed-size blocks, each with its
+own SeedSequence child stream, and runs them across processes. The only tax
+modelled is self-employment tax for pass-through entities; net_cash takes off
+loan debt service, owner draw and that tax, and adds grants.
 """
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, NamedTuple, Optional
+
+import numpy as np
+
+from config.parameter_schema import PARAMETERS, ParameterType
+from simulation.costs import build_heating_cost_vector
+from simulation.financial import debt_service_schedule, grant_schedule, owner_draw_schedule
+from simulation.members import sample_clay_bags, simulate_members
+from simulation.models import (
+    ARCHETYPES,
+    NAME_TO_IDX,
+    build_clay_usage_table,
+    build_param_arrays,
+    build_seasonality_vector,
+    coerce_config,
+    event_mug_cost_bounds,
+)
+from simulation.revenue import sample_event_attendees, sample_event_counts
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # same kernel, run as plain NumPy array expressions
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Trials per random stream in simulate_parallel(). Fixed rather than derived
+# from the worker count, so results don't depend on how many workers run.
+_BLOCK_TRIALS = 25
+
+# ENTITY_TYPE values whose profit passes through to the owner and so owes
+# self-employment tax
+_PASS_THROUGH_ENTITIES = ("sole_prop", "partnership")
+
+# Positions in the build_param_arrays() "values" array read by the kernel.
+# Module-level ints are compile-time constants to Numba.
+_PRICE = NAME_TO_IDX["PRICE"]
+_RETAIL_CLAY_PRICE = NAME_TO_IDX["RETAIL_CLAY_PRICE_PER_BAG"]
+_WHOLESALE_CLAY_COST = NAME_TO_IDX["WHOLESALE_CLAY_COST_PER_BAG"]
+_WATER_COST_PER_GALLON = NAME_TO_IDX["WATER_COST_PER_GALLON"]
+_GALLONS_PER_BAG = NAME_TO_IDX["GALLONS_PER_BAG_CLAY"]
+_WORKSHOPS_ENABLED = NAME_TO_IDX["WORKSHOPS_ENABLED"]
+_WORKSHOPS_PER_MONTH = NAME_TO_IDX["WORKSHOPS_PER_MONTH"]
+_WORKSHOP_ATTENDANCE = NAME_TO_IDX["WORKSHOP_AVG_ATTENDANCE"]
+_WORKSHOP_FEE = NAME_TO_IDX["WORKSHOP_FEE"]
+_WORKSHOP_COST = NAME_TO_IDX["WORKSHOP_COST_PER_EVENT"]
+_CLASSES_ENABLED = NAME_TO_IDX["CLASSES_ENABLED"]
+_CLASS_COHORTS = NAME_TO_IDX["CLASS_COHORTS_PER_MONTH"]
+_CLASS_CAP = NAME_TO_IDX["CLASS_CAP_PER_COHORT"]
+_CLASS_FILL = NAME_TO_IDX["CLASS_FILL_MEAN"]
+_CLASS_PRICE = NAME_TO_IDX["CLASS_PRICE"]
+_CLASS_COST_PER_STUDENT = NAME_TO_IDX["CLASS_COST_PER_STUDENT"]
+_CLASS_INSTR_RATE = NAME_TO_IDX["CLASS_INSTR_RATE_PER_HR"]
+_CLASS_HOURS = NAME_TO_IDX["CLASS_HOURS_PER_COHORT"]
+_TICKET_PRICE = NAME_TO_IDX["TICKET_PRICE"]
+_EVENT_CONSUMABLES = NAME_TO_IDX["EVENT_CONSUMABLES_PER_PERSON"]
+_EVENT_STAFF_RATE = NAME_TO_IDX["EVENT_STAFF_RATE_PER_HOUR"]
+_EVENT_HOURS = NAME_TO_IDX["EVENT_HOURS_PER_EVENT"]
+_STUDIO_COUNT = NAME_TO_IDX["DESIGNATED_STUDIO_COUNT"]
+_STUDIO_PRICE = NAME_TO_IDX["DESIGNATED_STUDIO_PRICE"]
+_STUDIO_OCCUPANCY = NAME_TO_IDX["DESIGNATED_STUDIO_BASE_OCCUPANCY"]
+_RENT = NAME_TO_IDX["RENT"]
+_RENT_GROWTH = NAME_TO_IDX["RENT_GROWTH_PCT"]
+_INSURANCE = NAME_TO_IDX["INSURANCE_COST"]
+_GLAZE = NAME_TO_IDX["GLAZE_COST_PER_MONTH"]
+_MAINTENANCE = NAME_TO_IDX["MAINTENANCE_BASE_COST"]
+_MARKETING = NAME_TO_IDX["MARKETING_COST_BASE"]
+_STAFF = NAME_TO_IDX["STAFF_COST_PER_MONTH"]
+_STAFF_THRESHOLD = NAME_TO_IDX["STAFF_EXPANSION_THRESHOLD"]
+_COST_PER_KWH = NAME_TO_IDX["COST_PER_KWH"]
+_KWH_KILN_1 = NAME_TO_IDX["KWH_PER_FIRING_KMT1027"]
+_KWH_KILN_2 = NAME_TO_IDX["KWH_PER_FIRING_KMT1427"]
+_DYNAMIC_FIRINGS = NAME_TO_IDX["DYNAMIC_FIRINGS"]
+_BASE_FIRINGS = NAME_TO_IDX["BASE_FIRINGS_PER_MONTH"]
+_REFERENCE_MEMBERS = NAME_TO_IDX["REFERENCE_MEMBERS_FOR_BASE_FIRINGS"]
+_MIN_FIRINGS = NAME_TO_IDX["MIN_FIRINGS_PER_MONTH"]
+_MAX_FIRINGS = NAME_TO_IDX["MAX_FIRINGS_PER_MONTH"]
+_SE_SOC_SEC_RATE = NAME_TO_IDX["SE_SOC_SEC_RATE"]
+_SE_MEDICARE_RATE = NAME_TO_IDX["SE_MEDICARE_RATE"]
+_SE_WAGE_BASE = NAME_TO_IDX["SE_SOC_SEC_WAGE_BASE"]
+
+
+class DerivedParams(NamedTuple):
+    """
+    Scenario-level constants for monthly_cashflow(), from derive_params().
+    
+    All float so Numba sees a uniform tuple of float64.
+    """
+    member_price: float
+    clay_margin_per_bag: float
+    event_margin_per_attendee: float
+    event_staff_cost_per_event: float
+    class_instr_cost_per_cohort: float
+    other_income_per_month: float
+    fixed_cost_per_month: float
+    rent: float
+    rent_growth: float
+    staff_cost_per_month: float
+    staff_threshold: float
+    kiln_cost_per_firing: float
+
+
+def derive_params(values: np.ndarray) -> DerivedParams:
+    """
+    Fold the month-invariant parameter arithmetic into scalars.
+    
+    Computed once per scenario. Workshops, classes and designated studios
+    contribute their expected monthly net as other_income_per_month;
+    fixed_cost_per_month excludes rent (which grows), heating (which is
+    seasonal) and staff (hired once members reach the threshold). Firings
+    are assumed to alternate between the two kilns.
+    
+    Args:
+        values: float64 "values" array from build_param_arrays()
+    
+    Returns:
+        DerivedParams
+    
+    Example:
+        >>> derived = derive_params(build_param_arrays(config)["values"])
+        >>> derived.class_instr_cost_per_cohort
+        540.0
+    """
+    v = values.tolist()
+    
+    class_instr_cost_per_cohort = v[_CLASS_INSTR_RATE] * v[_CLASS_HOURS]
+    workshops = v[_WORKSHOPS_ENABLED] * v[_WORKSHOPS_PER_MONTH] * (
+        v[_WORKSHOP_ATTENDANCE] * v[_WORKSHOP_FEE] - v[_WORKSHOP_COST]
+    )
+    classes = v[_CLASSES_ENABLED] * v[_CLASS_COHORTS] * (
+        v[_CLASS_CAP] * v[_CLASS_FILL] * (v[_CLASS_PRICE] - v[_CLASS_COST_PER_STUDENT])
+        - class_instr_cost_per_cohort
+    )
+    studios = v[_STUDIO_COUNT] * v[_STUDIO_PRICE] * v[_STUDIO_OCCUPANCY]
+    
+    return DerivedParams(
+        member_price=v[_PRICE],
+        clay_margin_per_bag=(
+            v[_RETAIL_CLAY_PRICE] - v[_WHOLESALE_CLAY_COST]
+            - v[_GALLONS_PER_BAG] * v[_WATER_COST_PER_GALLON]
+        ),
+        event_margin_per_attendee=v[_TICKET_PRICE] - v[_EVENT_CONSUMABLES],
+        event_staff_cost_per_event=v[_EVENT_STAFF_RATE] * v[_EVENT_HOURS],
+        class_instr_cost_per_cohort=class_instr_cost_per_cohort,
+        other_income_per_month=workshops + classes + studios,
+        fixed_cost_per_month=v[_INSURANCE] + v[_GLAZE] + v[_MAINTENANCE] + v[_MARKETING],
+        rent=v[_RENT],
+        rent_growth=v[_RENT_GROWTH],
+        staff_cost_per_month=v[_STAFF],
+        staff_threshold=v[_STAFF_THRESHOLD],
+        kiln_cost_per_firing=v[_COST_PER_KWH] * (v[_KWH_KILN_1] + v[_KWH_KILN_2]) / 2.0,
+    )
+
+
+@njit(cache=True, fastmath=True)
+def monthly_cashflow(derived, members, clay_bags, event_counts, event_attendees, heating, mug_cost):
+    """
+    Operating cash flow for every month of every trial.
+    
+    Before financing, taxes and owner draw. Workshops, classes and
+    designated studios use their expected monthly amounts; member, clay and
+    event quantities come from the sampled arrays. Staff is paid in months
+    with members at or above the hiring threshold.
+    
+    Args:
+        derived: DerivedParams from derive_params()
+        members: (n_trials, n_months) active members
+        clay_bags: (n_trials, n_months) bags of clay sold
+        event_counts: (n_trials, n_months) events held
+        event_attendees: (n_trials, n_months) total event attendees
+        heating: (12,) heating cost by calendar month, January first
+        mug_cost: Expected bisque mug cost per event attendee
+    
+    Returns:
+        float64 array of shape (n_trials, n_months)
+    
+    Example:
+        >>> derived = derive_params(build_param_arrays(config)["values"])
+        >>> low, high = event_mug_cost_bounds(config)
+        >>> cash = monthly_cashflow(derived, members, bags, events, attendees,
+        ...                         build_heating_cost_vector(config), (low + high) / 2)
+    """
+    months = np.arange(members.shape[1])
+    
+    # Per-month fixed costs; rent steps up once a year
+    fixed = (
+        derived.rent * (1.0 + derived.rent_growth) ** (months // 12)
+        + heating[months % 12]
+        + derived.fixed_cost_per_month
+    )
+    
+    return (
+        members * derived.member_price
+        - (members >= derived.staff_threshold) * derived.staff_cost_per_month
+        + clay_bags * derived.clay_margin_per_bag
+        + event_attendees * (derived.event_margin_per_attendee - mug_cost)
+        - event_counts * derived.event_staff_cost_per_event
+        + (derived.other_income_per_month - fixed)
+    )
+
+
+@njit(cache=True, fastmath=True)
+def firings_per_month(values, members):
+    """
+    Kiln firings for every month of every trial.
+    
+    With DYNAMIC_FIRINGS on, BASE_FIRINGS_PER_MONTH scales with members
+    relative to REFERENCE_MEMBERS_FOR_BASE_FIRINGS, rounded to whole firings
+    and kept within [MIN_FIRINGS_PER_MONTH, MAX_FIRINGS_PER_MONTH]; with it
+    off every month uses the base rate.
+    
+    Args:
+        values: float64 "values" array from build_param_arrays()
+        members: (n_trials, n_months) active members
+    
+    Returns:
+        float64 array shaped like members
+    
+    Example:
+        >>> kwh = firings_per_month(values, members) * values[NAME_TO_IDX["KWH_PER_FIRING_KMT1027"]]
+    """
+    base = values[_BASE_FIRINGS]
+    if values[_DYNAMIC_FIRINGS] == 0.0:
+        return np.full(members.shape, base)
+    
+    scaled = np.rint(base * members / values[_REFERENCE_MEMBERS])
+    return np.minimum(np.maximum(scaled, values[_MIN_FIRINGS]), values[_MAX_FIRINGS])
+
+
+@njit(cache=True, fastmath=True)
+def self_employment_tax(values, annual_profit):
+    """
+    Self-employment tax on pass-through profit, per trial and year.
+    
+    Net earnings are profit less the deductible employer half of the SE
+    rates (92.35% at the default rates). Social Security applies up to
+    SE_SOC_SEC_WAGE_BASE, Medicare to all earnings; losses owe nothing.
+    Only applies to entity types taxed on pass-through profit - choosing
+    which trials that is happens in the caller.
+    
+    Args:
+        values: float64 "values" array from build_param_arrays()
+        annual_profit: Array of annual net profit, any shape
+    
+    Returns:
+        float64 array shaped like annual_profit
+    
+    Example:
+        >>> yearly = cash.reshape(n_trials, -1, 12).sum(axis=2)
+        >>> se_tax = self_employment_tax(values, yearly)
+    """
+    ss_rate = values[_SE_SOC_SEC_RATE]
+    medicare_rate = values[_SE_MEDICARE_RATE]
+    
+    earnings = np.maximum(annual_profit, 0.0) * (1.0 - (ss_rate + medicare_rate) / 2.0)
+    return np.minimum(earnings, values[_SE_WAGE_BASE]) * ss_rate + earnings * medicare_rate
+
+
+def simulate(config: Dict[str, Any], rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+    """
+    Run the Monte Carlo simulation for one scenario.
+    
+    N_SIMULATIONS trials of MONTHS months, starting in January with no
+    members. Beyond monthly_cashflow(), operating cash covers kiln
+    electricity, unplanned maintenance (normal around the base cost, never
+    below zero in total) and the launch marketing ramp. Loan payments are
+    the same in every trial, so they're scheduled once and broadcast. For a
+    sole_prop or partnership ENTITY_TYPE, self_employment_tax() is charged
+    on each year's operating cash less loan interest (a partial final year
+    counts on its own) in that year's last month.
+    Numeric values are converted with coerce_config() first, so anything
+    validate_config() accepts (such as "185") simulates.
+    
+    Parameters the simulation doesn't model yet, and so ignores:
+    - MEMBERSHIP_MODE: membership is always calculated from market dynamics
+    - Studio capacity and usage: WHEELS_CAPACITY, HANDBUILDING_CAPACITY,
+      GLAZE_CAPACITY, their *_ALPHA, OPEN_HOURS_PER_WEEK and each
+      archetype's *_SESSIONS_PER_WEEK and *_SESSION_HOURS (capacity is
+      MAX_MEMBERS and the crowding terms)
+    - Conversion into membership: WORKSHOP_CONV_RATE, WORKSHOP_CONV_LAG_MO,
+      CLASS_CONV_RATE, CLASS_CONV_LAG_MO, CLASS_EARLY_CHURN_MULT
+    - Class calendar: CLASSES_CALENDAR_MODE, CLASS_SEMESTER_LENGTH_MONTHS
+      (CLASS_COHORTS_PER_MONTH cohorts run every month)
+    - Loan sizing and reserves: LOAN_CONTINGENCY_PCT, RUNWAY_MONTHS,
+      EXTRA_BUFFER, EXTRA_504_BUFFER, OWNER_STIPEND_MONTHS, RESERVE_FLOOR,
+      FEES_PACKAGING, FEES_CLOSING (loans use the *_AMOUNT_OVERRIDE values)
+    - Income, payroll and sales taxes: MA_PERSONAL_INCOME_TAX_RATE,
+      SCORP_OWNER_SALARY_PER_MONTH, FED_CORP_TAX_RATE, MA_CORP_TAX_RATE,
+      MA_SALES_TAX_RATE (s_corp and c_corp owe no tax here)
+    
+    Args:
+        config: Parameter values; missing names fall back to defaults
+        rng: NumPy random generator (default: seeded with RANDOM_SEED)
+    
+    Returns:
+        Dictionary of (N_SIMULATIONS, MONTHS) arrays:
+        - "members": active members at month end
+        - "firings": kiln firings
+        - "clay_bags": clay bags sold
+        - "event_counts", "event_attendees": events held and total attendees
+        - "operating_cash": cash flow before financing, taxes and owner draw
+        - "taxes": self-employment tax, in the last month of each year
+        - "net_cash": operating cash less loan interest and principal,
+          owner draw and taxes, plus grants
+        plus (MONTHS,) arrays "interest", "principal_payments",
+        "owner_draw" and "grants"
+    
+    Example:
+        >>> results = simulate({"PRICE": 185})
+        >>> np.percentile(results["operating_cash"].sum(axis=1), [10, 50, 90])
+    """
+    config = coerce_config(config)
+    
+    def get(name):
+        return config.get(name, PARAMETERS[name].default)
+    
+    n_trials, n_months = int(get("N_SIMULATIONS")), int(get("MONTHS"))
+    if rng is None:
+        rng = np.random.default_rng(get("RANDOM_SEED"))
+    
+    values = build_param_arrays(config)["values"]
+    derived = derive_params(values)
+    seasonality = build_seasonality_vector(config)
+    
+    counts = simulate_members(rng, config, n_trials, n_months, seasonality)
+    members = counts.sum(axis=2).astype(np.float64)
+    clay_bags = sample_clay_bags(rng, counts, build_clay_usage_table(config))
+    events = sample_event_counts(rng, config, n_trials, n_months, seasonality)
+    attendees = sample_event_attendees(rng, config, events)
+    low, high = event_mug_cost_bounds(config)
+    
+    cash = monthly_cashflow(
+        derived, members, clay_bags, events, attendees,
+        build_heating_cost_vector(config), (low + high) / 2.0,
+    )
+    firings = firings_per_month(values, members)
+    
+    maintenance_base = get("MAINTENANCE_BASE_COST")
+    maintenance_shock = np.maximum(
+        rng.normal(0.0, get("MAINTENANCE_RANDOM_STD"), size=(n_trials, n_months)),
+        -maintenance_base,
+    )
+    marketing_ramp = np.where(
+        np.arange(n_months) < get("MARKETING_RAMP_MONTHS"),
+        get("MARKETING_COST_BASE") * (get("MARKETING_RAMP_MULTIPLIER") - 1.0),
+        0.0,
+    )
+    cash -= firings * derived.kiln_cost_per_firing + maintenance_shock + marketing_ramp
+    interest, principal_pmt = debt_service_schedule(config, n_months)
+    owner_draw = owner_draw_schedule(config, n_months)
+    grants = grant_schedule(config, n_months)
+    
+    taxes = np.zeros((n_trials, n_months))
+    if get("ENTITY_TYPE") in _PASS_THROUGH_ENTITIES:
+        year_starts = np.arange(0, n_months, 12)
+        yearly_profit = np.add.reduceat(cash - interest, year_starts, axis=1)
+        year_ends = np.minimum(year_starts + 12, n_months) - 1
+        taxes[:, year_ends] = self_employment_tax(values, yearly_profit)
+    
+    return {
+        "members": members,
+        "firings": firings,
+        "clay_bags": clay_bags,
+        "event_counts": events,
+        "event_attendees": attendees,
+        "operating_cash": cash,
+        "taxes": taxes,
+        "net_cash": cash - (interest + principal_pmt + owner_draw - grants) - taxes,
+        "interest": interest,
+        "principal_payments": principal_pmt,
+        "owner_draw": owner_draw,
+        "grants": grants,
+    }
+
+
+def _simulate_block(config: Dict[str, Any], seed: np.random.SeedSequence) -> Dict[str, np.ndarray]:
+    return simulate(config, np.random.default_rng(seed))
+
+
+def simulate_parallel(config: Dict[str, Any], n_workers: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Run simulate() with the trials spread over worker processes.
+    
+    Trials are split into blocks of _BLOCK_TRIALS, and each block draws from
+    its own child of SeedSequence(RANDOM_SEED), so the streams are
+    statistically independent and the result is the same for any n_workers.
+    It differs from a serial simulate() run, which uses a single stream.
+    
+    Args:
+        config: Parameter values; missing names fall back to defaults
+        n_workers: Worker processes (default: one per CPU)
+    
+    Returns:
+        Same dictionary as simulate()
+    
+    Example:
+        >>> results = simulate_parallel({"N_SIMULATIONS": 300}, n_workers=4)
+    """
+    config = coerce_config(config)
+    
+    def get(name):
+        return config.get(name, PARAMETERS[name].default)
+    
+    n_trials = int(get("N_SIMULATIONS"))
+    starts = range(0, n_trials, _BLOCK_TRIALS)
+    configs = [
+        {**config, "N_SIMULATIONS": min(_BLOCK_TRIALS, n_trials - start)} for start in starts
+    ]
+    seeds = np.random.SeedSequence(get("RANDOM_SEED")).spawn(len(configs))
+    
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        blocks = list(pool.map(_simulate_block, configs, seeds))
+    
+    # Per-trial arrays are stacked; per-month schedules are shared by all blocks
+    return {
+        key: np.concatenate([block[key] for block in blocks]) if value.ndim == 2 else value
+        for key, value in blocks[0].items()
+    }
+
+
+if HAVE_NUMBA:
+    # Compile (or load from the on-disk cache) now so the first real run
+    # doesn't pay for it; shapes don't matter, only dtypes
+    try:
+        _grid = np.zeros((1, 1))
+        monthly_cashflow(
+            derive_params(np.zeros(len(NAME_TO_IDX))), _grid, _grid,
+            np.zeros((1, 1), dtype=np.int64), _grid, np.zeros(12), 0.0,
+        )
+        firings_per_month(np.zeros(len(NAME_TO_IDX)), _grid)
+        self_employment_tax(np.zeros(len(NAME_TO_IDX)), _grid)
+    except Exception:  # the uncompiled error surfaces again on first real use
+        pass
+
+
+# =============================================================================
+# VERIFICATION TESTS
+# =============================================================================
+# Run from the repository root: python -m simulation.engine
+
+if __name__ == "__main__":
+    print("Testing simulate()...")
+    
+    small = {"N_SIMULATIONS": 10, "MONTHS": 12}
+    
+    # Test 1: every archetype *_PROB at 0 is valid and splits joins evenly
+    no_mix = {**small, **{f"{a}_PROB": 0.0 for a in ARCHETYPES}}
+    results = simulate(no_mix)
+    assert results["members"].shape == (10, 12)
+    assert np.isfinite(results["net_cash"]).all()
+    print("✓ Test 1: all-zero archetype mix")
+    
+    # Test 2: every numeric parameter at its minimum, then its maximum
+    for bound in ("min", "max"):
+        extreme = {
+            name: getattr(param, bound)
+            for name, param in PARAMETERS.items()
+            if param.type in (ParameterType.FLOAT, ParameterType.INT)
+        }
+        results = simulate({**extreme, **small})
+        assert np.isfinite(results["net_cash"]).all(), f"all-{bound} config should simulate"
+    print("✓ Test 2: all-minimum and all-maximum configs")
+    
+    # Test 3: numeric strings pass validate_config(), so they must simulate
+    as_text = {**small, "PRICE": "185", "MAX_MEMBERS": "77", "RANDOM_SEED": "42"}
+    results = simulate(as_text)
+    expected = simulate({**small, "PRICE": 185.0, "MAX_MEMBERS": 77, "RANDOM_SEED": 42})
+    assert np.array_equal(results["net_cash"], expected["net_cash"])
+    print("✓ Test 3: numeric strings are coerced")
+    
+    # Test 4: owner draw and grants are scheduled once and move net_cash only
+    base = simulate({**small, "OWNER_DRAW": 0.0})
+    funded = simulate({**small, "OWNER_DRAW": 1000.0, "OWNER_DRAW_END_MONTH": 6,
+                       "grant_amount": 5000.0, "grant_month": 2})
+    assert funded["owner_draw"].sum() == 6000.0 and funded["grants"][2] == 5000.0
+    assert np.array_equal(base["operating_cash"], funded["operating_cash"])
+    assert np.allclose(base["net_cash"] - funded["net_cash"], funded["owner_draw"] - funded["grants"])
+    print("✓ Test 4: owner draw and grants")
+    
+    # Test 5: SE tax for pass-through entities only, at each year end
+    profitable = {**small, "MONTHS": 18, "PRICE": 400.0, "RENT": 1000.0}
+    sole_prop = simulate({**profitable, "ENTITY_TYPE": "sole_prop"})
+    c_corp = simulate({**profitable, "ENTITY_TYPE": "c_corp"})
+    charged = sole_prop["taxes"].any(axis=0)
+    assert charged[11] and charged[17] and charged.sum() == 2
+    assert not c_corp["taxes"].any()
+    assert np.allclose(c_corp["net_cash"] - sole_prop["net_cash"], sole_prop["taxes"])
+    print("✓ Test 5: self-employment tax")
+    
+    print("\n✅ ALL TESTS PASSED!")
+
@@ -3,5 +3,167 @@
 """
 financial.py - Loan, cash flow, and DSCR calculations
 
-TODO: Implementation pending
+Loan terms don't vary across Monte Carlo trials, so debt service is computed
+once per scenario as length-n_months arrays and broadcast against the
+(n_trials, n_months) cash-flow grid.
+
+Owner draw and grants are scenario constants too and are scheduled the same
+way. Loan amounts come from the override parameters; sizing them from CapEx
+and DSCR reporting are not implemented.
 """
+
+from typing import Any, Dict
+
+import numpy as np
+
+from config.parameter_schema import PARAMETERS
+
+
+def amortization_schedule(
+    principal: float,
+    annual_rate: float,
+    term_years: int,
+    io_months: int,
+    months: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Monthly interest and principal payments of a fixed-rate loan.
+    
+    The first io_months payments are interest only; the balance is then
+    repaid in level payments over the rest of the term, so the loan is
+    retired term_years * 12 months after funding. Months past the term are
+    zero.
+    
+    Args:
+        principal: Amount borrowed (including any financed fees)
+        annual_rate: Nominal annual interest rate, e.g. 0.07
+        term_years: Loan term in years
+        io_months: Interest-only months at the start of the term
+        months: Length of the returned schedule
+    
+    Returns:
+        (interest, principal_pmt), float64 arrays of shape (months,)
+    
+    Raises:
+        ValueError: If io_months doesn't leave at least one amortizing month
+    
+    Example:
+        >>> interest, principal_pmt = amortization_schedule(100000, 0.07, 20, 6, 60)
+        >>> round(interest[0], 2), round(interest[6] + principal_pmt[6], 2)
+        (583.33, 784.47)
+    """
+    term_months = int(term_years) * 12
+    io_months = int(io_months)
+    n_amort = term_months - io_months
+    if n_amort < 1:
+        raise ValueError(f"io_months ({io_months}) must be shorter than the {term_months}-month term")
+    
+    rate = annual_rate / 12.0
+    # Amortizing payments made by the end of each month (0 during interest-only)
+    k = np.clip(np.arange(1, months + 1) - io_months, 0, n_amort)
+    j = np.arange(n_amort + 1)
+    if rate == 0.0:
+        balance = principal * (1.0 - j / n_amort)
+    else:
+        # Closed-form balance after j level payments
+        growth = (1.0 + rate) ** j
+        balance = principal * (growth[-1] - growth) / (growth[-1] - 1.0)
+    balance_before = balance[np.maximum(k - 1, 0)]
+    principal_pmt = balance_before - balance[k]
+    
+    in_term = np.arange(months) < term_months
+    interest = np.where(in_term, balance_before * rate, 0.0)
+    return interest, np.where(in_term, principal_pmt, 0.0)
+
+
+def debt_service_schedule(config: Dict[str, Any], months: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Combined interest and principal payments on the SBA 504 and 7(a) loans.
+    
+    Loan amounts are taken from LOAN_504_AMOUNT_OVERRIDE and
+    LOAN_7A_AMOUNT_OVERRIDE; a loan left at 0 isn't drawn. When
+    FINANCE_FEES_504 / FINANCE_FEES_7A is set, that loan's upfront SBA fee
+    is rolled into its principal.
+    
+    Args:
+        config: Parameter values; missing names fall back to defaults
+        months: Length of the returned schedule
+    
+    Returns:
+        (interest, principal_pmt), float64 arrays of shape (months,)
+    
+    Example:
+        >>> interest, principal_pmt = debt_service_schedule(config, 60)
+        >>> net_cash = operating_cash - (interest + principal_pmt)
+    """
+    def get(name):
+        return config.get(name, PARAMETERS[name].default)
+    
+    interest = np.zeros(months)
+    principal_pmt = np.zeros(months)
+    for loan in ("504", "7A"):
+        amount = float(get(f"LOAN_{loan}_AMOUNT_OVERRIDE"))
+        if amount <= 0.0:
+            continue
+        if get(f"FINANCE_FEES_{loan}"):
+            amount *= 1.0 + get(f"FEES_UPFRONT_PCT_{loan}")
+        loan_interest, loan_principal = amortization_schedule(
+            amount,
+            get(f"LOAN_{loan}_ANNUAL_RATE"),
+            get(f"LOAN_{loan}_TERM_YEARS"),
+            get(f"IO_MONTHS_{loan}"),
+            months,
+        )
+        interest += loan_interest
+        principal_pmt += loan_principal
+    return interest, principal_pmt
+
+
+def owner_draw_schedule(config: Dict[str, Any], months: int) -> np.ndarray:
+    """
+    Owner draw paid in each month.
+    
+    OWNER_DRAW is paid from OWNER_DRAW_START_MONTH through
+    OWNER_DRAW_END_MONTH (both 1-based and inclusive); an end month at the
+    parameter's maximum means "until the end of the run".
+    
+    Args:
+        config: Parameter values; missing names fall back to defaults
+        months: Length of the returned schedule
+    
+    Returns:
+        float64 array of shape (months,)
+    """
+    def get(name):
+        return config.get(name, PARAMETERS[name].default)
+    
+    start, end = get("OWNER_DRAW_START_MONTH"), get("OWNER_DRAW_END_MONTH")
+    if end >= PARAMETERS["OWNER_DRAW_END_MONTH"].max:
+        end = months
+    month = np.arange(1, months + 1)
+    return np.where((month >= start) & (month <= end), float(get("OWNER_DRAW")), 0.0)
+
+
+def grant_schedule(config: Dict[str, Any], months: int) -> np.ndarray:
+    """
+    Grant funds received in each month.
+    
+    grant_amount arrives in month index grant_month (0 = at start); a
+    negative month, or one past the run, means no grant.
+    
+    Args:
+        config: Parameter values; missing names fall back to defaults
+        months: Length of the returned schedule
+    
+    Returns:
+        float64 array of shape (months,)
+    """
+    def get(name):
+        return config.get(name, PARAMETERS[name].default)
+    
+    grants = np.zeros(months)
+    month = int(get("grant_month"))
+    if 0 <= month < months:
+        grants[month] = float(get("grant_amount"))
+    return grants
+
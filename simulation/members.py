@@ -3,5 +3,294 @@
 """
 members.py - Member acquisition and churn dynamics
 
-TODO: Implementation pending
+Members are represented as an int array of archetype codes (positions in
+models.ARCHETYPES). Per-member draws are made with one NumPy call over that
+array rather than a Python loop over members, and economy states for a whole
+run are drawn as one (n_trials, n_months) grid.
+
+Acquisition and churn advance every trial at once: only the month loop is
+sequential (each month's joins depend on the current member count), and
+everything that doesn't depend on it is drawn or computed before the loop.
 """
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from config.parameter_schema import PARAMETERS
+from simulation.models import ARCHETYPES, CLAY_USAGE_TABLE, build_seasonality_vector
+
+# Economy states in a downturn state grid
+NORMAL = 0
+DOWNTURN = 1
+
+# Members of one archetype in one month above which sample_clay_bags() uses
+# the normal approximation for their total instead of per-member draws
+_CLT_MIN_MEMBERS = 30
+
+
+def sample_clay_usage(
+    rng: np.random.Generator,
+    member_types: np.ndarray,
+    table: np.ndarray = CLAY_USAGE_TABLE,
+) -> np.ndarray:
+    """
+    Draw one month of clay usage (bags) for every member.
+    
+    Each member's usage is triangular on its archetype's (low, typical,
+    high) row of table. The typical value is clipped into [low, high], and
+    archetypes with high <= low use low as a fixed amount.
+    
+    Args:
+        rng: NumPy random generator
+        member_types: Int array of archetype codes, one per member
+        table: Clay usage table from build_clay_usage_table()
+    
+    Returns:
+        float64 array of bags used, same shape as member_types
+    
+    Example:
+        >>> rng = np.random.default_rng(42)
+        >>> bags = sample_clay_usage(rng, np.array([0, 0, 2, 3]))
+    """
+    low, mode, high = table[member_types].T
+    mode = np.clip(mode, low, high)
+    
+    fixed = high <= low
+    if not fixed.any():
+        return rng.triangular(low, mode, high)
+    
+    usage = low.copy()
+    sampled = ~fixed
+    usage[sampled] = rng.triangular(low[sampled], mode[sampled], high[sampled])
+    return usage
+
+
+def sample_downturn_states(
+    rng: np.random.Generator,
+    config: Dict[str, Any],
+    n_trials: int,
+    n_months: int,
+) -> np.ndarray:
+    """
+    Draw the economy state of every month of every trial.
+    
+    Each month is independently a downturn with probability
+    DOWNTURN_PROB_PER_MONTH; the whole grid is one uniform draw.
+    
+    Args:
+        rng: NumPy random generator
+        config: Parameter values; missing names fall back to defaults
+        n_trials: Number of Monte Carlo trials
+        n_months: Months per trial
+    
+    Returns:
+        int8 array of shape (n_trials, n_months) holding NORMAL or DOWNTURN
+    
+    Example:
+        >>> states = sample_downturn_states(rng, config, 1000, 60)
+        >>> join_mult, churn_mult = downturn_multipliers(config, states)
+    """
+    prob = config.get("DOWNTURN_PROB_PER_MONTH", PARAMETERS["DOWNTURN_PROB_PER_MONTH"].default)
+    return (rng.random((n_trials, n_months)) < prob).view(np.int8)
+
+
+def downturn_multipliers(config: Dict[str, Any], states: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Join and churn rate multipliers for a state grid.
+    
+    Looked up from a two-entry table per rate (1.0 for NORMAL, the
+    DOWNTURN_*_MULT parameter for DOWNTURN) by fancy indexing.
+    
+    Args:
+        config: Parameter values; missing names fall back to defaults
+        states: State grid from sample_downturn_states()
+    
+    Returns:
+        (join_mult, churn_mult) float64 arrays shaped like states
+    """
+    def get(name):
+        return float(config.get(name, PARAMETERS[name].default))
+    
+    join = np.array([1.0, get("DOWNTURN_JOIN_MULT")])
+    churn = np.array([1.0, get("DOWNTURN_CHURN_MULT")])
+    return join[states], churn[states]
+
+
+def simulate_members(
+    rng: np.random.Generator,
+    config: Dict[str, Any],
+    n_trials: int,
+    n_months: int,
+    seasonality: Optional[np.ndarray] = None,
+    downturn_states: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Simulate membership by archetype for every month of every trial.
+    
+    Each month, existing members churn first (archetype base rate, scaled by
+    price, downturns and crowding), then the three market pools gain their
+    inflow and convert at their baseline rates. Joins are scaled by
+    awareness ramp, seasonality, price, downturns, word of mouth, crowding
+    and lognormal adoption noise; members also refer new members. Joins are
+    capped by MAX_ONBOARDINGS_PER_MONTH and the MAX_MEMBERS headroom, and
+    split across archetypes by the *_PROB mix (evenly if every *_PROB is 0).
+    Community-studio members can only switch once their class term unlocks
+    them.
+    
+    Args:
+        rng: NumPy random generator
+        config: Parameter values; missing names fall back to defaults
+        n_trials: Number of Monte Carlo trials
+        n_months: Months per trial (month 0 is January)
+        seasonality: Optional (12,) factors; built from config if None
+        downturn_states: Optional grid from sample_downturn_states(); drawn
+            if None
+    
+    Returns:
+        int64 array of shape (n_trials, n_months, len(ARCHETYPES)) with the
+        members of each archetype at the end of each month
+    
+    Example:
+        >>> counts = simulate_members(rng, config, 100, 60)
+        >>> members = counts.sum(axis=2)
+    """
+    def get(name):
+        return config.get(name, PARAMETERS[name].default)
+    
+    if seasonality is None:
+        seasonality = build_seasonality_vector(config)
+    if downturn_states is None:
+        downturn_states = sample_downturn_states(rng, config, n_trials, n_months)
+    join_mult, churn_mult = downturn_multipliers(config, downturn_states)
+    
+    # Everything that doesn't depend on the member count, for the whole grid
+    months = np.arange(n_months)
+    start, end = get("AWARENESS_RAMP_START_MULT"), get("AWARENESS_RAMP_END_MULT")
+    awareness = start + (end - start) * np.minimum(months / get("AWARENESS_RAMP_MONTHS"), 1.0)
+    price_ratio = get("PRICE") / get("REFERENCE_PRICE")
+    sigma = get("ADOPTION_SIGMA")
+    join_factor = (
+        join_mult
+        * (awareness * seasonality[months % 12] * price_ratio ** get("JOIN_PRICE_ELASTICITY"))
+        * rng.lognormal(-sigma ** 2 / 2, sigma, size=(n_trials, n_months))
+    )
+    
+    churn_base = np.array([get(f"ARCHETYPE_CHURN_{a}") for a in ARCHETYPES])
+    churn_base = churn_base * price_ratio ** get("CHURN_PRICE_ELASTICITY")
+    mix = np.array([get(f"{a}_PROB") for a in ARCHETYPES], dtype=np.float64)
+    # Each *_PROB may be 0 on its own; with no mix at all, split joins evenly
+    total_mix = mix.sum()
+    mix = mix / total_mix if total_mix > 0 else np.full(len(ARCHETYPES), 1.0 / len(ARCHETYPES))
+    
+    max_members = get("MAX_MEMBERS")
+    beta = get("CAPACITY_DAMPING_BETA")
+    uplift = get("UTILIZATION_CHURN_UPLIFT")
+    wom_q, wom_saturation = get("WOM_Q"), get("WOM_SATURATION")
+    referral_p = get("REFERRAL_RATE_PER_MEMBER") * get("REFERRAL_CONV")
+    term, unlock = get("CLASS_TERM_MONTHS"), get("CS_UNLOCK_FRACTION_PER_TERM")
+    rate_no_access = get("BASELINE_RATE_NO_ACCESS")
+    rate_home = get("BASELINE_RATE_HOME")
+    rate_community = get("BASELINE_RATE_COMMUNITY")
+    inflow_no_access = get("NO_ACCESS_INFLOW")
+    inflow_home = get("HOME_INFLOW")
+    inflow_community = get("COMMUNITY_INFLOW")
+    max_onboardings = get("MAX_ONBOARDINGS_PER_MONTH")
+    
+    no_access = np.full(n_trials, get("NO_ACCESS_POOL"), dtype=np.int64)
+    home = np.full(n_trials, get("HOME_POOL"), dtype=np.int64)
+    community_locked = np.full(n_trials, get("COMMUNITY_POOL"), dtype=np.int64)
+    community_open = np.zeros(n_trials, dtype=np.int64)
+    
+    members = np.zeros((n_trials, len(ARCHETYPES)), dtype=np.int64)
+    counts = np.empty((n_trials, n_months, len(ARCHETYPES)), dtype=np.int64)
+    
+    for t in range(n_months):
+        # Churn, scaled up as the studio fills
+        utilization = members.sum(axis=1) / max_members
+        trial_churn = churn_mult[:, t] * (1.0 + uplift * utilization)
+        members -= rng.binomial(members, np.minimum(churn_base * trial_churn[:, None], 1.0))
+        total = members.sum(axis=1)
+        
+        no_access += inflow_no_access
+        home += inflow_home
+        community_locked += inflow_community
+        if t % term == 0:
+            unlocked = rng.binomial(community_locked, unlock)
+            community_locked -= unlocked
+            community_open += unlocked
+        
+        crowding = np.maximum(1.0 - (total / max_members) ** beta, 0.0)
+        factor = join_factor[:, t] * (1.0 + wom_q * np.minimum(total / wom_saturation, 1.0)) * crowding
+        
+        joins_no_access = rng.binomial(no_access, np.minimum(rate_no_access * factor, 1.0))
+        joins_home = rng.binomial(home, np.minimum(rate_home * factor, 1.0))
+        joins_community = rng.binomial(community_open, np.minimum(rate_community * factor, 1.0))
+        no_access -= joins_no_access
+        home -= joins_home
+        community_open -= joins_community
+        
+        referrals = rng.binomial(total, np.minimum(referral_p * crowding, 1.0))
+        
+        # Prospects turned away by the caps are lost, not returned to a pool
+        joins = joins_no_access + joins_home + joins_community + referrals
+        joins = np.minimum(joins, np.minimum(max_onboardings, max_members - total))
+        members += rng.multinomial(joins, mix)
+        counts[:, t] = members
+    
+    return counts
+
+
+def sample_clay_bags(
+    rng: np.random.Generator,
+    counts: np.ndarray,
+    table: np.ndarray = CLAY_USAGE_TABLE,
+) -> np.ndarray:
+    """
+    Total clay bags used in every month of every trial.
+    
+    Sampled per (trial, month, archetype) cell rather than per member. A cell
+    with at least _CLT_MIN_MEMBERS members draws its total from the normal
+    approximation to a sum of triangular draws (clipped to the possible
+    range); smaller cells draw each member with sample_clay_usage(). Months
+    are drawn one at a time, so memory stays O(n_trials * members) however
+    long the run.
+    
+    Args:
+        rng: NumPy random generator
+        counts: Members by archetype from simulate_members()
+        table: Clay usage table from build_clay_usage_table()
+    
+    Returns:
+        float64 array of shape counts.shape[:2]
+    """
+    low, mode, high = table.T
+    mode = np.clip(mode, low, high)
+    fixed = high <= low
+    # Triangular mean and variance per archetype (fixed usage: low, no spread)
+    mean = np.where(fixed, low, (low + mode + high) / 3.0)
+    var = np.where(
+        fixed, 0.0, (low ** 2 + mode ** 2 + high ** 2 - low * mode - low * high - mode * high) / 18.0
+    )
+    high = np.maximum(high, low)
+    
+    n_trials, n_months, n_types = counts.shape
+    trial_of_cell = np.repeat(np.arange(n_trials), n_types)
+    type_of_cell = np.tile(np.arange(n_types), n_trials)
+    bags = np.empty((n_trials, n_months))
+    
+    for t in range(n_months):
+        month = counts[:, t]
+        large = month >= _CLT_MIN_MEMBERS
+        approx = np.clip(rng.normal(month * mean, np.sqrt(month * var)), month * low, month * high)
+        
+        small = np.where(large, 0, month).ravel()
+        member_types = np.repeat(type_of_cell, small)
+        exact = np.bincount(
+            np.repeat(trial_of_cell, small),
+            weights=sample_clay_usage(rng, member_types, table),
+            minlength=n_trials,
+        )
+        bags[:, t] = exact + np.where(large, approx, 0.0).sum(axis=1)
+    
+    return bags
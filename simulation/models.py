@@ -1,7 +1,405 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-models.py - Pydantic data models for type-safe configs
+models.py - Simulation-side views of parameter configs
 
-TODO: Implementation pending
+Array views of a parameter config for the Monte Carlo kernels. Kernels take
+flat NumPy arrays plus a name -> index map instead of a dict of Python
+objects, so inner loops read contiguous float64 values and can be compiled
+with Numba.
+
+Also here: the SimParams namedtuple snapshot of a config, the column-per-
+attribute ParameterTable (PARAM_TABLE), coerce_config(), and the lookup
+tables built from config values (seasonality vector, clay usage by
+archetype, parsed JSON ranges).
 """
+
+from collections import namedtuple
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+import numpy as np
+
+from config.parameter_schema import (
+    PARAMETERS,
+    PARAM_ORDER,
+    Parameter,
+    ParameterTier,
+    ParameterType,
+    build_param_order,
+    parse_json_value,
+)
+
+# Position of each parameter in the arrays returned by build_param_arrays()
+NAME_TO_IDX: Dict[str, int] = {name: i for i, name in enumerate(PARAM_ORDER)}
+
+
+def build_param_arrays(
+    config: Dict[str, Any],
+    params: Mapping[str, Parameter] = PARAMETERS,
+) -> Dict[str, np.ndarray]:
+    """
+    Pack a parameter config into parallel struct-of-arrays columns.
+    
+    Both arrays are indexed by dependency order: NAME_TO_IDX for the global
+    schema, or enumerate(build_param_order(params)) for a custom one.
+    
+    Args:
+        config: Parameter values; missing names fall back to defaults
+        params: Parameter dictionary describing the config
+        
+    Returns:
+        Dictionary with:
+        - "values": float64 value of each FLOAT/INT/BOOL parameter (NaN otherwise)
+        - "flags": int8 value of each BOOL (0/1) and option index of each
+          SELECT parameter (-1 otherwise)
+          
+    Example:
+        >>> arrays = build_param_arrays({"RENT": 4000})
+        >>> arrays["values"][NAME_TO_IDX["RENT"]]
+        4000.0
+    """
+    order = PARAM_ORDER if params is PARAMETERS else build_param_order(params)
+    values = np.full(len(order), np.nan, dtype=np.float64)
+    flags = np.full(len(order), -1, dtype=np.int8)
+    
+    for i, name in enumerate(order):
+        param = params[name]
+        value = config.get(name, param.default)
+        
+        if param.type == ParameterType.FLOAT or param.type == ParameterType.INT:
+            values[i] = value
+        elif param.type == ParameterType.BOOL:
+            values[i] = flags[i] = bool(value)
+        elif param.type == ParameterType.SELECT:
+            flags[i] = param._option_index.get(value, -1)
+    
+    return {"values": values, "flags": flags}
+
+
+# One attribute per parameter (lowercased name), in NAME_TO_IDX order, for
+# code that reads many scalars: sp.rent is a tuple index, not a dict probe
+SimParams = namedtuple("SimParams", [name.lower() for name in PARAM_ORDER])
+
+_JSON_PARAM_NAMES = frozenset(
+    name for name, param in PARAMETERS.items() if param.type == ParameterType.JSON
+)
+
+
+def make_sim_params(config: Dict[str, Any]) -> SimParams:
+    """
+    Freeze a config into a SimParams snapshot.
+    
+    JSON-typed values are stored parsed, so nothing downstream re-parses
+    them.
+    
+    Args:
+        config: Parameter values; missing names fall back to defaults
+        
+    Returns:
+        SimParams with every parameter filled in
+        
+    Example:
+        >>> sp = make_sim_params({"RENT": 4000})
+        >>> sp.rent, sp.attendees_per_event_range
+        (4000, (8, 10, 12))
+    """
+    get = config.get
+    return SimParams._make([
+        get_json_param(config, name) if name in _JSON_PARAM_NAMES
+        else get(name, PARAMETERS[name].default)
+        for name in PARAM_ORDER
+    ])
+
+
+# FLOAT/INT parameters and the converter validation accepts them through
+_NUMERIC_CONVERTERS = MappingProxyType({
+    name: float if param.type == ParameterType.FLOAT else int
+    for name, param in PARAMETERS.items()
+    if param.type in (ParameterType.FLOAT, ParameterType.INT)
+})
+
+
+def coerce_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of config with numeric values converted to float/int.
+    
+    validate_config() accepts anything float()/int() converts, such as the
+    string "185", so the simulation converts the same way before arithmetic.
+    Other values are copied as they are.
+    
+    Args:
+        config: Parameter values (already validated)
+        
+    Returns:
+        New dictionary with the same keys
+        
+    Example:
+        >>> coerce_config({"PRICE": "185", "MAX_MEMBERS": "77"})
+        {'PRICE': 185.0, 'MAX_MEMBERS': 77}
+    """
+    converters = _NUMERIC_CONVERTERS
+    return {
+        name: converters[name](value) if name in converters else value
+        for name, value in config.items()
+    }
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class ParameterTable:
+    """
+    Column-per-attribute view of the whole schema.
+    
+    Row i of every column is the parameter at NAME_TO_IDX position i, so the
+    columns line up with the arrays from build_param_arrays() and whole
+    configs can be filtered or bounds-checked with one vectorised operation.
+    
+    Attributes:
+        names: Parameter names
+        types: ParameterType value of each row (uint8)
+        tiers: ParameterTier value of each row (uint8)
+        group_ids: Position of each row's group in groups (uint16)
+        groups: Group names
+        defaults: Numeric defaults, BOOL as 0/1 (NaN for other types)
+        mins, maxs, steps: Slider bounds and step (NaN where unset). Steps
+            are widget granularity, not a constraint: several defaults
+            (e.g. MAX_MEMBERS = 77 with step 5) deliberately fall between
+            steps, so only the bounds are validated
+    
+    Example:
+        >>> bad = PARAM_TABLE.out_of_bounds(PARAM_TABLE.to_values(overrides))
+        >>> PARAM_TABLE.names[bad]
+    """
+    names: np.ndarray
+    types: np.ndarray
+    tiers: np.ndarray
+    group_ids: np.ndarray
+    groups: tuple[str, ...]
+    defaults: np.ndarray
+    mins: np.ndarray
+    maxs: np.ndarray
+    steps: np.ndarray
+    
+    def view(self, name: str) -> Parameter:
+        """The full Parameter object for a row (for widgets, docs, etc.)."""
+        return PARAMETERS[name]
+    
+    def select(self, tier: Optional[ParameterTier] = None, group: Optional[str] = None) -> np.ndarray:
+        """
+        Boolean row mask for a tier and/or group.
+        
+        Example:
+            >>> PARAM_TABLE.names[PARAM_TABLE.select(ParameterTier.IMPORTANT, "events")]
+            array(['EVENTS_ENABLED', 'EVENTS_MAX_PER_MONTH', 'TICKET_PRICE'],
+                  dtype='<U35')
+        """
+        mask = np.ones(len(self.names), dtype=bool)
+        if tier is not None:
+            mask &= self.tiers == tier
+        if group is not None:
+            mask &= self.group_ids == (self.groups.index(group) if group in self.groups else -1)
+        return mask
+    
+    def out_of_bounds(self, values: np.ndarray) -> np.ndarray:
+        """
+        Boolean row mask of values outside [min, max].
+        
+        Args:
+            values: "values" array from build_param_arrays()
+            
+        Example:
+            >>> bad = PARAM_TABLE.out_of_bounds(build_param_arrays(config)["values"])
+            >>> PARAM_TABLE.names[bad]
+        """
+        # NaN compares False, so unbounded and non-numeric rows never fail
+        return (values < self.mins) | (values > self.maxs)
+    
+    def clamp(self, values: np.ndarray) -> np.ndarray:
+        """
+        Values clipped into [min, max] in one pass.
+        
+        Unset bounds don't clip, and NaN (non-numeric) rows stay NaN.
+        
+        Args:
+            values: "values" array from build_param_arrays()
+            
+        Example:
+            >>> PARAM_TABLE.clamp(PARAM_TABLE.to_values({"RENT": 50}))[NAME_TO_IDX["RENT"]]
+            1000.0
+        """
+        return np.clip(
+            values,
+            np.where(np.isnan(self.mins), -np.inf, self.mins),
+            np.where(np.isnan(self.maxs), np.inf, self.maxs),
+        )
+    
+    def to_values(self, overrides: Dict[str, Any]) -> np.ndarray:
+        """
+        "values" array for a config given as overrides of the defaults.
+        
+        Same result as build_param_arrays(overrides)["values"], but only the
+        overridden entries are touched, so it costs one copy plus
+        len(overrides) writes.
+        
+        Example:
+            >>> values = PARAM_TABLE.to_values({"RENT": 4000})
+        """
+        values = self.defaults.copy()
+        for name, value in overrides.items():
+            i = _NUMERIC_IDX.get(name)
+            if i is not None:
+                values[i] = value
+        return values
+    
+    def changed(self, values: np.ndarray) -> np.ndarray:
+        """
+        Boolean row mask of values that differ from the defaults.
+        
+        Example:
+            >>> PARAM_TABLE.names[PARAM_TABLE.changed(PARAM_TABLE.to_values({"RENT": 4000}))]
+            array(['RENT'], dtype='<U35')
+        """
+        # NaN != NaN, so rows that are NaN on both sides need masking out
+        return (values != self.defaults) & ~(np.isnan(values) & np.isnan(self.defaults))
+
+
+def _build_param_table() -> ParameterTable:
+    groups = tuple(dict.fromkeys(PARAMETERS[name].group for name in PARAM_ORDER))
+    group_index = {group: i for i, group in enumerate(groups)}
+    params = [PARAMETERS[name] for name in PARAM_ORDER]
+    
+    # The float columns are rows of one contiguous block: a single
+    # allocation, and whole-table numeric passes stay in one buffer
+    numeric = np.empty((4, len(params)), dtype=np.float64)
+    numeric[0] = build_param_arrays({})["values"]
+    for row, attr in enumerate(("min", "max", "step"), start=1):
+        numeric[row] = [np.nan if getattr(p, attr) is None else getattr(p, attr) for p in params]
+    defaults, mins, maxs, steps = numeric
+    
+    columns = {
+        "names": np.array(PARAM_ORDER),
+        "types": np.array([p.type for p in params], dtype=np.uint8),
+        "tiers": np.array([p.tier for p in params], dtype=np.uint8),
+        "group_ids": np.array([group_index[p.group] for p in params], dtype=np.uint16),
+        "defaults": defaults,
+        "mins": mins,
+        "maxs": maxs,
+        "steps": steps,
+    }
+    numeric.flags.writeable = False
+    for array in columns.values():
+        array.flags.writeable = False
+    return ParameterTable(groups=groups, **columns)
+
+
+PARAM_TABLE = _build_param_table()
+
+# Rows of PARAM_TABLE.to_values() that hold a number (FLOAT, INT and BOOL)
+_NUMERIC_IDX: Dict[str, int] = {
+    name: i for i, name in enumerate(PARAM_ORDER)
+    if PARAMETERS[name].type in (ParameterType.FLOAT, ParameterType.INT, ParameterType.BOOL)
+}
+
+
+# Monthly seasonality factors, January first; index with month_idx % 12
+SEASONALITY_KEYS = (
+    "SEASONALITY_JAN", "SEASONALITY_FEB", "SEASONALITY_MAR", "SEASONALITY_APR",
+    "SEASONALITY_MAY", "SEASONALITY_JUN", "SEASONALITY_JUL", "SEASONALITY_AUG",
+    "SEASONALITY_SEP", "SEASONALITY_OCT", "SEASONALITY_NOV", "SEASONALITY_DEC",
+)
+
+# Member archetypes in member-type code order (row order of clay usage tables)
+ARCHETYPES = ("HOBBYIST", "COMMITTED_ARTIST", "PRODUCTION_POTTER", "SEASONAL_USER")
+
+# (low, typical, high) monthly clay bags per archetype
+CLAY_USAGE_KEYS = tuple(
+    (f"{archetype}_CLAY_LOW", f"{archetype}_CLAY_TYPICAL", f"{archetype}_CLAY_HIGH")
+    for archetype in ARCHETYPES
+)
+
+
+def build_seasonality_vector(config: Dict[str, Any]) -> np.ndarray:
+    """
+    Collect the 12 monthly seasonality factors into one float64 array.
+    
+    Args:
+        config: Parameter values; missing names fall back to defaults
+        
+    Returns:
+        Array of shape (12,), January first
+        
+    Example:
+        >>> seasonality = build_seasonality_vector(config)
+        >>> demand *= seasonality[month_idx % 12]
+    """
+    return np.fromiter(
+        (config.get(key, PARAMETERS[key].default) for key in SEASONALITY_KEYS),
+        dtype=np.float64,
+        count=12,
+    )
+
+
+def build_clay_usage_table(config: Dict[str, Any]) -> np.ndarray:
+    """
+    Collect the triangular clay usage bounds for every archetype.
+    
+    Args:
+        config: Parameter values; missing names fall back to defaults
+        
+    Returns:
+        Array of shape (len(ARCHETYPES), 3) with columns (low, typical, high)
+        
+    Example:
+        >>> table = build_clay_usage_table(config)
+        >>> low, mode, high = table[member_types].T
+    """
+    return np.array(
+        [[config.get(key, PARAMETERS[key].default) for key in keys] for keys in CLAY_USAGE_KEYS],
+        dtype=np.float64,
+    )
+
+
+# Default-config views, shared read-only
+SEASONALITY_DEFAULT = build_seasonality_vector({})
+SEASONALITY_DEFAULT.flags.writeable = False
+CLAY_USAGE_TABLE = build_clay_usage_table({})
+CLAY_USAGE_TABLE.flags.writeable = False
+
+
+def get_json_param(config: Dict[str, Any], name: str) -> Any:
+    """
+    Parsed value of a JSON-typed parameter.
+    
+    The default's pre-parsed value is used when the config doesn't override
+    it; overrides go through the cached parser, so each distinct text is
+    parsed once per process.
+    
+    Args:
+        config: Parameter values
+        name: Name of a JSON-typed parameter
+        
+    Returns:
+        Parsed value (JSON arrays as tuples)
+        
+    Example:
+        >>> get_json_param({}, "ATTENDEES_PER_EVENT_RANGE")
+        (8, 10, 12)
+    """
+    param = PARAMETERS[name]
+    text = config.get(name, param.default)
+    if text == param.default:
+        return param.parsed_default
+    return parse_json_value(text)
+
+
+def event_mug_cost_bounds(config: Dict[str, Any]) -> tuple[float, float]:
+    """
+    (low, high) of the per-attendee bisque mug cost, ready for rng.uniform.
+    
+    Example:
+        >>> low, high = event_mug_cost_bounds(config)
+        >>> mug_costs = rng.uniform(low, high, n_attendees)
+    """
+    low, high = get_json_param(config, "EVENT_MUG_COST_RANGE")
+    return float(low), float(high)
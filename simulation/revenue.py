@@ -3,5 +3,86 @@
 """
 revenue.py - Revenue stream calculations
 
-TODO: Implementation pending
+Random draws are made for the whole (n_trials, n_months) grid in one NumPy
+call rather than per trial and month. The draws are priced into revenue by
+engine.monthly_cashflow().
 """
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from config.parameter_schema import PARAMETERS
+from simulation.models import get_json_param
+
+
+def sample_event_counts(
+    rng: np.random.Generator,
+    config: Dict[str, Any],
+    n_trials: int,
+    n_months: int,
+    seasonality: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Draw the number of events held in every month of every trial.
+    
+    Counts are Poisson(BASE_EVENTS_PER_MONTH_LAMBDA) capped at
+    EVENTS_MAX_PER_MONTH. With a seasonality vector the rate is scaled per
+    calendar month before sampling, so counts stay whole numbers.
+    
+    Args:
+        rng: NumPy random generator
+        config: Parameter values; missing names fall back to defaults
+        n_trials: Number of Monte Carlo trials
+        n_months: Months per trial (month 0 is January)
+        seasonality: Optional (12,) factors from build_seasonality_vector()
+    
+    Returns:
+        int64 array of shape (n_trials, n_months); all zeros when events
+        are disabled
+    
+    Example:
+        >>> events = sample_event_counts(rng, config, 1000, 60, SEASONALITY_DEFAULT)
+    """
+    def get(name):
+        return config.get(name, PARAMETERS[name].default)
+    
+    if not get("EVENTS_ENABLED"):
+        return np.zeros((n_trials, n_months), dtype=np.int64)
+    
+    lam = float(get("BASE_EVENTS_PER_MONTH_LAMBDA"))
+    if seasonality is not None:
+        # Broadcasts the per-month rate across trials
+        lam = lam * seasonality[np.arange(n_months) % 12]
+    
+    events = rng.poisson(lam, size=(n_trials, n_months))
+    return np.minimum(events, int(get("EVENTS_MAX_PER_MONTH")), out=events)
+
+
+def sample_event_attendees(
+    rng: np.random.Generator,
+    config: Dict[str, Any],
+    event_counts: np.ndarray,
+) -> np.ndarray:
+    """
+    Total attendees across each month's events.
+    
+    Every event picks its attendance from ATTENDEES_PER_EVENT_RANGE; all
+    events of the run are drawn in one call and summed back per month.
+    
+    Args:
+        rng: NumPy random generator
+        config: Parameter values; missing names fall back to defaults
+        event_counts: Counts from sample_event_counts()
+    
+    Returns:
+        float64 array shaped like event_counts
+    
+    Example:
+        >>> attendees = sample_event_attendees(rng, config, events)
+    """
+    choices = np.asarray(get_json_param(config, "ATTENDEES_PER_EVENT_RANGE"), dtype=np.float64)
+    flat = event_counts.ravel()
+    cell = np.repeat(np.arange(flat.size), flat)
+    attendance = rng.choice(choices, size=cell.size)
+    return np.bincount(cell, weights=attendance, minlength=flat.size).reshape(event_counts.shape)
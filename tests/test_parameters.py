@@ -3,5 +3,68 @@
 """
 test_parameters.py - Parameter validation tests
 
-TODO: Implementation pending
+Covers the vectorised bounds and default checks on PARAM_TABLE.
 """
+
+import numpy as np
+
+from simulation.models import NAME_TO_IDX, PARAM_TABLE, build_param_arrays
+
+RENT = NAME_TO_IDX["RENT"]
+ATTENDEES = NAME_TO_IDX["ATTENDEES_PER_EVENT_RANGE"]
+WORKSHOPS = NAME_TO_IDX["WORKSHOPS_ENABLED"]
+
+
+# ==============================================================================
+# TO_VALUES / CHANGED
+# ==============================================================================
+
+def test_to_values_matches_build_param_arrays():
+    overrides = {"RENT": 4000.0, "MAX_MEMBERS": 90, "WORKSHOPS_ENABLED": False}
+    
+    np.testing.assert_array_equal(
+        PARAM_TABLE.to_values(overrides), build_param_arrays(overrides)["values"]
+    )
+
+
+def test_to_values_leaves_defaults_untouched():
+    values = PARAM_TABLE.to_values({"RENT": 4000.0})
+    
+    assert values[RENT] == 4000.0
+    assert PARAM_TABLE.defaults[RENT] == 3500.0
+    # Non-numeric rows are NaN
+    assert np.isnan(values[ATTENDEES])
+
+
+def test_changed_defaults_is_empty():
+    assert not PARAM_TABLE.changed(PARAM_TABLE.to_values({})).any()
+
+
+def test_changed_ignores_overrides_equal_to_default():
+    values = PARAM_TABLE.to_values({"RENT": 4000.0, "WORKSHOPS_ENABLED": False, "PRICE": 175.0})
+    
+    assert set(PARAM_TABLE.names[PARAM_TABLE.changed(values)]) == {"RENT", "WORKSHOPS_ENABLED"}
+    assert values[WORKSHOPS] == 0.0
+
+
+# ==============================================================================
+# BOUNDS
+# ==============================================================================
+
+def test_out_of_bounds():
+    values = PARAM_TABLE.to_values({"RENT": 50.0, "MAX_MEMBERS": 10000})
+    
+    assert set(PARAM_TABLE.names[PARAM_TABLE.out_of_bounds(values)]) == {"RENT", "MAX_MEMBERS"}
+    assert not PARAM_TABLE.out_of_bounds(PARAM_TABLE.defaults).any()
+
+
+def test_clamp():
+    values = PARAM_TABLE.to_values({"RENT": 50.0, "MAX_MEMBERS": 10000})
+    clamped = PARAM_TABLE.clamp(values)
+    
+    assert clamped[RENT] == 1000.0
+    assert clamped[NAME_TO_IDX["MAX_MEMBERS"]] == PARAM_TABLE.maxs[NAME_TO_IDX["MAX_MEMBERS"]]
+    assert not PARAM_TABLE.out_of_bounds(clamped).any()
+    # Unbounded and non-numeric rows pass through
+    assert clamped[WORKSHOPS] == values[WORKSHOPS]
+    assert np.isnan(clamped[ATTENDEES])
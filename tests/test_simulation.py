@@ -3,5 +3,158 @@
 """
 test_simulation.py - Simulation engine tests
 
-TODO: Implementation pending
+Covers loan debt service (amortization_schedule, debt_service_schedule) and
+the seeded per-month samplers (shape, bounds, determinism).
 """
+
+import numpy as np
+import pytest
+
+from simulation.financial import amortization_schedule, debt_service_schedule
+from simulation.members import sample_clay_usage
+from simulation.models import CLAY_USAGE_TABLE, SEASONALITY_DEFAULT
+from simulation.revenue import sample_event_attendees, sample_event_counts
+
+
+# ==============================================================================
+# AMORTIZATION
+# ==============================================================================
+
+def test_amortization_interest_only_then_level_payment():
+    interest, principal_pmt = amortization_schedule(100000, 0.07, 20, 6, 60)
+    
+    assert interest.shape == principal_pmt.shape == (60,)
+    np.testing.assert_allclose(interest[:6], 583.33, atol=0.01)
+    np.testing.assert_allclose(principal_pmt[:6], 0.0)
+    np.testing.assert_allclose(interest[6:] + principal_pmt[6:], 784.47, atol=0.01)
+
+
+def test_amortization_principal_repays_loan():
+    interest, principal_pmt = amortization_schedule(100000, 0.07, 20, 6, 300)
+    
+    assert principal_pmt.sum() == pytest.approx(100000)
+    # Past the 240-month term nothing is owed
+    assert not interest[240:].any()
+    assert not principal_pmt[240:].any()
+
+
+def test_amortization_zero_rate():
+    interest, principal_pmt = amortization_schedule(12000, 0.0, 1, 0, 12)
+    
+    assert not interest.any()
+    np.testing.assert_allclose(principal_pmt, 1000.0)
+
+
+def test_amortization_rejects_interest_only_term():
+    with pytest.raises(ValueError):
+        amortization_schedule(100000, 0.07, 1, 12, 60)
+
+
+# ==============================================================================
+# DEBT SERVICE
+# ==============================================================================
+
+def test_debt_service_no_loans():
+    interest, principal_pmt = debt_service_schedule({}, 60)
+    
+    assert interest.shape == principal_pmt.shape == (60,)
+    assert not interest.any()
+    assert not principal_pmt.any()
+
+
+def test_debt_service_finances_fees():
+    config = {
+        "LOAN_504_AMOUNT_OVERRIDE": 100000.0,
+        "FINANCE_FEES_504": True,
+        "FEES_UPFRONT_PCT_504": 0.02,
+        "LOAN_504_TERM_YEARS": 5,
+    }
+    interest, principal_pmt = debt_service_schedule(config, 60)
+    
+    assert principal_pmt.sum() == pytest.approx(102000)
+    assert interest[0] == pytest.approx(102000 * 0.07 / 12)
+
+
+def test_debt_service_sums_both_loans():
+    config = {
+        "LOAN_504_AMOUNT_OVERRIDE": 100000.0,
+        "LOAN_7A_AMOUNT_OVERRIDE": 50000.0,
+        "FINANCE_FEES_504": False,
+        "FINANCE_FEES_7A": False,
+    }
+    interest, principal_pmt = debt_service_schedule(config, 60)
+    
+    interest_504, principal_504 = amortization_schedule(100000, 0.07, 20, 6, 60)
+    interest_7a, principal_7a = amortization_schedule(50000, 0.115, 7, 6, 60)
+    np.testing.assert_allclose(interest, interest_504 + interest_7a)
+    np.testing.assert_allclose(principal_pmt, principal_504 + principal_7a)
+
+
+# ==============================================================================
+# SAMPLERS
+# ==============================================================================
+
+def test_sample_clay_usage_shape_and_bounds():
+    member_types = np.repeat(np.arange(len(CLAY_USAGE_TABLE)), 500)
+    bags = sample_clay_usage(np.random.default_rng(42), member_types)
+    
+    assert bags.shape == member_types.shape
+    low, _, high = CLAY_USAGE_TABLE[member_types].T
+    assert ((bags >= low) & (bags <= high)).all()
+
+
+def test_sample_clay_usage_fixed_amount():
+    table = np.array([[2.0, 5.0, 1.0]])
+    bags = sample_clay_usage(np.random.default_rng(42), np.zeros(10, dtype=np.int64), table)
+    
+    np.testing.assert_array_equal(bags, 2.0)
+
+
+def test_sample_clay_usage_deterministic():
+    member_types = np.array([0, 1, 2, 3, 1])
+    first = sample_clay_usage(np.random.default_rng(7), member_types)
+    second = sample_clay_usage(np.random.default_rng(7), member_types)
+    
+    np.testing.assert_array_equal(first, second)
+
+
+def test_sample_event_counts_shape_and_bounds():
+    events = sample_event_counts(np.random.default_rng(42), {}, 200, 60, SEASONALITY_DEFAULT)
+    
+    assert events.shape == (200, 60)
+    assert events.dtype == np.int64
+    assert events.min() >= 0
+    assert events.max() <= 4
+
+
+def test_sample_event_counts_disabled():
+    events = sample_event_counts(np.random.default_rng(42), {"EVENTS_ENABLED": False}, 10, 12)
+    
+    assert events.shape == (10, 12)
+    assert not events.any()
+
+
+def test_sample_event_counts_deterministic():
+    first = sample_event_counts(np.random.default_rng(7), {}, 50, 24)
+    second = sample_event_counts(np.random.default_rng(7), {}, 50, 24)
+    
+    np.testing.assert_array_equal(first, second)
+
+
+def test_sample_event_attendees_shape_and_bounds():
+    events = sample_event_counts(np.random.default_rng(42), {}, 200, 60)
+    attendees = sample_event_attendees(np.random.default_rng(43), {}, events)
+    
+    # Default ATTENDEES_PER_EVENT_RANGE is [8, 10, 12]
+    assert attendees.shape == events.shape
+    assert (attendees >= 8 * events).all()
+    assert (attendees <= 12 * events).all()
+    assert not attendees[events == 0].any()
+
+
+def test_sample_event_attendees_deterministic():
+    events = np.array([[0, 1, 3], [2, 0, 4]])
+    first = sample_event_attendees(np.random.default_rng(7), {}, events)
+    second = sample_event_attendees(np.random.default_rng(7), {}, events)
+    
+    np.testing.assert_array_equal(first, second)
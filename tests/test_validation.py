@@ -3,5 +3,101 @@
 """
 test_validation.py - Business rule tests
 
-TODO: Implementation pending
+Covers the session-cached visibility logic in validation.visibility. A plain
+dict stands in for st.session_state.
 """
+
+from config.parameter_schema import PARAMETERS, VISIBILITY_DEPS
+from validation.visibility import (
+    VISIBILITY_INPUTS_KEY,
+    VISIBILITY_STATE_KEY,
+    changed_visibility_inputs,
+    compute_visibility,
+    get_visibility,
+    update_visibility,
+)
+
+
+def defaults():
+    return {name: param.default for name, param in PARAMETERS.items()}
+
+
+# ==============================================================================
+# CHANGED INPUTS
+# ==============================================================================
+
+def test_changed_visibility_inputs_unchanged():
+    config = defaults()
+    
+    assert changed_visibility_inputs(dict(config), config) == set()
+
+
+def test_changed_visibility_inputs_only_reports_visibility_keys():
+    previous = defaults()
+    config = dict(previous, WORKSHOPS_ENABLED=False, RENT=9999.0)
+    
+    assert changed_visibility_inputs(previous, config) == {"WORKSHOPS_ENABLED"}
+
+
+# ==============================================================================
+# INCREMENTAL UPDATE
+# ==============================================================================
+
+def test_update_visibility_matches_full_recompute():
+    visibility = compute_visibility(defaults())
+    config = dict(defaults(), CLASSES_CALENDAR_MODE="monthly")
+    
+    update_visibility(visibility, config, {"CLASSES_CALENDAR_MODE"})
+    
+    assert visibility == compute_visibility(config)
+    assert not visibility["CLASS_SEMESTER_LENGTH_MONTHS"]
+
+
+def test_update_visibility_skips_unchanged_keys():
+    visibility = compute_visibility(defaults())
+    config = dict(defaults(), WORKSHOPS_ENABLED=False)
+    
+    # Not told about the change, so the stale entries are kept
+    update_visibility(visibility, config, {"EVENTS_ENABLED"})
+    
+    assert visibility["WORKSHOP_FEE"]
+
+
+# ==============================================================================
+# SESSION CACHE
+# ==============================================================================
+
+def test_get_visibility_first_call_computes_and_caches():
+    state = {}
+    config = defaults()
+    
+    visibility = get_visibility(config, state)
+    
+    assert visibility == compute_visibility(config)
+    assert state[VISIBILITY_STATE_KEY] is visibility
+    assert set(state[VISIBILITY_INPUTS_KEY]) == set(VISIBILITY_DEPS)
+
+
+def test_get_visibility_with_changed_keys():
+    state = {}
+    config = defaults()
+    get_visibility(config, state)
+    
+    config["EVENTS_ENABLED"] = False
+    visibility = get_visibility(config, state, changed_keys={"EVENTS_ENABLED"})
+    
+    assert visibility == compute_visibility(config)
+
+
+def test_get_visibility_detects_change_made_outside_widgets():
+    state = {}
+    config = defaults()
+    assert get_visibility(config, state)["WORKSHOP_FEE"]
+    
+    # e.g. a loaded scenario: no widget reports the change
+    config["WORKSHOPS_ENABLED"] = False
+    visibility = get_visibility(config, state)
+    
+    assert not visibility["WORKSHOP_FEE"]
+    assert visibility == compute_visibility(config)
+    assert state[VISIBILITY_INPUTS_KEY]["WORKSHOPS_ENABLED"] is False
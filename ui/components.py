@@ -3,5 +3,70 @@
 """
 components.py - Reusable UI components
 
-TODO: Implementation pending
+Page setup shared by app.py and every page, so page config lives in one place,
+and the cached entry point pages use to run the simulation. The simulation
+engine (and NumPy, and any Numba warm-up) is imported on the first uncached
+run, not when a page only needs configure_page().
 """
+
+from typing import TYPE_CHECKING, Any, Dict
+
+import streamlit as st
+
+from config.parameter_schema import config_hash
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def configure_page(title: str, icon: str, **options) -> None:
+    """
+    Apply the app's standard page config.
+    
+    Must be the first Streamlit call of a page run.
+    
+    Args:
+        title: Browser tab title
+        icon: Page icon (emoji)
+        **options: Extra st.set_page_config() arguments,
+            e.g. initial_sidebar_state="expanded"
+    
+    Example:
+        >>> configure_page("Quick Start", "🚀")
+    """
+    st.set_page_config(page_title=title, page_icon=icon, layout="wide", **options)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_simulation(params_hash: str, *, _config: Dict[str, Any]) -> Dict[str, "np.ndarray"]:
+    # Streamlit skips underscore-prefixed arguments when hashing, so the
+    # entry is keyed on params_hash alone
+    from simulation.engine import simulate
+    
+    return simulate(_config)
+
+
+def run_simulation(config: Dict[str, Any]) -> Dict[str, "np.ndarray"]:
+    """
+    Run simulate(config), reusing the result of an identical earlier run.
+    
+    Streamlit reruns the page on every widget change; the cache key is
+    config_hash(config), so reruns that leave the parameters unchanged (or
+    only touch non-parameter session keys) skip the simulation. Up to 32
+    scenarios are kept, shared across sessions.
+    
+    Args:
+        config: Parameter values; missing names fall back to defaults
+    
+    Returns:
+        Same dictionary as simulation.engine.simulate()
+    
+    Example:
+        >>> results = run_simulation(st.session_state.config)
+    """
+    return _cached_simulation(config_hash(config), _config=config)
+
+
+def clear_simulation_cache() -> None:
+    """Drop every cached run_simulation() result."""
+    _cached_simulation.clear()
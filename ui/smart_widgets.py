@@ -3,5 +3,135 @@
 """
 smart_widgets.py - Progressive disclosure parameter widgets
 
-TODO: Implementation pending
+Renders parameter panels with session-cached visibility. Widgets record the
+parameters the user changed in st.session_state["_dirty_params"] (via
+on_change, which fires before the rerun), and the next render re-evaluates
+visibility only for parameters that depend on those keys or on any
+visibility input that changed outside a widget. Hidden parameters draw
+nothing and return their current value.
+
+Streamlit forgets any widget that isn't emitted during a run, so visible
+widgets are always drawn; what's skipped is the per-parameter visibility work
+and the widgets for hidden parameters.
+
+Which parameters each configuration page shows is resolved once at import
+(PAGE_LAYOUT), so pages never filter the schema themselves.
 """
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import streamlit as st
+
+from config.parameter_schema import PARAMETERS, PARAMS_BY_GROUP, Parameter
+from validation.visibility import VISIBILITY_INPUTS_KEY, changed_visibility_inputs, get_visibility
+
+DIRTY_PARAMS_KEY = "_dirty_params"
+
+# Parameter groups on each configuration page, in display order. Every group
+# in the schema appears on exactly one page.
+PAGE_GROUPS = {
+    "revenue": ("pricing", "clay_firing_revenue", "workshops", "classes", "events", "designated_studios"),
+    "costs": ("business_fundamentals", "fixed_costs", "variable_costs", "operational_costs", "staff_costs", "operations"),
+    "financing": ("financing", "grants", "taxation"),
+    "members": ("member_behavior", "membership_trajectory", "capacity", "market_dynamics", "seasonality"),
+    "advanced": ("economy", "simulation"),
+}
+
+
+def _build_page_layout(page_groups: Mapping[str, tuple]) -> Mapping[str, tuple]:
+    """
+    Resolve PAGE_GROUPS to (group, parameters) pairs once, at import.
+    
+    Raises:
+        ValueError: If a group is unknown or the schema has a group no page shows
+    """
+    placed = [group for groups in page_groups.values() for group in groups]
+    unknown = set(placed) - PARAMS_BY_GROUP.keys()
+    if unknown:
+        raise ValueError(f"Unknown parameter groups in page layout: {sorted(unknown)}")
+    missing = PARAMS_BY_GROUP.keys() - set(placed)
+    if missing:
+        raise ValueError(f"Parameter groups not on any page: {sorted(missing)}")
+    
+    return MappingProxyType({
+        page: tuple((group, PARAMS_BY_GROUP[group]) for group in groups)
+        for page, groups in page_groups.items()
+    })
+
+
+# Page -> ((group, parameters), ...); pages render from this instead of
+# filtering the schema on every rerun
+PAGE_LAYOUT = _build_page_layout(PAGE_GROUPS)
+
+
+def mark_dirty(*names: str) -> None:
+    """
+    Record parameters whose value changed outside a widget (e.g. a preset).
+    
+    Widgets rendered by render_param() mark themselves automatically.
+    """
+    st.session_state.setdefault(DIRTY_PARAMS_KEY, set()).update(names)
+
+
+def render_param(
+    param: Parameter,
+    config: Dict[str, Any],
+    visibility: Optional[Dict[str, bool]] = None,
+) -> Any:
+    """
+    Render one parameter widget, honouring visibility.
+    
+    Args:
+        param: Parameter to render
+        config: Current parameter values
+        visibility: Visibility map from render_params()/get_visibility();
+            if None, param.is_visible(config) is evaluated directly
+            
+    Returns:
+        The widget value, or the current value if the parameter is hidden
+    """
+    current_value = config.get(param.name, param.default)
+    
+    visible = visibility.get(param.name, True) if visibility is not None else param.is_visible(config)
+    if not visible:
+        return current_value
+    
+    return param.to_streamlit_widget(current_value, on_change=mark_dirty, args=(param.name,))
+
+
+def render_params(params: Iterable[Parameter], config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Render a panel of parameters.
+    
+    Args:
+        params: Parameters to render, e.g. get_params(ParameterTier.ESSENTIAL)
+        config: Current parameter values
+        
+    Returns:
+        Dictionary mapping parameter names to their (possibly updated) values
+        
+    Example:
+        >>> config.update(render_params(get_params(ParameterTier.ESSENTIAL), config))
+    """
+    state = st.session_state
+    
+    # First render computes everything; afterwards only the dirty keys'
+    # dependents are re-evaluated. A widget changed in this rerun already
+    # holds its new value in session state, but the caller's config only
+    # picks it up from our return value, so read dirty values from there.
+    dirty = state.get(DIRTY_PARAMS_KEY, set())
+    if dirty:
+        config = {**config}
+        for name in dirty:
+            param = PARAMETERS.get(name)
+            if param is not None and param.widget_key in state:
+                config[name] = state[param.widget_key]
+    # Widget edits arrive through the dirty set; anything else that changed
+    # the config (a loaded scenario, an applied preset) is found by diffing
+    # the visibility inputs cached from the last render
+    changed = dirty | changed_visibility_inputs(state.get(VISIBILITY_INPUTS_KEY, {}), config)
+    visibility = get_visibility(config, state, changed_keys=changed)
+    state[DIRTY_PARAMS_KEY] = set()
+    
+    return {param.name: render_param(param, config, visibility) for param in params}
@@ -3,5 +3,100 @@
 """
 visibility.py - Context-aware parameter visibility logic
 
-TODO: Implementation pending
+Visibility is cached per session and updated incrementally: when the config
+changes, only parameters whose visible_when_spec reads a changed key (looked
+up through VISIBILITY_DEPS) are re-evaluated, plus the few parameters that
+rely on a visible_when callable. On an unchanged config no predicate runs.
 """
+
+from typing import Any, Dict, Iterable, MutableMapping, Optional, Set
+
+from config.parameter_schema import PARAMETERS, VISIBILITY_DEPS, DYNAMIC_VISIBILITY
+
+# st.session_state keys
+VISIBILITY_STATE_KEY = "_param_visibility"
+VISIBILITY_INPUTS_KEY = "_param_visibility_inputs"
+
+
+def compute_visibility(config: Dict[str, Any]) -> Dict[str, bool]:
+    """
+    Evaluate visibility for every parameter.
+    
+    Args:
+        config: Current parameter values
+        
+    Returns:
+        Dictionary mapping parameter names to True (shown) / False (hidden)
+    """
+    return {name: param.is_visible(config) for name, param in PARAMETERS.items()}
+
+
+def changed_visibility_inputs(previous: Dict[str, Any], config: Dict[str, Any]) -> Set[str]:
+    """
+    Return the visibility-relevant config keys whose value differs.
+    
+    Only keys that some visible_when_spec reads are compared.
+    """
+    return {key for key in VISIBILITY_DEPS if previous.get(key) != config.get(key)}
+
+
+def update_visibility(
+    visibility: Dict[str, bool],
+    config: Dict[str, Any],
+    changed_keys: Iterable[str],
+) -> Dict[str, bool]:
+    """
+    Re-evaluate (in place) only the parameters affected by changed_keys.
+    
+    Args:
+        visibility: Previously computed visibility map (modified in place)
+        config: Current parameter values
+        changed_keys: Config keys that changed since visibility was computed
+        
+    Returns:
+        The updated visibility map
+    """
+    for key in changed_keys:
+        for name in VISIBILITY_DEPS.get(key, ()):
+            visibility[name] = PARAMETERS[name].is_visible(config)
+    
+    for name in DYNAMIC_VISIBILITY:
+        visibility[name] = PARAMETERS[name].is_visible(config)
+    
+    return visibility
+
+
+def get_visibility(
+    config: Dict[str, Any],
+    state: MutableMapping[str, Any],
+    changed_keys: Optional[Iterable[str]] = None,
+) -> Dict[str, bool]:
+    """
+    Session-cached visibility map for the current config.
+    
+    Args:
+        config: Current parameter values
+        state: Where the cache lives, normally st.session_state
+        changed_keys: Keys known to have changed since the last call; if None
+            they are detected by comparing against the cached inputs
+            
+    Returns:
+        Dictionary mapping parameter names to visibility
+        
+    Example:
+        >>> visibility = get_visibility(config, st.session_state)
+        >>> if visibility["NO_ACCESS_POOL"]:
+        ...     PARAMETERS["NO_ACCESS_POOL"].to_streamlit_widget()
+    """
+    visibility = state.get(VISIBILITY_STATE_KEY)
+    
+    if visibility is None:
+        visibility = compute_visibility(config)
+    else:
+        if changed_keys is None:
+            changed_keys = changed_visibility_inputs(state.get(VISIBILITY_INPUTS_KEY, {}), config)
+        update_visibility(visibility, config, changed_keys)
+    
+    state[VISIBILITY_STATE_KEY] = visibility
+    state[VISIBILITY_INPUTS_KEY] = {key: config.get(key) for key in VISIBILITY_DEPS}
+    return visibility